@@ -0,0 +1,282 @@
+import asyncio
+import logging
+import math
+import time
+from collections import OrderedDict, deque
+from typing import Optional
+
+import orjson
+
+from app.core.config import settings
+from app.core.security import is_admin_token
+
+logger = logging.getLogger(__name__)
+
+
+class Shed(Exception):
+    """대기열이 가득 차거나 대기 시간을 넘겨 요청을 거절 (429: 한 클라이언트의 과도한 요청 / 503: 서버 과부하)"""
+
+    def __init__(self, status_code: int, retry_after: int, reason: str):
+        super().__init__(reason)
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self.reason = reason
+
+
+class FairQueue:
+    """클라이언트별 대기열을 라운드 로빈으로 꺼내는 큐 (한 클라이언트가 대기열을 독차지해도 다른 클라이언트 순서가 밀리지 않음)"""
+
+    def __init__(self):
+        self._clients: OrderedDict[str, deque] = OrderedDict()
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def waiting(self, client: str) -> int:
+        waiters = self._clients.get(client)
+        return len(waiters) if waiters else 0
+
+    def push(self, client: str, waiter: asyncio.Future):
+        self._clients.setdefault(client, deque()).append(waiter)
+        self.size += 1
+
+    def pop(self) -> Optional[asyncio.Future]:
+        while self._clients:
+            client, waiters = self._clients.popitem(last=False)
+            waiter = waiters.popleft()
+            self.size -= 1
+            if waiters:
+                self._clients[client] = waiters  # 다음 차례는 맨 뒤로
+            if not waiter.done():
+                return waiter
+        return None
+
+    def remove(self, client: str, waiter: asyncio.Future):
+        waiters = self._clients.get(client)
+        if waiters and waiter in waiters:
+            waiters.remove(waiter)
+            self.size -= 1
+            if not waiters:
+                del self._clients[client]
+
+
+class Limiter:
+    """
+    라우트 그룹 하나의 동시 실행 수 제한과 대기열.
+    - 동시 실행이 limit 에 도달하면 대기열(max_queue)에서 기다리고, 대기열이 차면 즉시 503
+    - 한 클라이언트가 client_queue 개 넘게 기다리면 429 (다른 클라이언트 몫을 침범하지 않게)
+    - priority 요청(저장된 결과 조회 등 가벼운 요청)은 먼저 깨우고, reserve 만큼 limit 을 넘어 실행 가능
+    """
+
+    def __init__(self, name: str, limit: int, max_queue: int, client_queue: int, reserve: int = 0, max_wait: float = 10.0):
+        self.name = name
+        self.limit = limit
+        self.max_queue = max_queue
+        self.client_queue = client_queue
+        self.reserve = reserve
+        self.max_wait = max_wait
+        self.active = 0
+        self._priority = FairQueue()
+        self._normal = FairQueue()
+
+        self.admitted = 0
+        self.queued_total = 0
+        self.shed: dict[str, int] = {"429": 0, "503": 0, "timeout": 0}
+        self.peak_queue = 0
+        # 지수 이동 평균 (Retry-After 추정 및 통계용)
+        self.avg_wait = 0.0
+        self.avg_service = 0.0
+
+    @property
+    def queued(self) -> int:
+        return len(self._priority) + len(self._normal)
+
+    def _capacity(self, priority: bool) -> int:
+        return self.limit + (self.reserve if priority else 0)
+
+    def retry_after(self) -> int:
+        """현재 대기열이 빠지는 데 걸릴 예상 시간(초)"""
+        service = self.avg_service or 1.0
+        return max(1, min(60, math.ceil((self.queued + 1) * service / max(self.limit, 1))))
+
+    async def acquire(self, client: str, priority: bool = False) -> float:
+        """실행 슬롯을 얻을 때까지 기다리고 대기 시간(초)을 반환합니다. 거절 시 Shed 발생."""
+        lane = self._priority if priority else self._normal
+        # 앞서 기다리는 요청이 없을 때만 바로 실행 (우선 요청은 일반 대기열을 앞지름)
+        ahead = len(self._priority) if priority else self.queued
+        if not ahead and self.active < self._capacity(priority):
+            self.active += 1
+            self.admitted += 1
+            return 0.0
+
+        if self.queued >= self.max_queue:
+            self.shed["503"] += 1
+            raise Shed(503, self.retry_after(), f"{self.name} queue is full")
+        if lane.waiting(client) >= self.client_queue:
+            self.shed["429"] += 1
+            raise Shed(429, self.retry_after(), f"Too many queued {self.name} requests from this client")
+
+        waiter = asyncio.get_running_loop().create_future()
+        lane.push(client, waiter)
+        self.queued_total += 1
+        self.peak_queue = max(self.peak_queue, self.queued)
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(waiter, self.max_wait)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # 슬롯을 넘겨받은 직후 취소/타임아웃된 경우 슬롯 반납
+                self.release(0.0)
+            else:
+                lane.remove(client, waiter)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            self.shed["timeout"] += 1
+            raise Shed(503, self.retry_after(), f"Timed out waiting for {self.name} capacity") from None
+
+        waited = time.perf_counter() - started
+        self.avg_wait = 0.9 * self.avg_wait + 0.1 * waited
+        self.admitted += 1
+        return waited
+
+    def release(self, service_time: float):
+        self.active -= 1
+        if service_time:
+            self.avg_service = 0.9 * self.avg_service + 0.1 * service_time if self.avg_service else service_time
+        self._wake()
+
+    def _wake(self):
+        # 빈 슬롯을 우선 대기열부터 넘겨줌 (active 는 넘겨줄 때 미리 올림)
+        while self.active < self._capacity(True) and len(self._priority):
+            waiter = self._priority.pop()
+            if waiter is None:
+                break
+            self.active += 1
+            waiter.set_result(None)
+        while self.active < self.limit and len(self._normal):
+            waiter = self._normal.pop()
+            if waiter is None:
+                break
+            self.active += 1
+            waiter.set_result(None)
+
+    def stats(self) -> dict:
+        return {
+            "limit": self.limit,
+            "priority_reserve": self.reserve,
+            "active": self.active,
+            "queued": {"priority": len(self._priority), "normal": len(self._normal)},
+            "max_queue": self.max_queue,
+            "peak_queue": self.peak_queue,
+            "admitted": self.admitted,
+            "queued_total": self.queued_total,
+            "shed": dict(self.shed),
+            "avg_wait_ms": round(self.avg_wait * 1000, 2),
+            "avg_service_ms": round(self.avg_service * 1000, 2),
+            "retry_after": self.retry_after(),
+        }
+
+
+# (메서드, 경로 접두어, Limiter 이름, 우선 처리 여부). 먼저 맞는 규칙 적용
+ADMISSION_RULES = [
+    ("GET", "/analyze/", "analyze", True),  # 저장된 분석 결과 조회 (GitHub 호출 없음)
+    ("POST", "/analyze", "analyze", False),  # /analyze, /analyze/batch
+    ("GET", "/repos/", "repos", False),
+]
+
+limiters = {
+    "analyze": Limiter(
+        "analyze",
+        settings.ADMISSION_ANALYZE_CONCURRENCY,
+        settings.ADMISSION_ANALYZE_QUEUE,
+        settings.ADMISSION_CLIENT_QUEUE,
+        reserve=settings.ADMISSION_PRIORITY_RESERVE,
+        max_wait=settings.ADMISSION_MAX_WAIT_SECONDS,
+    ),
+    "repos": Limiter(
+        "repos",
+        settings.ADMISSION_REPOS_CONCURRENCY,
+        settings.ADMISSION_REPOS_QUEUE,
+        settings.ADMISSION_CLIENT_QUEUE,
+        max_wait=settings.ADMISSION_MAX_WAIT_SECONDS,
+    ),
+}
+
+
+def get_admission_stats() -> dict:
+    return {"enabled": settings.ADMISSION_ENABLED, "limiters": {name: limiter.stats() for name, limiter in limiters.items()}}
+
+
+def _match(scope) -> Optional[tuple[Limiter, bool]]:
+    method, path = scope["method"], scope["path"]
+    for rule_method, prefix, name, priority in ADMISSION_RULES:
+        if method == rule_method and path.startswith(prefix):
+            return limiters[name], priority
+    return None
+
+
+def _client_key(scope) -> str:
+    """
+    요청을 보낸 클라이언트 구분 키. 검증되지 않은 값(Authorization 헤더 등)을 쓰면 요청마다 값을 바꿔
+    클라이언트별 대기열 제한을 피할 수 있으므로, 검증된 관리자 토큰이 아니면 접속 IP 를 사용합니다.
+    프록시 뒤라면 ADMISSION_TRUST_PROXY=true 로 X-Forwarded-For 의 마지막 값(프록시가 직접 붙인 접속 IP) 사용
+    (앞쪽 값은 클라이언트가 임의로 보낼 수 있음)
+    """
+    forwarded = []
+    for key, value in scope["headers"]:
+        if key == b"x-admin-token" and is_admin_token(value.decode("latin-1")):
+            return "admin"
+        if key == b"x-forwarded-for":
+            forwarded.append(value.decode("latin-1"))
+    if forwarded and settings.ADMISSION_TRUST_PROXY:
+        hop = ",".join(forwarded).rsplit(",", 1)[-1].strip()
+        if hop:
+            return "ip:" + hop
+    client = scope.get("client")
+    return "ip:" + (client[0] if client else "unknown")
+
+
+async def _send_shed(send, shed: Shed):
+    body = orjson.dumps({"detail": shed.reason})
+    await send({
+        "type": "http.response.start",
+        "status": shed.status_code,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("ascii")),
+            (b"retry-after", str(shed.retry_after).encode("ascii")),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+class AdmissionMiddleware:
+    """
+    비싼 엔드포인트(/analyze, /repos/{username})의 동시 실행 수를 제한하고,
+    대기열이 넘치면 GitHub/DB 에 부하를 더하기 전에 Retry-After 와 함께 바로 429/503 으로 거절합니다.
+    (순수 ASGI 미들웨어라 스트리밍 응답이 끝날 때까지 슬롯을 점유)
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        matched = _match(scope) if scope["type"] == "http" and settings.ADMISSION_ENABLED else None
+        if matched is None:
+            await self.app(scope, receive, send)
+            return
+
+        limiter, priority = matched
+        try:
+            await limiter.acquire(_client_key(scope), priority)
+        except Shed as shed:
+            logger.warning(f"Shed {scope['method']} {scope['path']} ({shed.status_code}): {shed.reason}")
+            await _send_shed(send, shed)
+            return
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release(time.perf_counter() - started)
@@ -0,0 +1,172 @@
+import asyncio
+import base64
+import gzip
+import hashlib
+import logging
+import os
+import time
+from collections import defaultdict
+from urllib.parse import urlencode
+
+import httpx
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# 카세트에 보존할 응답 헤더 (캐시 검증, Rate Limit, 페이지네이션 재현용)
+RECORDED_HEADERS = (
+    "content-type",
+    "etag",
+    "last-modified",
+    "link",
+    "x-ratelimit-limit",
+    "x-ratelimit-remaining",
+    "x-ratelimit-reset",
+    "x-ratelimit-used",
+    "x-ratelimit-resource",
+    "retry-after",
+)
+
+
+def request_key(request: httpx.Request) -> str:
+    """
+    요청을 카세트 키로 변환합니다.
+    인증 헤더는 제외하여 토큰이 달라도 같은 녹화본을 재생할 수 있게 합니다.
+    """
+    query = urlencode(sorted(request.url.params.multi_items()))
+    parts = [request.method, f"{request.url.scheme}://{request.url.host}{request.url.path}", query]
+    if request.method not in ("GET", "HEAD"):
+        parts.append(hashlib.sha1(request.content).hexdigest())
+    return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+class CassetteStore:
+    """gzip으로 압축된 JSON Lines 파일에 응답을 녹화/로드합니다."""
+
+    def __init__(self, path: str, flush_every: int = 50):
+        self.path = path
+        self.flush_every = flush_every
+        self._pending: list[bytes] = []
+        # 파일 쓰기는 스레드에서 수행 (배치 순서대로 쓰도록 Lock으로 직렬화)
+        self._write_lock = asyncio.Lock()
+        self._writes: set[asyncio.Task] = set()
+
+    def load(self) -> dict[str, list[dict]]:
+        entries = defaultdict(list)
+        if not os.path.exists(self.path):
+            logger.warning(f"Cassette not found: {self.path}")
+            return entries
+        with gzip.open(self.path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    entry = orjson.loads(line)
+                    entries[entry["key"]].append(entry)
+        return entries
+
+    def append(self, entry: dict):
+        self._pending.append(orjson.dumps(entry))
+        if len(self._pending) >= self.flush_every:
+            # gzip 압축/파일 I/O가 이벤트 루프를 막지 않도록 백그라운드 스레드에서 기록
+            task = asyncio.get_running_loop().create_task(self._write(self._take()))
+            self._writes.add(task)
+            task.add_done_callback(self._writes.discard)
+
+    async def flush(self):
+        """남은 기록을 쓰고, 진행 중인 쓰기가 끝날 때까지 기다립니다. (종료 시 호출)"""
+        if self._pending:
+            await self._write(self._take())
+        if self._writes:
+            await asyncio.gather(*self._writes, return_exceptions=True)
+
+    def _take(self) -> list[bytes]:
+        batch, self._pending = self._pending, []
+        return batch
+
+    async def _write(self, batch: list[bytes]):
+        async with self._write_lock:
+            try:
+                await asyncio.to_thread(self._write_file, batch)
+            except OSError:
+                logger.exception(f"Failed to write cassette: {self.path}")
+
+    def _write_file(self, batch: list[bytes]):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        # gzip은 멤버 단위 이어쓰기를 지원하므로 배치마다 append
+        with gzip.open(self.path, "ab") as f:
+            f.write(b"\n".join(batch) + b"\n")
+
+
+def _encode_body(body: bytes) -> dict:
+    try:
+        return {"body": body.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"body_b64": base64.b64encode(body).decode("ascii")}
+
+
+def _decode_body(entry: dict) -> bytes:
+    if "body_b64" in entry:
+        return base64.b64decode(entry["body_b64"])
+    return entry.get("body", "").encode("utf-8")
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """실제 GitHub 응답을 그대로 전달하면서 카세트에 기록합니다."""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, store: CassetteStore):
+        self.inner = inner
+        self.store = store
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        response = await self.inner.handle_async_request(request)
+        # 압축이 풀린 본문을 저장하고, 같은 본문으로 응답을 다시 구성
+        body = await httpx.Response(
+            response.status_code, headers=response.headers, stream=response.stream, request=request
+        ).aread()
+        latency = time.perf_counter() - started
+
+        headers = {k: v for k, v in response.headers.items() if k.lower() in RECORDED_HEADERS}
+        self.store.append({
+            "key": request_key(request),
+            "method": request.method,
+            "url": str(request.url),
+            "status": response.status_code,
+            "headers": headers,
+            "latency": round(latency, 4),
+            **_encode_body(body),
+        })
+        return httpx.Response(response.status_code, headers=headers, content=body, request=request)
+
+    async def aclose(self):
+        await self.store.flush()
+        await self.inner.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """
+    카세트에 녹화된 응답을 재생합니다.
+    - speed=0: 지연 없이 즉시 응답
+    - speed>0: 녹화된 지연 / speed 만큼 대기 (1.0 = 실제 속도)
+    같은 키가 여러 번 녹화되었으면 순서대로 재생하고, 마지막 응답은 반복합니다.
+    """
+
+    def __init__(self, store: CassetteStore, speed: float = 0.0):
+        self.entries = store.load()
+        self.speed = speed
+        self._cursor: dict[str, int] = defaultdict(int)
+        logger.info(f"Cassette loaded: {sum(len(v) for v in self.entries.values())} responses from {store.path}")
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = request_key(request)
+        recorded = self.entries.get(key)
+        if not recorded:
+            raise httpx.ConnectError(f"No recorded response for {request.method} {request.url}", request=request)
+
+        index = min(self._cursor[key], len(recorded) - 1)
+        self._cursor[key] += 1
+        entry = recorded[index]
+
+        if self.speed > 0:
+            await asyncio.sleep(entry.get("latency", 0) / self.speed)
+
+        return httpx.Response(entry["status"], headers=entry["headers"], content=_decode_body(entry), request=request)
@@ -26,6 +26,86 @@ class Settings:
     GITHUB_CLIENT_SECRET: str = os.getenv("GITHUB_CLIENT_SECRET", "")
     FRONTEND_URL: str = os.getenv("FRONTEND_URL", "http://localhost:3000")
     DATABASE_URL: str = os.getenv("DATABASE_URL")
+    GITHUB_WEBHOOK_SECRET: str = os.getenv("GITHUB_WEBHOOK_SECRET", "")
+
+    # 응답 직렬화/압축 설정 (이 크기(bytes) 이상일 때만 gzip 압축)
+    RESPONSE_COMPRESSION_MIN_SIZE: int = int(os.getenv("RESPONSE_COMPRESSION_MIN_SIZE", "1024"))
+    RESPONSE_COMPRESSION_LEVEL: int = int(os.getenv("RESPONSE_COMPRESSION_LEVEL", "6"))
+
+    # GitHub 통신 녹화/재생 설정
+    # live: 실제 호출 / record: 실제 호출 + 카세트 저장 / replay: 카세트에서만 응답
+    GITHUB_TRANSPORT_MODE: str = os.getenv("GITHUB_TRANSPORT_MODE", "live")
+    GITHUB_CASSETTE_PATH: str = os.getenv(
+        "GITHUB_CASSETTE_PATH", str(BASE_DIR / "data" / "cassettes" / "github.jsonl.gz")
+    )
+    # 재생 속도 배율: 1.0 = 녹화된 지연 그대로, 10 = 10배 가속, 0 = 지연 없음
+    GITHUB_REPLAY_SPEED: float = float(os.getenv("GITHUB_REPLAY_SPEED", "0"))
+
+    # GitHub 호출 타임아웃/서킷 브레이커/헤징 설정
+    GITHUB_TIMEOUT_SECONDS: float = float(os.getenv("GITHUB_TIMEOUT_SECONDS", "10"))
+    GITHUB_CIRCUIT_FAILURE_THRESHOLD: int = int(os.getenv("GITHUB_CIRCUIT_FAILURE_THRESHOLD", "5"))
+    GITHUB_CIRCUIT_RESET_SECONDS: float = float(os.getenv("GITHUB_CIRCUIT_RESET_SECONDS", "30"))
+    GITHUB_HEDGE_DELAY_MS: float = float(os.getenv("GITHUB_HEDGE_DELAY_MS", "0")) # 0 = 헤징 사용 안 함
+
+    # 분석 요청 시간 예산 (초과 시 완료된 레포만으로 점수 계산, 나머지는 백그라운드 처리)
+    ANALYZE_DEADLINE_SECONDS: float = float(os.getenv("ANALYZE_DEADLINE_SECONDS", "8"))
+
+    # 다중 유저 일괄 분석 (/analyze/batch): 요청당 최대 유저 수, 전체 레포 동시 조회 수
+    BATCH_ANALYZE_MAX_USERS: int = int(os.getenv("BATCH_ANALYZE_MAX_USERS", "50"))
+    BATCH_ANALYZE_CONCURRENCY: int = int(os.getenv("BATCH_ANALYZE_CONCURRENCY", "8"))
+
+    # 커밋 메시지 분류기: keyword(부분 문자열 매칭) / ngram(실험적, 해싱 n-gram 선형 모델)
+    # ngram 모델은 저장소에 포함되어 있지 않으므로 scripts/train_commit_classifier.py 로 먼저 학습 (없으면 keyword 로 대체)
+    COMMIT_CLASSIFIER: str = os.getenv("COMMIT_CLASSIFIER", "keyword")
+    COMMIT_CLASSIFIER_MODEL: str = os.getenv(
+        "COMMIT_CLASSIFIER_MODEL", str(BASE_DIR / "data" / "models" / "commit_ngram.bin")
+    )
+
+    # 분석할 커밋 범위
+    # author: 본인이 작성한 커밋만 (GitHub author= 필터, 공유/조직 레포에서 전송량과 분류 작업이 크게 줄어듦)
+    # coauthor: 전체 커밋을 받되 본인 작성 + Co-authored-by 로 참여한 커밋만 집계 / all: 레포의 모든 커밋 (기존 방식)
+    COMMIT_AUTHOR_SCOPE: str = os.getenv("COMMIT_AUTHOR_SCOPE", "author")
+
+    # 커밋 응답을 스트리밍으로 읽으며 message/date만 추출 (전체 JSON 객체를 만들지 않음, 메모리 절약)
+    # 청크마다 스레드 풀을 오가므로 작은 응답은 기본 방식(전체 수신 후 오프로드 파싱)이 더 빠름
+    COMMIT_FETCH_STREAMING: bool = os.getenv("COMMIT_FETCH_STREAMING", "false").lower() == "true"
+
+    # 커밋 파싱/분류 오프로드 설정 (스트리밍 사용 시에는 청크 추출에 스레드 풀만 사용)
+    # auto: 응답 크기에 따라 스레드/프로세스 풀 선택 / thread / process / inline(이벤트 루프에서 직접)
+    COMMIT_PARSE_EXECUTOR: str = os.getenv("COMMIT_PARSE_EXECUTOR", "auto")
+    COMMIT_PARSE_PROCESS_THRESHOLD: int = int(os.getenv("COMMIT_PARSE_PROCESS_THRESHOLD", "262144")) # bytes
+    COMMIT_PARSE_WORKERS: int = int(os.getenv("COMMIT_PARSE_WORKERS", "2"))
+    COMMIT_PARSE_BATCH_SIZE: int = int(os.getenv("COMMIT_PARSE_BATCH_SIZE", "8"))
+    COMMIT_PARSE_BATCH_WINDOW_MS: float = float(os.getenv("COMMIT_PARSE_BATCH_WINDOW_MS", "5"))
+
+    # 인기 유저 백그라운드 갱신 스케줄러
+    SCHEDULER_ENABLED: bool = os.getenv("SCHEDULER_ENABLED", "false").lower() == "true"
+    SCHEDULER_INTERVAL_SECONDS: float = float(os.getenv("SCHEDULER_INTERVAL_SECONDS", "60"))
+    SCHEDULER_RATE_SHARE: float = float(os.getenv("SCHEDULER_RATE_SHARE", "0.2")) # GitHub Rate Limit 중 스케줄러가 쓸 수 있는 비율
+    SCHEDULER_MIN_STALENESS_HOURS: float = float(os.getenv("SCHEDULER_MIN_STALENESS_HOURS", "6"))
+    SCHEDULER_MAX_REFRESH_PER_TICK: int = int(os.getenv("SCHEDULER_MAX_REFRESH_PER_TICK", "3"))
+    SCHEDULER_VIEW_FLUSH_SECONDS: float = float(os.getenv("SCHEDULER_VIEW_FLUSH_SECONDS", "30")) # 조회 수를 모아서 DB에 반영하는 주기
+
+    # 비싼 엔드포인트 동시 실행 제한 (/analyze, /repos/{username}): 초과분은 대기열에서 기다리고, 대기열이 차면 429/503 + Retry-After
+    ADMISSION_ENABLED: bool = os.getenv("ADMISSION_ENABLED", "true").lower() == "true"
+    ADMISSION_ANALYZE_CONCURRENCY: int = int(os.getenv("ADMISSION_ANALYZE_CONCURRENCY", "8"))
+    ADMISSION_ANALYZE_QUEUE: int = int(os.getenv("ADMISSION_ANALYZE_QUEUE", "32"))
+    ADMISSION_REPOS_CONCURRENCY: int = int(os.getenv("ADMISSION_REPOS_CONCURRENCY", "16"))
+    ADMISSION_REPOS_QUEUE: int = int(os.getenv("ADMISSION_REPOS_QUEUE", "64"))
+    ADMISSION_PRIORITY_RESERVE: int = int(os.getenv("ADMISSION_PRIORITY_RESERVE", "4")) # 저장된 결과 조회가 추가로 쓸 수 있는 슬롯
+    ADMISSION_CLIENT_QUEUE: int = int(os.getenv("ADMISSION_CLIENT_QUEUE", "4")) # 클라이언트 하나가 대기열에 둘 수 있는 요청 수
+    ADMISSION_MAX_WAIT_SECONDS: float = float(os.getenv("ADMISSION_MAX_WAIT_SECONDS", "10"))
+    ADMISSION_TRUST_PROXY: bool = os.getenv("ADMISSION_TRUST_PROXY", "false").lower() == "true" # 프록시 뒤에서 X-Forwarded-For 의 마지막 값(프록시가 붙인 접속 IP)으로 클라이언트 구분
+
+    # 관리자 API 접근 토큰 (X-Admin-Token 헤더)
+    ADMIN_TOKEN: str = os.getenv("ADMIN_TOKEN", "")
+
+    # 요청 단위 프로파일링: X-Profile: 1 헤더(또는 ?profile=1) + 관리자 토큰이 있는 요청만 기록
+    # SAMPLE_RATE > 0 이면 PATH_PREFIX 요청 중 해당 비율을 자동으로 기록
+    PROFILING_SAMPLE_RATE: float = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+    PROFILING_PATH_PREFIX: str = os.getenv("PROFILING_PATH_PREFIX", "/analyze")
+    PROFILING_INTERVAL_MS: float = float(os.getenv("PROFILING_INTERVAL_MS", "5")) # 스택 샘플링 주기
+    PROFILING_BUFFER_SIZE: int = int(os.getenv("PROFILING_BUFFER_SIZE", "20")) # 보관할 최근 프로파일 수
     
     # 공통 헤더
     @property
@@ -0,0 +1,109 @@
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Optional
+
+import httpx
+
+from app.core.config import settings
+from app.core.cassette import CassetteStore, RecordingTransport, ReplayTransport
+from app.core.resilience import CircuitBreakerTransport
+
+logger = logging.getLogger(__name__)
+
+# 서버 전체에서 공유하는 GitHub 클라이언트 (커넥션 풀 재사용)
+_client: Optional[httpx.AsyncClient] = None
+_transport: Optional[CircuitBreakerTransport] = None
+
+
+class RateLimitState:
+    """GitHub 응답 헤더에서 읽은 core Rate Limit 현황"""
+
+    def __init__(self):
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+
+    def update(self, headers: httpx.Headers):
+        if "x-ratelimit-remaining" not in headers:
+            return
+        if headers.get("x-ratelimit-resource", "core") != "core":
+            return
+        self.limit = int(headers.get("x-ratelimit-limit", self.limit or 0))
+        self.remaining = int(headers["x-ratelimit-remaining"])
+        self.reset_at = float(headers.get("x-ratelimit-reset", 0))
+
+    def available(self) -> Optional[int]:
+        """남은 호출 수 (리셋 시각이 지났으면 한도 전체, 모르면 None)"""
+        if self.remaining is None:
+            return None
+        if self.reset_at and time.time() >= self.reset_at:
+            return self.limit
+        return self.remaining
+
+    def stats(self) -> dict:
+        return {"limit": self.limit, "remaining": self.available(), "reset_at": self.reset_at}
+
+
+rate_limit = RateLimitState()
+
+
+async def _track_rate_limit(response: httpx.Response):
+    rate_limit.update(response.headers)
+
+
+def build_transport() -> httpx.AsyncBaseTransport:
+    """GITHUB_TRANSPORT_MODE 설정에 따라 실제/녹화/재생 트랜스포트를 구성합니다."""
+    return CircuitBreakerTransport(
+        _build_base_transport(),
+        failure_threshold=settings.GITHUB_CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout=settings.GITHUB_CIRCUIT_RESET_SECONDS,
+    )
+
+
+def _build_base_transport() -> httpx.AsyncBaseTransport:
+    mode = settings.GITHUB_TRANSPORT_MODE
+    if mode == "replay":
+        return ReplayTransport(CassetteStore(settings.GITHUB_CASSETTE_PATH), speed=settings.GITHUB_REPLAY_SPEED)
+
+    transport = httpx.AsyncHTTPTransport()
+    if mode == "record":
+        return RecordingTransport(transport, CassetteStore(settings.GITHUB_CASSETTE_PATH))
+    if mode != "live":
+        logger.warning(f"Unknown GITHUB_TRANSPORT_MODE '{mode}', falling back to live")
+    return transport
+
+
+def get_github_client() -> httpx.AsyncClient:
+    """공유 클라이언트를 반환합니다. (lifespan 밖의 스크립트에서는 최초 호출 시 생성)"""
+    global _client, _transport
+    if _client is None or _client.is_closed:
+        logger.info(f"GitHub client initialized (mode: {settings.GITHUB_TRANSPORT_MODE})")
+        _transport = build_transport()
+        _client = httpx.AsyncClient(
+            transport=_transport,
+            event_hooks={"response": [_track_rate_limit]},
+            timeout=httpx.Timeout(settings.GITHUB_TIMEOUT_SECONDS, connect=min(5.0, settings.GITHUB_TIMEOUT_SECONDS)),
+        )
+    return _client
+
+
+def get_circuit_stats() -> dict:
+    """호스트별 서킷 브레이커 상태"""
+    return _transport.stats() if _transport is not None else {}
+
+
+async def close_github_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+@asynccontextmanager
+async def github_client_session():
+    """스크립트용: 블록이 끝나면 공유 클라이언트를 닫고 녹화본을 저장합니다."""
+    try:
+        yield get_github_client()
+    finally:
+        await close_github_client()
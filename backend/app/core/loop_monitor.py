@@ -0,0 +1,53 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LoopLagMonitor:
+    """
+    이벤트 루프 지연(lag)을 측정합니다.
+    interval 마다 깨어나도록 예약하고, 실제로 깨어난 시각과의 차이를 기록합니다.
+    루프를 막는 동기 작업(JSON 파싱 등)이 있으면 이 값이 커집니다.
+    """
+
+    def __init__(self, interval: float = 0.05, window: int = 1200):
+        self.interval = interval
+        self.samples: deque[float] = deque(maxlen=window)
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self):
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, time.perf_counter() - started - self.interval))
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> dict:
+        if not self.samples:
+            return {"samples": 0, "mean_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+        ordered = sorted(self.samples)
+        return {
+            "samples": len(ordered),
+            "mean_ms": round(sum(ordered) / len(ordered) * 1000, 2),
+            "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000, 2),
+            "max_ms": round(ordered[-1] * 1000, 2),
+        }
+
+
+loop_monitor = LoopLagMonitor()
@@ -0,0 +1,279 @@
+import logging
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Optional
+from urllib.parse import parse_qs
+
+from app.core.config import settings
+from app.core.security import is_admin_token
+
+logger = logging.getLogger(__name__)
+
+# 스택 최대 깊이 (너무 깊은 재귀 스택은 잘라냄)
+MAX_STACK_DEPTH = 64
+# 이벤트 루프가 I/O(GitHub/DB 응답)를 기다리는 중인 샘플
+IO_WAIT_FRAME = "[io-wait]"
+
+
+class RequestProfile:
+    """요청 하나의 구간별 소요 시간(span)과 스택 샘플"""
+
+    def __init__(self, method: str, path: str):
+        self.id = uuid.uuid4().hex[:12]
+        self.method = method
+        self.path = path
+        self.started_at = datetime.now()
+        self.status_code: Optional[int] = None
+        self.duration_ms: Optional[float] = None
+        # 이름 -> [횟수, 합계(초), 최대(초)] (동시에 실행되는 구간은 합계가 겹침)
+        self.spans: dict[str, list] = {}
+        self.samples: Counter = Counter()
+        self.sample_count = 0  # 샘플링 횟수 (한 번에 여러 스레드의 스택을 기록)
+        self.closed = False
+        self._started = time.perf_counter()
+
+    def add_span(self, name: str, elapsed: float):
+        if self.closed:  # 마감 후 백그라운드로 이어지는 작업은 집계하지 않음
+            return
+        stat = self.spans.get(name)
+        if stat is None:
+            self.spans[name] = [1, elapsed, elapsed]
+        else:
+            stat[0] += 1
+            stat[1] += elapsed
+            stat[2] = max(stat[2], elapsed)
+
+    def add_samples(self, stacks: list[str]):
+        if self.closed:
+            return
+        self.samples.update(stacks)
+        self.sample_count += 1
+
+    def close(self, status_code: Optional[int]):
+        self.status_code = status_code
+        self.duration_ms = round((time.perf_counter() - self._started) * 1000, 2)
+        self.closed = True
+
+    def summary(self) -> dict:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "started_at": self.started_at,
+            "status_code": self.status_code,
+            "duration_ms": self.duration_ms,
+            "sample_count": self.sample_count,
+        }
+
+    def to_dict(self, top: int = 50) -> dict:
+        io_wait = sum(count for stack, count in self.samples.items() if stack.endswith(IO_WAIT_FRAME))
+        return {
+            **self.summary(),
+            "spans": {
+                name: {"count": count, "total_ms": round(total * 1000, 2), "max_ms": round(peak * 1000, 2)}
+                for name, (count, total, peak) in sorted(self.spans.items(), key=lambda item: -item[1][1])
+            },
+            # 이벤트 루프가 I/O 응답을 기다리며 놀고 있던 시간 비율
+            "io_wait_ratio": round(io_wait / self.sample_count, 3) if self.sample_count else 0.0,
+            "top_stacks": [{"stack": stack, "samples": count} for stack, count in self.samples.most_common(top)],
+        }
+
+    def collapsed(self) -> str:
+        """flamegraph.pl / speedscope 에서 바로 열 수 있는 collapsed stack 형식"""
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+
+_current_profile: ContextVar[Optional[RequestProfile]] = ContextVar("current_profile", default=None)
+
+
+class _Span:
+    __slots__ = ("name", "profile", "started")
+
+    def __init__(self, name: str, profile: RequestProfile):
+        self.name = name
+        self.profile = profile
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profile.add_span(self.name, time.perf_counter() - self.started)
+        return False
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def span(name: str):
+    """
+    `with span("github.commits"):` 형태로 구간 시간을 현재 요청의 프로파일에 기록합니다.
+    프로파일링 중이 아닌 요청에서는 ContextVar 조회 한 번뿐인 no-op 입니다. (await를 감싸도 됨)
+    """
+    profile = _current_profile.get()
+    if profile is None:
+        return _NOOP_SPAN
+    return _Span(name, profile)
+
+
+def _frame_name(frame) -> str:
+    return f"{frame.f_globals.get('__name__', '?')}.{frame.f_code.co_qualname}"
+
+
+def _is_idle(leaf: str) -> bool:
+    return leaf.startswith(("selectors.", "threading.", "queue.")) or leaf == "concurrent.futures.thread._worker"
+
+
+class StackSampler:
+    """
+    프로파일링 중인 요청이 있는 동안에만 별도 스레드에서 interval 마다 sys._current_frames()로
+    모든 스레드의 스택을 읽어 collapsed stack 으로 집계합니다.
+    이벤트 루프는 모든 요청이 공유하므로 같은 시간대의 다른 요청 스택도 함께 잡힙니다.
+    (프로세스 풀 워커는 별도 프로세스라 샘플링되지 않음)
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self._profiles: set[RequestProfile] = set()
+        self._lock = threading.Lock()
+        self._stop: Optional[threading.Event] = None
+        self._loop_thread: Optional[int] = None
+
+    def subscribe(self, profile: RequestProfile):
+        with self._lock:
+            self._profiles.add(profile)
+            # 미들웨어(이벤트 루프 스레드)에서 호출되므로 이 스레드의 대기 샘플은 I/O 대기로 집계
+            self._loop_thread = threading.get_ident()
+            if self._stop is None:
+                # 샘플러 스레드마다 종료 신호를 따로 두어, 멈추는 중인 스레드가 새 구독을 받지 않게 함
+                self._stop = threading.Event()
+                threading.Thread(target=self._run, args=(self._stop,), name="stack-sampler", daemon=True).start()
+
+    def unsubscribe(self, profile: RequestProfile):
+        with self._lock:
+            self._profiles.discard(profile)
+            if not self._profiles and self._stop is not None:
+                self._stop.set()
+                self._stop = None
+
+    def _run(self, stop: threading.Event):
+        own = threading.get_ident()
+        while not stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            stacks = []
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own:
+                    continue
+                stack = self._collapse(frame)
+                if _is_idle(stack[-1]):
+                    if thread_id != self._loop_thread:
+                        continue  # 일을 기다리는 워커 스레드는 제외
+                    stack = stack[:1] + [IO_WAIT_FRAME]
+                stacks.append(";".join([names.get(thread_id, str(thread_id)), *stack]))
+
+            with self._lock:
+                profiles = list(self._profiles)
+            for profile in profiles:
+                profile.add_samples(stacks)
+
+    @staticmethod
+    def _collapse(frame) -> list[str]:
+        stack = []
+        while frame is not None and len(stack) < MAX_STACK_DEPTH:
+            stack.append(_frame_name(frame))
+            frame = frame.f_back
+        stack.reverse()
+        return stack
+
+
+class ProfileStore:
+    """최근 프로파일 N개만 보관하는 링 버퍼"""
+
+    def __init__(self, size: int = 20):
+        self.profiles: deque[RequestProfile] = deque(maxlen=size)
+
+    def add(self, profile: RequestProfile):
+        self.profiles.append(profile)
+
+    def get(self, profile_id: str) -> Optional[RequestProfile]:
+        return next((profile for profile in self.profiles if profile.id == profile_id), None)
+
+    def list(self) -> list[dict]:
+        return [profile.summary() for profile in reversed(self.profiles)]
+
+
+profile_store = ProfileStore(settings.PROFILING_BUFFER_SIZE)
+stack_sampler = StackSampler(settings.PROFILING_INTERVAL_MS / 1000)
+
+
+def _header(scope, name: bytes) -> str:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return ""
+
+
+def _wants_profile(scope) -> bool:
+    flag = _header(scope, b"x-profile")
+    query = scope.get("query_string", b"")
+    if not flag and b"profile" in query:
+        flag = parse_qs(query.decode("latin-1")).get("profile", [""])[0]
+    if flag.lower() in ("1", "true"):
+        return is_admin_token(_header(scope, b"x-admin-token"))
+
+    rate = settings.PROFILING_SAMPLE_RATE
+    return rate > 0 and scope["path"].startswith(settings.PROFILING_PATH_PREFIX) and random.random() < rate
+
+
+class ProfilingMiddleware:
+    """
+    관리자 토큰과 함께 X-Profile: 1 (또는 ?profile=1) 을 보낸 요청, 또는 샘플링된 요청만
+    span/스택 샘플을 기록하여 profile_store 에 저장하고 응답에 X-Profile-Id 헤더를 붙입니다.
+    (순수 ASGI 미들웨어라 스트리밍 응답이 끝날 때까지 측정)
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not _wants_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(scope["method"], scope["path"])
+        status_code = None
+
+        async def send_with_profile_id(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = [*message.get("headers", []), (b"x-profile-id", profile.id.encode("ascii"))]
+            await send(message)
+
+        token = _current_profile.set(profile)
+        stack_sampler.subscribe(profile)
+        try:
+            with span("request"):
+                await self.app(scope, receive, send_with_profile_id)
+        finally:
+            stack_sampler.unsubscribe(profile)
+            _current_profile.reset(token)
+            profile.close(status_code)
+            profile_store.add(profile)
+            logger.info(f"Profiled {profile.method} {profile.path}: {profile.duration_ms} ms ({profile.id})")
@@ -0,0 +1,202 @@
+import asyncio
+import logging
+import time
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(httpx.TransportError):
+    """호스트의 서킷이 열려 있어 요청을 보내지 않고 즉시 실패"""
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 failure_threshold 에 도달하면 reset_timeout 동안 요청을 차단(open)합니다.
+    이후 한 번의 시험 요청(half-open)이 성공하면 다시 닫힙니다(closed).
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.open_for = None  # Rate Limit 등으로 차단 시간이 정해진 경우 (None 이면 reset_timeout)
+        self.trial_in_flight = False
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= (self.open_for or self.reset_timeout):
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self.trial_in_flight:
+            self.trial_in_flight = True
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self.open_for = None
+        self.trial_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        self.trial_in_flight = False
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+            self.open_for = None
+
+    def trip(self, seconds: float):
+        """연속 실패 수와 관계없이 seconds 동안 차단합니다. (Rate Limit 초기화 시각까지)"""
+        self.failures += 1
+        self.trial_in_flight = False
+        self.opened_at = time.monotonic()
+        self.open_for = max(seconds, 1.0)
+
+    def stats(self) -> dict:
+        stats = {"state": self.state, "failures": self.failures, "rejected": self.rejected}
+        if self.state == "open":
+            stats["retry_in"] = round(self.opened_at + (self.open_for or self.reset_timeout) - time.monotonic(), 1)
+        return stats
+
+
+def rate_limit_wait(response: httpx.Response):
+    """
+    Rate Limit 응답이면 다시 요청할 수 있을 때까지 남은 시간(초), 아니면 None.
+    GitHub는 Rate Limit 초과를 429 또는 403 + (Retry-After 또는 X-RateLimit-Remaining: 0) 으로 알립니다.
+    (권한 없음 등 일반 403은 None)
+    """
+    if response.status_code not in (403, 429):
+        return None
+    retry_after = response.headers.get("retry-after")
+    if retry_after and retry_after.isdigit():
+        return float(retry_after)
+    reset = response.headers.get("x-ratelimit-reset")
+    if response.headers.get("x-ratelimit-remaining") == "0" and reset and reset.isdigit():
+        return max(int(reset) - time.time(), 0.0)
+    return 0.0 if response.status_code == 429 else None
+
+
+class CircuitBreakerTransport(httpx.AsyncBaseTransport):
+    """
+    호스트별 서킷 브레이커를 적용하는 트랜스포트 (5xx, 네트워크 오류를 실패로 집계)
+    Rate Limit 응답(429, Rate Limit 403)을 받으면 Retry-After/X-RateLimit-Reset 시각까지 바로 차단합니다.
+    """
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.inner = inner
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.breakers: dict[str, CircuitBreaker] = {}
+
+    def _breaker(self, host: str) -> CircuitBreaker:
+        if host not in self.breakers:
+            self.breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+        return self.breakers[host]
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        breaker = self._breaker(request.url.host)
+        if not breaker.allow():
+            raise CircuitOpenError(f"Circuit open for {request.url.host}", request=request)
+
+        try:
+            response = await self.inner.handle_async_request(request)
+        except asyncio.CancelledError:
+            # 헤징 등으로 취소된 요청은 실패로 집계하지 않음
+            breaker.trial_in_flight = False
+            raise
+        except Exception:
+            breaker.record_failure()
+            raise
+
+        wait = rate_limit_wait(response)
+        if wait:
+            logger.warning(f"GitHub rate limited ({response.status_code}), blocking {request.url.host} for {wait:.0f}s")
+            breaker.trip(wait)
+        elif wait is not None or response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    async def aclose(self):
+        await self.inner.aclose()
+
+    def stats(self) -> dict:
+        return {host: breaker.stats() for host, breaker in self.breakers.items()}
+
+
+async def hedged_get(client: httpx.AsyncClient, url: str, hedge_delay: float = 0.0, **kwargs) -> httpx.Response:
+    """
+    hedge_delay 안에 응답이 없으면 같은 GET 요청을 한 번 더 보내고, 먼저 성공한 응답을 사용합니다.
+    (hedge_delay <= 0 이면 일반 요청)
+    """
+    if hedge_delay <= 0:
+        return await client.get(url, **kwargs)
+
+    primary = asyncio.create_task(client.get(url, **kwargs))
+    pending = {primary}
+    try:
+        done, pending = await asyncio.wait(pending, timeout=hedge_delay)
+        if done:
+            return primary.result()
+
+        logger.info(f"Hedging slow request: {url}")
+        pending.add(asyncio.create_task(client.get(url, **kwargs)))
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+        # 둘 다 실패하면 원래 요청의 예외를 전달
+        return primary.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def hedged_stream(client: httpx.AsyncClient, url: str, hedge_delay: float = 0.0, **kwargs) -> httpx.Response:
+    """
+    hedged_get 의 스트리밍 버전. 응답 헤더가 hedge_delay 안에 오지 않으면 한 번 더 요청하고,
+    먼저 헤더가 온 응답의 본문만 읽습니다. (반환된 응답은 호출한 쪽에서 aclose)
+    """
+    def send():
+        return client.send(client.build_request("GET", url, **kwargs), stream=True)
+
+    if hedge_delay <= 0:
+        return await send()
+
+    primary = asyncio.create_task(send())
+    tasks = [primary]
+    result = None
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+        if not done:
+            logger.info(f"Hedging slow request: {url}")
+            tasks.append(asyncio.create_task(send()))
+        pending = set(tasks)
+        while pending and result is None:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            result = next((task.result() for task in done if task.exception() is None), None)
+        if result is None:
+            # 둘 다 실패하면 원래 요청의 예외를 전달
+            result = primary.result()
+        return result
+    finally:
+        # 돌려줄 응답(result)을 제외하고, 끝난 응답은 닫고 진행 중인 요청은 취소
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled() and task.exception() is None and task.result() is not result:
+                await task.result().aclose()
@@ -0,0 +1,114 @@
+from typing import Any, AsyncIterator, Iterable, Optional
+
+import orjson
+import ormsgpack
+from fastapi import Request
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel
+
+# 클라이언트가 Accept 헤더로 요청할 수 있는 바이너리 포맷
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack", "application/vnd.msgpack")
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _default(obj: Any):
+    """orjson/ormsgpack이 기본으로 처리하지 못하는 타입(Pydantic 모델 등) 변환"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not serializable: {type(obj).__name__}")
+
+
+class FastJSONResponse(Response):
+    """orjson 직렬화 응답 (fastapi.responses.ORJSONResponse 와 달리 Pydantic 모델/set 등을 _default 로 처리)"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class MsgPackResponse(Response):
+    media_type = "application/msgpack"
+
+    def render(self, content: Any) -> bytes:
+        return ormsgpack.packb(content, default=_default, option=ormsgpack.OPT_NON_STR_KEYS)
+
+
+def parse_fields(fields: Optional[str]) -> Optional[list[str]]:
+    """`fields=summary,status` 형태의 쿼리 값을 필드 경로 리스트로 변환합니다."""
+    if not fields:
+        return None
+    parsed = [f.strip() for f in fields.split(",") if f.strip()]
+    return parsed or None
+
+
+def project_fields(payload: Any, fields: Optional[Iterable[str]]) -> Any:
+    """
+    응답에서 요청된 필드만 남깁니다.
+    - 점(.)으로 하위 필드 지정 가능: `summary.persona`
+    - 리스트 응답은 각 원소에 동일하게 적용
+    """
+    if not fields:
+        return payload
+
+    if isinstance(payload, list):
+        return [project_fields(item, fields) for item in payload]
+    if isinstance(payload, BaseModel):
+        payload = payload.model_dump()
+    if not isinstance(payload, dict):
+        return payload
+
+    # 최상위 키 -> 하위 경로 목록 (하위 경로가 없으면 전체 포함)
+    tree: dict[str, Optional[list[str]]] = {}
+    for field in fields:
+        head, _, rest = field.partition(".")
+        sub = tree.setdefault(head, [])
+        if sub is not None:
+            if rest:
+                sub.append(rest)
+            else:
+                tree[head] = None
+
+    projected = {}
+    for key, sub_fields in tree.items():
+        if key in payload:
+            projected[key] = project_fields(payload[key], sub_fields)
+    return projected
+
+
+def wants_msgpack(request: Request) -> bool:
+    accept = request.headers.get("accept", "")
+    return any(media_type in accept for media_type in MSGPACK_MEDIA_TYPES)
+
+
+def encode_response(request: Request, payload: Any, fields: Optional[str] = None, status_code: int = 200) -> Response:
+    """
+    Accept 헤더에 따라 응답 포맷을 선택합니다 (msgpack 요청 시 msgpack, 그 외 orjson).
+    압축은 main.py의 GZipMiddleware가 크기 임계값 기준으로 처리합니다.
+    """
+    content = project_fields(payload, parse_fields(fields))
+    response_class = MsgPackResponse if wants_msgpack(request) else FastJSONResponse
+    response = response_class(content=content, status_code=status_code)
+    response.headers["Vary"] = "Accept, Accept-Encoding"
+    return response
+
+
+def ndjson_line(payload: Any) -> bytes:
+    return orjson.dumps(payload, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+
+
+async def _ndjson_body(items: AsyncIterator[Any], fields: Optional[list[str]]) -> AsyncIterator[bytes]:
+    async for item in items:
+        yield ndjson_line(project_fields(item, fields))
+
+
+def stream_ndjson(items: AsyncIterator[Any], fields: Optional[str] = None) -> StreamingResponse:
+    """
+    비동기 이터레이터의 각 항목을 한 줄짜리 JSON(NDJSON)으로 즉시 전송합니다.
+    GZipMiddleware는 스트림을 flush 없이 압축 버퍼에 모아두므로, 줄 단위 전달을 위해 압축을 건너뜁니다.
+    """
+    response = StreamingResponse(_ndjson_body(items, parse_fields(fields)), media_type=NDJSON_MEDIA_TYPE)
+    response.headers["Content-Encoding"] = "identity"
+    return response
@@ -0,0 +1,16 @@
+import hmac
+from typing import Optional
+from fastapi import Header, HTTPException
+from app.core.config import settings
+
+
+def is_admin_token(token: Optional[str]) -> bool:
+    return bool(settings.ADMIN_TOKEN and token and hmac.compare_digest(token, settings.ADMIN_TOKEN))
+
+
+async def require_admin(x_admin_token: str = Header(None)):
+    """관리자 API 접근 확인 (X-Admin-Token 헤더)"""
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=500, detail="ADMIN_TOKEN not configured")
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다.")
@@ -1,8 +1,14 @@
+import logging
+
 from sqlmodel import SQLModel
+from sqlalchemy import inspect, literal, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateColumn
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 DATABASE_URL = settings.DATABASE_URL
 
 # 비동기 엔진 생성
@@ -23,6 +29,30 @@ async def init_db():
         # SQLModel에 정의된 모든 모델을 기반으로 테이블 생성
         # await conn.run_sync(SQLModel.metadata.drop_all) # 초기화가 필요할 때만 사용
         await conn.run_sync(SQLModel.metadata.create_all)
+        # 이미 있는 테이블은 create_all 이 건드리지 않으므로 모델에 추가된 컬럼/인덱스를 채움
+        await conn.run_sync(upgrade_schema)
+
+def upgrade_schema(conn):
+    """
+    기존 테이블에 없는 컬럼을 ALTER TABLE ... ADD COLUMN 으로, 없는 인덱스를 CREATE INDEX 로 추가합니다.
+    현재 DB 구조를 조회해 빠진 것만 만들므로 서버를 시작할 때마다 실행해도 안전합니다. (PostgreSQL/SQLite 공용)
+    NOT NULL 컬럼은 모델의 기본값을 DEFAULT 로 지정하여 기존 행을 채웁니다.
+    """
+    inspector = inspect(conn)
+    for table in SQLModel.metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            ddl = str(CreateColumn(column).compile(dialect=conn.dialect))
+            if column.server_default is None and column.default is not None and column.default.is_scalar:
+                default = literal(column.default.arg, column.type).compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True})
+                ddl += f" DEFAULT {default}"
+            conn.execute(text(f"ALTER TABLE {conn.dialect.identifier_preparer.format_table(table)} ADD COLUMN {ddl}"))
+            logger.info(f"Added column {table.name}.{column.name}")
+
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
 
 # FastAPI Dependency Injection용 함수
 async def get_session():
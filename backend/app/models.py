@@ -1,9 +1,15 @@
 from typing import Optional, List
-from sqlmodel import SQLModel, Field, Relationship
-from datetime import datetime
+from sqlmodel import SQLModel, Field, Relationship, Column, JSON, BigInteger, Index, UniqueConstraint
+from datetime import datetime, date
 
 class User(SQLModel, table=True):
     __tablename__ = "users"
+    __table_args__ = (
+        # 탐색 API: 필터 컬럼 + (점수, id) 정렬 순서 그대로 키셋 페이지네이션
+        Index("ix_users_explore_score", "persona_score", "id"),
+        Index("ix_users_explore_persona", "persona", "persona_score", "id"),
+        Index("ix_users_explore_language", "top_language", "persona_score", "id"),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     github_id: str = Field(unique=True, index=True) # 깃허브 ID (중복불가)
@@ -12,6 +18,18 @@ class User(SQLModel, table=True):
     html_url: Optional[str] = None
     access_token: Optional[str] = None
     
+    persona: Optional[str] = None # 마지막으로 계산된 페르소나
+    needs_rescore: bool = Field(default=False) # 웹훅 등으로 레포 통계가 바뀌어 재계산이 필요한지 여부
+    last_analyzed: Optional[datetime] = None # 마지막 전체 분석 시각
+    persona_score: float = Field(default=0.0) # 페르소나 계산 시 총점
+    top_language: Optional[str] = None # 사용량 1위 언어
+    latest_commit: Optional[datetime] = None # 전체 레포 중 가장 최근 커밋 시각
+    
+    # 조회 통계 (백그라운드 갱신 우선순위 계산용)
+    view_count: int = Field(default=0)
+    last_viewed: Optional[datetime] = None
+    next_refresh_at: Optional[datetime] = Field(default=None, index=True) # 백그라운드 갱신 예정 시각 (None 이면 갱신 대상 아님)
+    
     # 관계 설정
     repositories: List["Repository"] = Relationship(back_populates="owner")
     placements: List["Placement"] = Relationship(back_populates="user")
@@ -32,6 +50,14 @@ class Repository(SQLModel, table=True):
     last_analyzed: Optional[datetime] = Field(default_factory=datetime.now)
     latest_commit: Optional[datetime] = None
     
+    # 카테고리별 커밋 수 (분석 시 덮어쓰고, push 웹훅으로 누적)
+    total_commits: int = Field(default=0)
+    commit_stats: Optional[dict] = Field(default=None, sa_column=Column(JSON))
+    # 주간 활동(RepoActivity)에 반영된 마지막 커밋 시각 (이후 커밋만 누적)
+    activity_until: Optional[datetime] = None
+    # 통계/주간 활동을 집계한 커밋 범위 (COMMIT_AUTHOR_SCOPE, 바뀌면 주간 활동을 다시 채움)
+    commit_scope: Optional[str] = None
+    
     # 관계 설정
     owner: User = Relationship(back_populates="repositories")
     placement: Optional["Placement"] = Relationship(back_populates="repository")
@@ -47,3 +73,67 @@ class Placement(SQLModel, table=True):
     # 관계 설정
     user: User = Relationship(back_populates="placements")
     repository: Repository = Relationship(back_populates="placement")
+
+class RepoLanguage(SQLModel, table=True):
+    """레포지토리별 언어 사용량 (GitHub /languages 응답의 byte 수)"""
+    __tablename__ = "repo_languages"
+    __table_args__ = (UniqueConstraint("repo_id", "language"),)
+    
+    id: Optional[int] = Field(default=None, primary_key=True)
+    repo_id: int = Field(foreign_key="repositories.id", index=True)
+    language: str
+    bytes: int = Field(default=0, sa_type=BigInteger)
+
+class UserLanguageStat(SQLModel, table=True):
+    """유저별 언어 사용량 합계 (레포 언어 변경 시 증분 갱신)"""
+    __tablename__ = "user_language_stats"
+    __table_args__ = (
+        UniqueConstraint("user_id", "language"),
+        Index("ix_user_language_stats_user_bytes", "user_id", "bytes"), # 유저별 top-N 조회용
+    )
+    
+    id: Optional[int] = Field(default=None, primary_key=True)
+    user_id: int = Field(foreign_key="users.id")
+    language: str
+    bytes: int = Field(default=0, sa_type=BigInteger)
+    repo_count: int = Field(default=0) # 이 언어를 사용하는 레포 수
+
+class GlobalLanguageStat(SQLModel, table=True):
+    """전체 언어 사용량 합계 (레포 언어 변경 시 증분 갱신)"""
+    __tablename__ = "global_language_stats"
+    
+    language: str = Field(primary_key=True)
+    bytes: int = Field(default=0, sa_type=BigInteger, index=True)
+    repo_count: int = Field(default=0)
+
+class RepoActivity(SQLModel, table=True):
+    """레포별 주간 커밋 수 (주 시작일(월요일) x 카테고리당 한 행, category="total"은 전체 커밋 수)"""
+    __tablename__ = "repo_activity"
+    __table_args__ = (
+        UniqueConstraint("repo_id", "week", "category"),
+        Index("ix_repo_activity_user_week", "user_id", "week"), # 유저별 기간 롤업용
+    )
+    
+    id: Optional[int] = Field(default=None, primary_key=True)
+    repo_id: int = Field(foreign_key="repositories.id")
+    user_id: int = Field(foreign_key="users.id")
+    week: date
+    category: str
+    commits: int = Field(default=0)
+
+class RepoCommit(SQLModel, table=True):
+    """
+    레포별 최근 커밋 창 (분석이 가져오는 최근 커밋 수만큼 보관).
+    commit_stats/total_commits 는 이 창에서 다시 계산하며, 웹훅 재전송 시 같은 SHA는 건너뜀
+    """
+    __tablename__ = "repo_commits"
+    __table_args__ = (
+        UniqueConstraint("repo_id", "sha"),
+        Index("ix_repo_commits_repo_date", "repo_id", "committed_at"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    repo_id: int = Field(foreign_key="repositories.id")
+    sha: str
+    committed_at: datetime
+    categories: list = Field(default_factory=list, sa_column=Column(JSON))
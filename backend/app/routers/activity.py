@@ -0,0 +1,51 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+from app.database import get_session
+from app.models import User, Repository
+from app.core.responses import encode_response
+from app.services.activity import get_activity
+
+router = APIRouter()
+
+async def _get_user(db: AsyncSession, username: str) -> User:
+    result = await db.execute(select(User).where(User.username == username))
+    db_user = result.scalars().first()
+    if not db_user:
+        raise HTTPException(status_code=404, detail="User not found")
+    return db_user
+
+# 유저 전체 레포의 주간 활동 (GET /activity/{username}?weeks=26)
+@router.get("/{username}")
+async def read_user_activity(
+    username: str,
+    raw_request: Request,
+    weeks: int = Query(26, ge=1, le=156),
+    fields: Optional[str] = None, # 예: fields=sparkline,last_active_week
+    db: AsyncSession = Depends(get_session),
+):
+    db_user = await _get_user(db, username)
+    activity = await get_activity(db, weeks, user_id=db_user.id)
+    return encode_response(raw_request, {"username": username, **activity}, fields)
+
+# 레포별 주간 활동 (GET /activity/{username}/{repo_name})
+@router.get("/{username}/{repo_name}")
+async def read_repo_activity(
+    username: str,
+    repo_name: str,
+    raw_request: Request,
+    weeks: int = Query(26, ge=1, le=156),
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_session),
+):
+    db_user = await _get_user(db, username)
+    result = await db.execute(
+        select(Repository.id).where(Repository.user_id == db_user.id, Repository.name == repo_name)
+    )
+    repo_id = result.scalars().first()
+    if repo_id is None:
+        raise HTTPException(status_code=404, detail="Repository not found")
+
+    activity = await get_activity(db, weeks, repo_id=repo_id)
+    return encode_response(raw_request, {"username": username, "repo": repo_name, **activity}, fields)
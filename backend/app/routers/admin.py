@@ -0,0 +1,62 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from app.core.security import require_admin
+from app.core.loop_monitor import loop_monitor
+from app.core.http import get_circuit_stats
+from app.core.profiling import profile_store
+from app.core.admission import get_admission_stats
+from app.services.offload import commit_parser
+from app.services import github
+from app.services.scheduler import refresh_scheduler
+
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+# 이벤트 루프 지연 통계 (GET /admin/loop-lag)
+@router.get("/loop-lag")
+async def read_loop_lag():
+    return {
+        "loop_lag": loop_monitor.stats(),
+        "commit_parse_executor": commit_parser.mode,
+    }
+
+# GitHub 호출 상태: 호스트별 서킷 브레이커, 마감 이후 진행 중인 분석 수 (GET /admin/github)
+@router.get("/github")
+async def read_github_status():
+    return {
+        "circuit_breakers": get_circuit_stats(),
+        "background_analyses": len(github._background_tasks),
+    }
+
+# 백그라운드 갱신 스케줄러 상태 (GET /admin/scheduler)
+@router.get("/scheduler")
+async def read_scheduler_status():
+    return refresh_scheduler.stats()
+
+# 동시 실행 제한 상태: 라우트 그룹별 실행/대기 수, 거절 수, 평균 대기/처리 시간 (GET /admin/admission)
+@router.get("/admission")
+async def read_admission_status():
+    return get_admission_stats()
+
+# 최근 요청 프로파일 목록 (GET /admin/profiles)
+@router.get("/profiles")
+async def list_profiles():
+    return profile_store.list()
+
+# 프로파일 상세: 구간별 시간 + 상위 스택 (GET /admin/profiles/{profile_id})
+@router.get("/profiles/{profile_id}")
+async def read_profile(profile_id: str, top: int = Query(50, ge=1, le=1000)):
+    profile = profile_store.get(profile_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return profile.to_dict(top)
+
+# collapsed stack 파일 다운로드 (flamegraph.pl, speedscope 등에서 열기)
+@router.get("/profiles/{profile_id}/download")
+async def download_profile(profile_id: str):
+    profile = profile_store.get(profile_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return PlainTextResponse(
+        profile.collapsed(),
+        headers={"Content-Disposition": f'attachment; filename="profile-{profile.id}.collapsed.txt"'},
+    )
@@ -1,11 +1,55 @@
-from fastapi import APIRouter, Depends
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlmodel import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_session
-from app.schemas import AnalyzeRequest
-from app.services.github import analyze_selected_repos # 로직 함수 임포트
+from app.core.config import settings
+from app.schemas import AnalyzeRequest, BatchAnalyzeRequest
+from app.core.responses import encode_response, stream_ndjson
+from app.models import User
+from app.services.github import analyze_selected_repos, get_stored_analysis # 로직 함수 임포트
+from app.services.batch import analyze_batch
+from app.services.scheduler import record_view
 
 router = APIRouter()
 
 @router.post("/") # main에서 prefix="/analyze"를 줄 것이므로 여기는 "/"
-async def perform_analysis(request: AnalyzeRequest, db: AsyncSession = Depends(get_session)):
-    return await analyze_selected_repos(request, db)
\ No newline at end of file
+async def perform_analysis(
+    request: AnalyzeRequest,
+    raw_request: Request,
+    fields: Optional[str] = None, # 예: fields=status,summary (detailed_results 제외)
+    db: AsyncSession = Depends(get_session),
+):
+    result = await analyze_selected_repos(request, db)
+    return encode_response(raw_request, result, fields)
+
+
+# 여러 유저 일괄 분석: 유저별 요약을 끝나는 순서대로 한 줄씩(NDJSON) 전송, 마지막 줄은 저장 결과
+@router.post("/batch")
+async def perform_batch_analysis(
+    request: BatchAnalyzeRequest,
+    fields: Optional[str] = None, # 예: fields=username,status,summary.persona
+):
+    if not request.users:
+        raise HTTPException(status_code=400, detail="No users selected")
+    if len(request.users) > settings.BATCH_ANALYZE_MAX_USERS:
+        raise HTTPException(status_code=400, detail=f"Too many users (max {settings.BATCH_ANALYZE_MAX_USERS})")
+    return stream_ndjson(analyze_batch(request.users), fields)
+
+
+# 저장된 분석 결과 조회 (GitHub 호출 없음, 조회 수는 백그라운드 갱신 우선순위에 반영)
+@router.get("/{username}")
+async def read_analysis(
+    username: str,
+    raw_request: Request,
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_session),
+):
+    result = await db.execute(select(User).where(User.username == username))
+    db_user = result.scalars().first()
+    if not db_user:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    await record_view(db, db_user.id)
+    analysis = await get_stored_analysis(db, db_user)
+    return encode_response(raw_request, analysis, fields)
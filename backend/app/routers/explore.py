@@ -0,0 +1,23 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_session
+from app.core.responses import encode_response
+from app.services.explore import explore_users
+
+router = APIRouter()
+
+# 페르소나/언어/최근 활동으로 유저 탐색, 점수순 (GET /explore?persona=Fixer&language=Python&cursor=...)
+@router.get("/")
+async def read_explore(
+    raw_request: Request,
+    persona: Optional[str] = None, # 예: Fixer, fix, "연구소 돔 (Fixer)"
+    language: Optional[str] = None,
+    active_within_days: Optional[int] = Query(None, ge=1),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None, # 이전 응답의 next_cursor
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_session),
+):
+    page = await explore_users(db, persona, language, active_within_days, limit, cursor)
+    return encode_response(raw_request, page, fields)
@@ -0,0 +1,38 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+from app.database import get_session
+from app.models import User
+from app.core.responses import encode_response
+from app.services.languages import get_user_top_languages, get_global_language_share
+
+router = APIRouter()
+
+# 전체 언어 점유율 (GET /languages/global)
+@router.get("/global")
+async def read_global_languages(
+    raw_request: Request,
+    limit: int = Query(10, ge=1, le=100),
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_session),
+):
+    languages = await get_global_language_share(db, limit)
+    return encode_response(raw_request, languages, fields)
+
+# 유저별 상위 언어 (GET /languages/{username})
+@router.get("/{username}")
+async def read_user_languages(
+    username: str,
+    raw_request: Request,
+    limit: int = Query(3, ge=1, le=100),
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_session),
+):
+    result = await db.execute(select(User).where(User.username == username))
+    db_user = result.scalars().first()
+    if not db_user:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    languages = await get_user_top_languages(db, db_user.id, limit)
+    return encode_response(raw_request, languages, fields)
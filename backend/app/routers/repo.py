@@ -1,11 +1,17 @@
-from fastapi import APIRouter
-from typing import List
+from fastapi import APIRouter, Request
+from typing import List, Optional
 from app.schemas import RepoInfo
+from app.core.responses import encode_response
 from app.services.github import get_user_repositories # 서비스 함수 호출
 
 router = APIRouter()
 
-@router.get("/{username}", response_model=List[RepoInfo])
-async def read_user_repositories(username: str):
+# encode_response가 Response를 직접 반환하므로 response_model 대신 문서용 스키마만 지정 (fields 지정 시 일부 필드만 포함)
+@router.get(
+    "/{username}",
+    responses={200: {"model": List[RepoInfo], "content": {"application/msgpack": {}}}},
+)
+async def read_user_repositories(username: str, raw_request: Request, fields: Optional[str] = None):
     # 로직은 서비스(get_user_repositories)가 다 처리함
-    return await get_user_repositories(username)
\ No newline at end of file
+    repos = await get_user_repositories(username)
+    return encode_response(raw_request, repos, fields)
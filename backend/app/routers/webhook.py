@@ -0,0 +1,36 @@
+import json
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.database import get_session
+from app.services.webhook import verify_signature, apply_push_event
+
+router = APIRouter()
+
+# GitHub push 웹훅 (POST /webhooks/github)
+@router.post("/github")
+async def github_webhook(
+    request: Request,
+    x_github_event: str = Header(None),
+    x_hub_signature_256: str = Header(None),
+    db: AsyncSession = Depends(get_session),
+):
+    if not settings.GITHUB_WEBHOOK_SECRET:
+        raise HTTPException(status_code=500, detail="GITHUB_WEBHOOK_SECRET not configured")
+
+    # 서명 검증은 파싱 전 원본 바이트로 수행해야 함
+    body = await request.body()
+    if not verify_signature(settings.GITHUB_WEBHOOK_SECRET, body, x_hub_signature_256):
+        raise HTTPException(status_code=401, detail="Invalid webhook signature")
+
+    if x_github_event == "ping":
+        return {"status": "pong"}
+    if x_github_event != "push":
+        return {"status": "ignored", "reason": f"unsupported event: {x_github_event}"}
+
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+
+    return await apply_push_event(payload, db)
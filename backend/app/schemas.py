@@ -8,6 +8,10 @@ class AnalyzeRequest(BaseModel):
     selected_repos: List[str]
 
 
+class BatchAnalyzeRequest(BaseModel):
+    users: List[AnalyzeRequest]
+
+
 # Gemini가 뱉어낼 '3가지 관점'의 정해진 형식
 class RepoAnalysisResult(BaseModel):
     repo_name: str = Field(description="분석한 레포지토리 이름")
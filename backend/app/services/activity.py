@@ -0,0 +1,116 @@
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import delete, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.models import Repository, RepoActivity
+from app.services.classifier import KEYWORD_MAP
+
+# 카테고리와 무관한 전체 커밋 수 행
+TOTAL_CATEGORY = "total"
+
+
+def week_start(day: date) -> date:
+    """해당 날짜가 속한 주의 월요일 (UTC 기준)"""
+    return day - timedelta(days=day.weekday())
+
+
+def bucket_commits(commit_activity: list) -> Counter:
+    """[(커밋 시각, 카테고리 목록), ...] -> {(주 시작일, 카테고리): 커밋 수}"""
+    buckets = Counter()
+    for committed_at, categories in commit_activity:
+        week = week_start(committed_at.date())
+        buckets[(week, TOTAL_CATEGORY)] += 1
+        for category in categories:
+            buckets[(week, category)] += 1
+    return buckets
+
+
+async def reset_repo_activity(db: AsyncSession, db_repo: Repository):
+    """레포의 주간 활동을 비웁니다. (집계 범위가 바뀐 경우, 다음 merge_repo_activity 에서 다시 채움)"""
+    await db.execute(delete(RepoActivity).where(RepoActivity.repo_id == db_repo.id))
+    db_repo.activity_until = None
+
+
+async def merge_repo_activity(db: AsyncSession, db_repo: Repository, commit_activity: list) -> int:
+    """
+    activity_until 이후의 커밋만 주간 버킷에 더합니다. (같은 커밋을 다시 가져와도 중복 집계하지 않음)
+    커밋은 호출한 쪽에서 수행하며, 반영한 커밋 수를 반환합니다.
+    """
+    since = db_repo.activity_until
+    new_commits = [
+        (committed_at, categories) for committed_at, categories in commit_activity
+        if committed_at is not None and (since is None or committed_at > since)
+    ]
+    if not new_commits:
+        return 0
+
+    buckets = bucket_commits(new_commits)
+    result = await db.execute(
+        select(RepoActivity).where(
+            RepoActivity.repo_id == db_repo.id,
+            RepoActivity.week.in_({week for week, _ in buckets}),
+        )
+    )
+    existing = {(row.week, row.category): row for row in result.scalars().all()}
+
+    for (week, category), commits in buckets.items():
+        row = existing.get((week, category))
+        if row:
+            # flush 시 UPDATE ... SET commits = commits + n 으로 원자적으로 반영
+            row.commits = RepoActivity.commits + commits
+        else:
+            db.add(RepoActivity(repo_id=db_repo.id, user_id=db_repo.user_id, week=week, category=category, commits=commits))
+
+    db_repo.activity_until = max(committed_at for committed_at, _ in new_commits)
+    return len(new_commits)
+
+
+async def get_activity(
+    db: AsyncSession,
+    weeks: int,
+    user_id: Optional[int] = None,
+    repo_id: Optional[int] = None,
+) -> dict:
+    """
+    최근 weeks 주의 주간 커밋 수를 DB에서 (주, 카테고리) 단위로 합산하여 배열로 반환합니다.
+    - sparkline: 주별 전체 커밋 수
+    - heatmap: 카테고리별 주간 커밋 수 (카테고리 x 주)
+    """
+    filters = []
+    if user_id is not None:
+        filters.append(RepoActivity.user_id == user_id)
+    if repo_id is not None:
+        filters.append(RepoActivity.repo_id == repo_id)
+
+    # 커밋 시각은 UTC 기준으로 저장되므로 이번 주도 UTC 기준
+    end = week_start(datetime.now(timezone.utc).date())
+    start = end - timedelta(weeks=weeks - 1)
+    result = await db.execute(
+        select(RepoActivity.week, RepoActivity.category, func.sum(RepoActivity.commits))
+        .where(*filters, RepoActivity.week >= start, RepoActivity.week <= end)
+        .group_by(RepoActivity.week, RepoActivity.category)
+    )
+
+    series = {category: [0] * weeks for category in (TOTAL_CATEGORY, *KEYWORD_MAP.keys())}
+    for week, category, commits in result.all():
+        if category in series:
+            series[category][(week - start).days // 7] = int(commits)
+
+    # 기간과 무관한 마지막 활동 주 (행성 시각화의 최근성 판단용)
+    last_active_week = await db.scalar(
+        select(func.max(RepoActivity.week)).where(*filters, RepoActivity.category == TOTAL_CATEGORY)
+    )
+
+    sparkline = series.pop(TOTAL_CATEGORY)
+    return {
+        "weeks": [start + timedelta(weeks=i) for i in range(weeks)],
+        "sparkline": sparkline,
+        "heatmap": series,
+        "total_commits": sum(sparkline),
+        "active_weeks": sum(1 for commits in sparkline if commits),
+        "last_active_week": last_active_week,
+    }
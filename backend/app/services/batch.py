@@ -0,0 +1,137 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import AsyncIterator, Optional
+
+from sqlmodel import select
+
+from app.core.config import settings
+from app.core.http import get_github_client
+from app.core.profiling import span
+from app.database import async_session
+from app.models import User, Repository
+from app.schemas import AnalyzeRequest
+from app.services.classifier import CommitAuthor
+from app.services.github import analyze_repo_details, apply_summary, build_summary, save_repo_result
+
+logger = logging.getLogger(__name__)
+
+
+def merge_entries(entries: list[AnalyzeRequest]) -> dict[str, list[str]]:
+    """같은 유저가 여러 번 들어오면 선택한 레포를 순서대로 합칩니다."""
+    selected: dict[str, list[str]] = {}
+    for entry in entries:
+        repos = selected.setdefault(entry.github_username, [])
+        repos.extend(repo for repo in entry.selected_repos if repo not in repos)
+    return selected
+
+
+async def analyze_batch(entries: list[AnalyzeRequest], concurrency: Optional[int] = None) -> AsyncIterator[dict]:
+    """
+    여러 유저를 한 번에 분석합니다.
+    - 모든 유저의 레포 조회를 하나의 동시 실행 한도(concurrency)로 묶어 공유 클라이언트로 처리
+    - 그 시점까지 분석이 끝난 유저들을 하나의 트랜잭션으로 저장한 뒤 요약을 yield ({"type": "user", ...})
+      (전송된 유저는 이미 저장되어 있으므로 스트림이 중간에 끊겨도 결과가 남음, 분석 중에는 DB 커넥션/락을 잡지 않음)
+      처음에는 배치 전체를 마지막에 한 트랜잭션으로 저장했지만, 그러면 클라이언트가 끊기는 순간 이미 받은
+      유저까지 모두 버려지고 긴 배치 동안 결과를 메모리에 쌓아 두어야 해서 완료 묶음 단위 저장으로 바꿈.
+      대신 배치 전체의 원자성은 없으므로, 일부 묶음 저장이 실패하면 done 의 saved_users/error 로 알림
+    - 마지막에 저장 결과 {"type": "done", ...} 을 yield
+    """
+    selected = merge_entries(entries)
+    semaphore = asyncio.Semaphore(concurrency or settings.BATCH_ANALYZE_CONCURRENCY)
+    client = get_github_client()
+
+    # 1. 유저 확인 (한 번에 조회)
+    async with async_session() as db:
+        result = await db.execute(select(User.username, User.id, User.github_id).where(User.username.in_(list(selected))))
+        rows = result.all()
+    user_ids = {username: user_id for username, user_id, _ in rows}
+    authors = {username: CommitAuthor(username, github_id) for username, _, github_id in rows}
+
+    async def fetch(username: str, repo: str) -> dict:
+        async with semaphore:
+            return await analyze_repo_details(client, username, repo, authors[username])
+
+    async def analyze_user(username: str, repos: list[str]) -> tuple[str, list[dict]]:
+        return username, list(await asyncio.gather(*(fetch(username, repo) for repo in repos)))
+
+    tasks = []
+    saved_users = 0
+    save_errors = []
+    try:
+        for username, repos in selected.items():
+            if username not in user_ids:
+                yield {"type": "user", "username": username, "status": "failed", "error": "User not found in DB. Please login first."}
+            elif not repos:
+                yield {"type": "user", "username": username, "status": "failed", "error": "No repos selected"}
+            else:
+                tasks.append(asyncio.create_task(analyze_user(username, repos)))
+
+        # 2. 끝난 유저부터 저장 후 요약 전송
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            lines = []
+            chunk: dict[int, tuple[list[dict], dict]] = {}
+            for task in done:
+                username, results = task.result()
+                summary = build_summary(username, results)
+                failed_repos = [r["repo"] for r in results if r["status"] == "failed"]
+                if len(failed_repos) == len(results):
+                    # 전부 실패한 유저는 기존 페르소나를 덮어쓰지 않음
+                    lines.append({"type": "user", "username": username, "status": "failed", "error": "All repositories failed", "failed_repos": failed_repos})
+                    continue
+                chunk[user_ids[username]] = (results, summary)
+                lines.append({
+                    "type": "user",
+                    "username": username,
+                    "status": "partial" if failed_repos else "success",
+                    "summary": summary,
+                    "failed_repos": failed_repos,
+                })
+
+            # 3. 이번에 끝난 유저들을 하나의 트랜잭션으로 저장
+            if chunk:
+                try:
+                    with span("db.save_batch"):
+                        await save_batch_results(chunk)
+                    saved_users += len(chunk)
+                except Exception as e:
+                    logger.exception("Batch analysis save failed")
+                    save_errors.append(str(e))
+            for line in lines:
+                yield line
+    finally:
+        # 클라이언트 연결이 끊기는 등으로 중단되면 남은 조회 취소
+        for task in tasks:
+            task.cancel()
+
+    if save_errors:
+        yield {"type": "done", "status": "failed", "saved_users": saved_users, "error": save_errors[0]}
+        return
+    yield {"type": "done", "status": "success", "saved_users": saved_users}
+
+async def save_batch_results(completed: dict[int, tuple[list[dict], dict]]):
+    """{user_id: (레포별 결과, 요약)} 을 하나의 트랜잭션으로 저장합니다."""
+    user_ids = list(completed)
+    async with async_session() as db:
+        result = await db.execute(select(User).where(User.id.in_(user_ids)))
+        users = {db_user.id: db_user for db_user in result.scalars().all()}
+        # 기존 레포는 한 번에 조회하여 레포별 조회를 생략
+        result = await db.execute(select(Repository).where(Repository.user_id.in_(user_ids)))
+        known_repos: dict[int, dict[str, Repository]] = {user_id: {} for user_id in user_ids}
+        for db_repo in result.scalars().all():
+            known_repos[db_repo.user_id][db_repo.name] = db_repo
+
+        now = datetime.now()
+        for user_id, (results, summary) in completed.items():
+            for r in results:
+                if r["status"] == "failed":
+                    continue
+                await save_repo_result(db, user_id, r, known_repos[user_id])
+            db_user = users[user_id]
+            apply_summary(db_user, summary)
+            db_user.last_analyzed = now
+            db_user.needs_rescore = False
+
+        await db.commit()
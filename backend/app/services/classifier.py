@@ -0,0 +1,203 @@
+import logging
+import re
+from datetime import datetime, timezone
+from typing import Callable, NamedTuple, Optional
+
+import orjson
+
+from app.core.config import settings
+from app.services.ngram_classifier import HashedNgramClassifier
+
+# 이 모듈은 프로세스 풀 워커에서도 import 되므로 가벼운 의존성만 사용합니다.
+
+logger = logging.getLogger(__name__)
+
+# 분석할 키워드 맵
+KEYWORD_MAP = {
+    "feat": ["feat", "add", "create", "implement", "추가", "구현", "생성"],
+    "fix": ["fix", "bug", "patch", "issue", "수정", "해결", "고침", "오류"],
+    "docs": ["docs", "readme", "document", "문서", "설명", "주석"],
+    "refactor": ["refactor", "clean", "simplify", "개선", "리팩"],
+    "test": ["test", "testing", "spec", "테스트"],
+    "chore": ["chore", "build", "config", "setting", "설정", "배포"]
+}
+
+def keyword_classify(message: str) -> list[str]:
+    """키워드 부분 문자열 매칭으로 커밋 메시지 하나가 해당하는 카테고리 목록을 반환합니다."""
+    msg = message.lower()
+    # 카테고리당 최대 1점만 부여 
+    # 예: "feat: 기능 추가 및 성능 개선" -> feat 1점, refactor 1점
+    return [category for category, keywords in KEYWORD_MAP.items() if any(kw in msg for kw in keywords)]
+
+def keyword_classify_batch(messages: list[str]) -> list[list[str]]:
+    return [keyword_classify(message) for message in messages]
+
+# COMMIT_CLASSIFIER 설정에 따라 처음 사용할 때 결정 (워커 프로세스에서도 각자 한 번 로드)
+_backend: Optional[Callable[[str], list[str]]] = None
+_batch_backend: Optional[Callable[[list[str]], list[list[str]]]] = None
+
+def _load_backend():
+    global _backend, _batch_backend
+    _backend, _batch_backend = keyword_classify, keyword_classify_batch
+    if settings.COMMIT_CLASSIFIER == "ngram":
+        try:
+            model = HashedNgramClassifier.load(settings.COMMIT_CLASSIFIER_MODEL)
+            _backend, _batch_backend = model.predict, model.predict_batch
+        except (OSError, ValueError) as e:
+            # 학습된 모델은 저장소에 포함되어 있지 않음 (scripts/train_commit_classifier.py 로 생성)
+            logger.error(
+                f"COMMIT_CLASSIFIER=ngram but no usable model at {settings.COMMIT_CLASSIFIER_MODEL} "
+                f"(train one with scripts/train_commit_classifier.py), falling back to keywords: {e}"
+            )
+    elif settings.COMMIT_CLASSIFIER != "keyword":
+        logger.warning(f"Unknown COMMIT_CLASSIFIER '{settings.COMMIT_CLASSIFIER}', using keywords")
+
+def get_classifier() -> Callable[[str], list[str]]:
+    if _backend is None:
+        _load_backend()
+    return _backend
+
+def get_batch_classifier() -> Callable[[list[str]], list[list[str]]]:
+    if _batch_backend is None:
+        _load_backend()
+    return _batch_backend
+
+# 커밋 메시지 끝의 git trailer ("Co-authored-by: Addison <...>", "Tested-by: ...")
+# 이름/이메일/키가 키워드에 걸리지 않도록 분류 전에 제거
+_TRAILER = re.compile(r"^(?:co-authored|signed-off|reviewed|acked|tested|reported|helped)-by:.*$", re.IGNORECASE | re.MULTILINE)
+_COAUTHOR = re.compile(r"^co-authored-by:[ \t]*(.*?)[ \t]*<([^>\n]*)>", re.IGNORECASE | re.MULTILINE)
+
+def strip_trailers(message: str) -> str:
+    if "by:" not in message and "By:" not in message and "BY:" not in message:
+        return message
+    return _TRAILER.sub("", message)
+
+def classify_message(message: str) -> list[str]:
+    """커밋 메시지 하나가 해당하는 카테고리 목록을 반환합니다."""
+    return get_classifier()(strip_trailers(message))
+
+def classify_messages(messages: list[str]) -> list[list[str]]:
+    """여러 커밋 메시지를 한 번에 분류합니다. (ngram 분류기는 배치 희소 행렬 곱으로 계산)"""
+    return get_batch_classifier()([strip_trailers(message) for message in messages])
+
+class CommitAuthor(NamedTuple):
+    """
+    분석 대상 유저 (커밋 작성자 필터). 프로세스 풀 워커로도 전달되므로 NamedTuple 사용.
+    github_id는 OAuth로 가입한 유저의 숫자 ID이며 네임드 유저("named_...")는 login만으로 식별합니다.
+    include_coauthors가 False면 본인이 작성한 커밋만 고릅니다. (COMMIT_AUTHOR_SCOPE=author)
+    """
+    login: str
+    github_id: Optional[str] = None
+    include_coauthors: bool = True
+
+    @property
+    def user_id(self) -> Optional[int]:
+        return int(self.github_id) if self.github_id and self.github_id.isdigit() else None
+
+    def noreply_emails(self) -> set[str]:
+        login = self.login.lower()
+        emails = {f"{login}@users.noreply.github.com"}
+        if self.github_id and self.github_id.isdigit():
+            emails.add(f"{self.github_id}+{login}@users.noreply.github.com")
+        return emails
+
+    def is_author(self, author_login: Optional[str], author_id: Optional[int] = None, author_email: Optional[str] = None) -> bool:
+        """
+        커밋 작성자 계정이 이 유저인지. 양쪽 모두 숫자 ID가 있고 같으면 login 변경과 무관하게 본인이고,
+        그 외에는 login, 그다음 GitHub noreply 이메일로 비교합니다. (웹훅 페이로드에는 ID가 없음)
+        ID가 다르더라도 login 으로 다시 확인하므로, 저장된 github_id 가 잘못된 유저(시드 데이터의 임시 ID 등)의
+        커밋이 모두 빠지지 않습니다.
+        """
+        user_id = self.user_id
+        if user_id is not None and author_id is not None and int(author_id) == user_id:
+            return True
+        if author_login and author_login.lower() == self.login.lower():
+            return True
+        return bool(author_email) and author_email.lower() in self.noreply_emails()
+
+    def is_coauthor(self, message: str) -> bool:
+        """Co-authored-by trailer에 이 유저(login 또는 GitHub noreply 이메일)가 있는지 (trailer 키는 대소문자 무관)"""
+        login = self.login.lower()
+        emails = self.noreply_emails()
+        return any(
+            name.lower() == login or email.lower() in emails
+            for name, email in _COAUTHOR.findall(message)
+        )
+
+    def matches(
+        self, author_login: Optional[str], message: str, author_id: Optional[int] = None, author_email: Optional[str] = None
+    ) -> bool:
+        """작성자 본인이거나 (include_coauthors면) 공동 작성자인 커밋인지"""
+        if self.is_author(author_login, author_id, author_email):
+            return True
+        return self.include_coauthors and self.is_coauthor(message)
+
+def classify_commit_messages(messages) -> dict:
+    """커밋 메시지들을 키워드 기반으로 분류하여 카테고리별 개수를 반환합니다."""
+    stats = {key: 0 for key in KEYWORD_MAP.keys()}
+    for categories in classify_messages(list(messages)):
+        for category in categories:
+            stats[category] += 1
+    return stats
+
+def parse_commit_date(date_str: str) -> datetime:
+    """GitHub 날짜 문자열(ISO 8601)을 UTC 기준 naive datetime으로 변환합니다."""
+    # API 응답은 "2026-01-28T12:00:00Z", 웹훅 페이로드는 "2026-01-28T21:00:00+09:00" 처럼 오프셋을 포함
+    # (fromisoformat은 strptime보다 수 배 빠르며 Python 3.11부터 "Z"도 처리)
+    parsed = datetime.fromisoformat(date_str)
+    if parsed.tzinfo is None:
+        return parsed
+    return parsed.astimezone(timezone.utc).replace(tzinfo=None)
+
+def _load_commits(raw: bytes, author: Optional[CommitAuthor]) -> list[dict]:
+    commits = orjson.loads(raw)
+    if author is not None:
+        commits = [
+            c for c in commits
+            if author.matches((c.get('author') or {}).get('login'), c['commit']['message'], (c.get('author') or {}).get('id'))
+        ]
+    return commits
+
+def _summarize_commits(commits: list[dict], classified: list[list[str]]) -> dict:
+    commit_activity = [
+        (parse_commit_date(commit['commit']['committer']['date']), categories)
+        for commit, categories in zip(commits, classified)
+    ]
+    commit_shas = [commit.get('sha') for commit in commits]
+
+    stats = {key: 0 for key in KEYWORD_MAP.keys()}
+    for _, categories in commit_activity:
+        for category in categories:
+            stats[category] += 1
+
+    return {
+        "total_commits": len(commits),
+        "commit_stats": stats,
+        # 첫 번째 커밋(최신)의 날짜
+        "latest_commit_date": commit_activity[0][0] if commit_activity else None,
+        "commit_activity": commit_activity,
+        "commit_shas": commit_shas, # commit_activity 와 같은 순서
+    }
+
+def parse_commit_payload(raw: bytes, author: Optional[CommitAuthor] = None) -> dict:
+    """
+    GitHub /commits 응답 원본 바이트를 파싱하고 분류합니다.
+    author가 주어지면 그 유저가 작성했거나 공동 작성한 커밋만 집계합니다.
+    반환값: 커밋 수, 카테고리별 개수, 최신 커밋 날짜, 커밋별 (날짜, 카테고리) 목록과 SHA 목록
+    """
+    commits = _load_commits(raw, author)
+    return _summarize_commits(commits, classify_messages([commit['commit']['message'] for commit in commits]))
+
+def parse_commit_payloads(items: list[tuple[bytes, Optional[CommitAuthor]]]) -> list[dict]:
+    """
+    여러 레포의 (응답, 작성자 필터)를 한 번에 처리합니다 (프로세스 간 통신 비용 분산용).
+    모든 레포의 커밋 메시지를 한 배치로 분류합니다.
+    """
+    pages = [_load_commits(raw, author) for raw, author in items]
+    classified = classify_messages([commit['commit']['message'] for commits in pages for commit in commits])
+    results = []
+    start = 0
+    for commits in pages:
+        results.append(_summarize_commits(commits, classified[start:start + len(commits)]))
+        start += len(commits)
+    return results
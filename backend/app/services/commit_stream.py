@@ -0,0 +1,136 @@
+import re
+from typing import Optional
+
+import orjson
+
+from app.services.classifier import KEYWORD_MAP, CommitAuthor, classify_message, parse_commit_date
+
+# JSON 문자열 리터럴 (이스케이프 포함)
+_STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+# commit.committer.date 값 (committer 객체 안에는 중첩 객체가 없음, name/email 문자열은 통째로 건너뛰어
+# 값 안의 중괄호에 걸리지 않도록 함), commit.message 값,
+# 최상위 sha (커밋 항목만 sha 다음에 node_id가 옴, tree/parents 의 sha 는 url 이 뒤따름)
+_COMMIT_FIELDS = (
+    rb'"committer"\s*:\s*\{(?:[^{}"]|' + _STRING + rb')*?"date"\s*:\s*(' + _STRING + rb')'
+    rb'|"message"\s*:\s*(' + _STRING + rb')'
+    rb'|"sha"\s*:\s*"([0-9a-f]+)"\s*,\s*"node_id"'
+)
+_COMMIT_FIELD = re.compile(_COMMIT_FIELDS)
+# 작성자 필터용: 위 필드 + 최상위 author 계정 (null 또는 login, id 순서로 시작하는 객체, commit.author 는 name이 첫 키라 걸리지 않음)
+# id 뒤의 구분자까지 확인하여 청크 경계에서 숫자가 잘린 채 매칭되지 않도록 함
+_COMMIT_FIELD_WITH_AUTHOR = re.compile(
+    _COMMIT_FIELDS
+    + rb'|"author"\s*:\s*(?:(null)|\{\s*"login"\s*:\s*(' + _STRING + rb')\s*,\s*"id"\s*:\s*(\d+)(?=\s*[,}]))'
+)
+
+_MESSAGE_KEY = b'"message"'
+_COMMITTER_KEY = b'"committer"'
+_AUTHOR_KEY = b'"author"'
+_SHA_KEY = b'"sha"'
+# 청크 경계에 걸린 키 조각을 다음 청크와 이어 붙이기 위해 남겨둘 길이
+_TAIL = 32
+
+
+class CommitStreamExtractor:
+    """
+    GitHub /commits 응답을 바이트 스트림 그대로 읽으면서
+    `[*].sha`, `[*].commit.committer.date`, `[*].commit.message` 만 추출하여 바로 분류합니다.
+
+    JSON 문자열 안의 따옴표는 항상 이스케이프되므로 `"message":` 같은 키 패턴은 사용자 입력(커밋 메시지 등)
+    안에서 나타날 수 없습니다. 또 GitHub 커밋 응답에서 `message` 키는 commit 객체에만 있으므로
+    전체를 파싱하지 않고 정규식 탐색만으로 안전하게 값을 꺼낼 수 있습니다.
+    아직 값이 다 도착하지 않은 조각만 버퍼에 남기므로 메모리는 청크 크기 + 메시지 하나 수준입니다.
+
+    author가 주어지면 커밋 항목에서 commit 다음에 오는 최상위 author(login, id) 까지 본 뒤
+    그 유저가 작성했거나 (include_coauthors면) Co-authored-by 로 참여한 커밋만 분류/집계합니다.
+    """
+
+    def __init__(self, author: Optional[CommitAuthor] = None):
+        self.author = author
+        self._pattern = _COMMIT_FIELD if author is None else _COMMIT_FIELD_WITH_AUTHOR
+        self._keys = (_MESSAGE_KEY, _COMMITTER_KEY, _SHA_KEY) + (() if author is None else (_AUTHOR_KEY,))
+        self.buffer = b""
+        self.total_commits = 0
+        self.stats = {key: 0 for key in KEYWORD_MAP.keys()}
+        self.latest_commit_date = None
+        self.commit_activity = []
+        self.commit_shas = []  # commit_activity 와 같은 순서
+        # 커밋 항목은 sha -> commit(committer -> message) 순서이므로, 직전에 읽은 sha/committer.date가 현재 커밋의 값
+        self._sha = None
+        self._commit_date = None
+        # 작성자 필터 사용 시 author 확인을 기다리는 (날짜, 메시지)
+        self._pending: Optional[tuple] = None
+
+    def feed(self, chunk: bytes):
+        buf = self.buffer + chunk if self.buffer else chunk
+
+        last_end = 0
+        for match in self._pattern.finditer(buf):
+            last_end = match.end()
+            if self.author is None:
+                date_raw, message_raw, sha = match.groups()
+            else:
+                date_raw, message_raw, sha, author_null, login_raw, author_id = match.groups()
+                if author_null is not None or login_raw is not None:
+                    if self._pending is not None:
+                        if author_null:
+                            self._resolve(None, None)
+                        else:
+                            self._resolve(orjson.loads(login_raw), int(author_id))
+                    continue
+            if sha is not None:
+                self._sha = sha.decode("ascii")
+                continue
+            if date_raw is not None:
+                self._commit_date = parse_commit_date(orjson.loads(date_raw))
+                continue
+
+            message = orjson.loads(message_raw)
+            if self.author is None:
+                self._record(self._sha, self._commit_date, message)
+            else:
+                if self._pending is not None:  # author 항목 없이 다음 커밋이 시작된 경우
+                    self._resolve(None, None)
+                self._pending = (self._sha, self._commit_date, message)
+            self._sha = None
+            self._commit_date = None
+
+        self.buffer = self._remainder(buf, last_end)
+
+    def _record(self, sha: Optional[str], committed_at, message: str):
+        categories = classify_message(message)
+        for category in categories:
+            self.stats[category] += 1
+        if self.total_commits == 0:
+            self.latest_commit_date = committed_at
+        self.total_commits += 1
+        self.commit_activity.append((committed_at, categories))
+        self.commit_shas.append(sha)
+
+    def _resolve(self, author_login: Optional[str], author_id: Optional[int]):
+        sha, committed_at, message = self._pending
+        self._pending = None
+        if self.author.matches(author_login, message, author_id):
+            self._record(sha, committed_at, message)
+
+    def finish(self) -> dict:
+        if self._pending is not None:
+            self._resolve(None, None)
+        self.buffer = b""
+        return self.result()
+
+    def result(self) -> dict:
+        return {
+            "total_commits": self.total_commits,
+            "commit_stats": self.stats,
+            "latest_commit_date": self.latest_commit_date,
+            "commit_activity": self.commit_activity,
+            "commit_shas": self.commit_shas,
+        }
+
+    def _remainder(self, buf: bytes, last_end: int) -> bytes:
+        """다음 청크와 이어서 처리해야 하는 미완성 조각만 남깁니다."""
+        pending = [pos for pos in (buf.rfind(key, last_end) for key in self._keys) if pos != -1]
+        if pending:
+            return buf[min(pending):]
+        return buf[max(last_end, len(buf) - _TAIL):]
@@ -0,0 +1,123 @@
+import base64
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Optional
+
+import orjson
+from fastapi import HTTPException
+from sqlalchemy import tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.models import User, Repository
+from app.services.github import PERSONA_NAMES, BEGINNER_PERSONA, NORMAL_PERSONA
+
+KNOWN_PERSONAS = [*PERSONA_NAMES.values(), BEGINNER_PERSONA, NORMAL_PERSONA]
+
+# 탐색 결과로 내보내는 유저 컬럼 (ORM 객체 대신 필요한 컬럼만 조회)
+EXPLORE_COLUMNS = (
+    User.id,
+    User.username,
+    User.avatar_url,
+    User.persona,
+    User.persona_score,
+    User.top_language,
+    User.latest_commit,
+)
+
+
+def resolve_persona(value: str) -> str:
+    """전체 이름("연구소 돔 (Fixer)"), 괄호 안 이름("Fixer"), 카테고리 키("fix") 모두 허용합니다."""
+    if value in PERSONA_NAMES:
+        return PERSONA_NAMES[value]
+    lowered = value.strip().lower()
+    for persona in KNOWN_PERSONAS:
+        if persona.lower() == lowered or persona.rsplit("(", 1)[-1].rstrip(")").lower() == lowered:
+            return persona
+    raise HTTPException(status_code=400, detail=f"Unknown persona: {value}")
+
+
+def encode_cursor(score: float, user_id: int) -> str:
+    return base64.urlsafe_b64encode(orjson.dumps([score, user_id])).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[float, int]:
+    try:
+        score, user_id = orjson.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return float(score), int(user_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def explore_filters(
+    persona: Optional[str] = None,
+    language: Optional[str] = None,
+    active_within_days: Optional[int] = None,
+) -> list:
+    """탐색 API와 스크립트가 공유하는 유저 필터 조건"""
+    filters = [User.persona.is_not(None)]
+    if persona:
+        filters.append(User.persona == resolve_persona(persona))
+    if language:
+        filters.append(User.top_language == language)
+    if active_within_days:
+        filters.append(User.latest_commit >= datetime.now() - timedelta(days=active_within_days))
+    return filters
+
+
+async def explore_users(
+    db: AsyncSession,
+    persona: Optional[str] = None,
+    language: Optional[str] = None,
+    active_within_days: Optional[int] = None,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+) -> dict:
+    """
+    점수 내림차순으로 유저를 조회합니다.
+    OFFSET 대신 마지막 항목의 (점수, id) 다음부터 읽는 키셋 페이지네이션이므로
+    (persona|top_language, persona_score, id) 인덱스를 따라 몇 번째 페이지든 limit 건만 읽습니다.
+    """
+    statement = (
+        select(*EXPLORE_COLUMNS)
+        .where(*explore_filters(persona, language, active_within_days))
+        .order_by(User.persona_score.desc(), User.id.desc())
+        .limit(limit + 1)
+    )
+    if cursor:
+        statement = statement.where(tuple_(User.persona_score, User.id) < tuple_(*decode_cursor(cursor)))
+
+    result = await db.execute(statement)
+    rows = result.all()
+    items = [row._asdict() for row in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor(last["persona_score"], last["id"])
+    return {"items": items, "next_cursor": next_cursor}
+
+
+async def stream_users_with_repos(db: AsyncSession, filters: list, batch_size: int = 500) -> AsyncIterator[tuple[dict, list[dict]]]:
+    """
+    유저와 레포를 JOIN 한 번으로 읽어 (유저, 레포 목록) 단위로 내보냅니다.
+    서버 측 커서(stream)로 batch_size 행씩 가져오므로 유저 수와 관계없이 메모리가 일정합니다.
+    """
+    statement = (
+        select(*EXPLORE_COLUMNS, Repository.name, Repository.analysis_type, Repository.latest_commit.label("repo_latest_commit"))
+        .outerjoin(Repository, Repository.user_id == User.id)
+        .where(*filters)
+        .order_by(User.id, Repository.id)
+        .execution_options(yield_per=batch_size)
+    )
+    result = await db.stream(statement)
+
+    current, repos = None, []
+    async for row in result:
+        if current is None or row.id != current["id"]:
+            if current is not None:
+                yield current, repos
+            current = {column.key: getattr(row, column.key) for column in EXPLORE_COLUMNS}
+            repos = []
+        if row.name is not None:
+            repos.append({"name": row.name, "analysis_type": row.analysis_type, "latest_commit": row.repo_latest_commit})
+    if current is not None:
+        yield current, repos
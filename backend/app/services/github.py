@@ -3,11 +3,20 @@ import httpx
 import asyncio
 import logging
 from datetime import datetime
+from typing import Optional
+from urllib.parse import quote
 from app.schemas import AnalyzeRequest
 from app.schemas import RepoInfo
 from fastapi import HTTPException
 from collections import Counter
 from app.core.config import settings
+from app.core.http import get_github_client
+from app.core.resilience import hedged_get, hedged_stream
+from app.core.profiling import span
+from app.services.classifier import KEYWORD_MAP, CommitAuthor, classify_commit_messages
+from app.services.offload import feed_commit_stream, parse_commit_payload
+from app.services.commit_stream import CommitStreamExtractor
+from app.services.repo_commits import COMMIT_WINDOW, replace_commit_window
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -16,17 +25,66 @@ logger = logging.getLogger(__name__)
 
 GITHUB_TOKEN = settings.GITHUB_TOKEN
 HEADERS = settings.GITHUB_HEADERS
+STREAM_CHUNK_SIZE = 8192
+# 레포 분석 결과 중 저장에만 쓰고 응답에서는 빼는 필드
+STORAGE_ONLY_FIELDS = ("commit_activity", "commit_shas")
 
-# 분석할 키워드 맵
-KEYWORD_MAP = {
-    "feat": ["feat", "add", "create", "implement", "추가", "구현", "생성"],
-    "fix": ["fix", "bug", "patch", "issue", "수정", "해결", "고침", "오류"],
-    "docs": ["docs", "readme", "document", "문서", "설명", "주석"],
-    "refactor": ["refactor", "clean", "simplify", "개선", "리팩"],
-    "test": ["test", "testing", "spec", "테스트"],
-    "chore": ["chore", "build", "config", "setting", "설정", "배포"]
+# 가공 로직: 휴리스틱 가중치 적용
+WEIGHTS = {
+    "feat": 1.0,
+    "refactor": 3.0,
+    "test": 4.0,
+    "fix": 4.0,
+    "docs": 4.0,
+    "chore": 1.0 
 }
 
+# 페르소나 명칭 매핑
+PERSONA_NAMES = {
+    "feat": "미래 도시 숲 (Builder)",
+    "refactor": "장인의 정원 (Refactorer)",
+    "test": "심해의 관측 기지 (Tester)",
+    "fix": "연구소 돔 (Fixer)",
+    "docs": "지식의 도서관 (Documenter)"
+}
+BEGINNER_PERSONA = "새싹이 돋아나는 땅 (Beginner)"
+NORMAL_PERSONA = "평화로운 들판 (Normal)"
+
+def classify_repo_type(repo_stats: dict) -> str:
+    """레포별 성향 결정 (간단)"""
+    if repo_stats["feat"] > repo_stats["fix"]:
+        return "Builder"
+    if repo_stats["fix"] > 0:
+        return "Fixer"
+    return "Normal"
+
+def score_persona(total_stats: Counter, total_languages: Counter) -> dict:
+    """합산된 커밋 통계와 언어 사용량으로 페르소나와 점수를 계산합니다."""
+    # 항목별 점수 산출
+    scores = {}
+    for key in KEYWORD_MAP.keys():
+        weight = WEIGHTS.get(key, 1.0)
+        scores[key] = round(total_stats[key] * weight, 1)
+
+    # 최종 페르소나 결정
+    total_score = sum(scores.values())
+    top_languages = dict(total_languages.most_common(3))
+
+    if total_score < 5:  # 데이터 부족하면 기본
+        persona = BEGINNER_PERSONA
+    else:
+        # 점수가 가장 높은 카테고리 추출 
+        # 점수가 같을 시 우선순위대로 정렬 (우선순위: Fix > Docs > Test > Refactor > Feat)
+        dominant_trait = max(scores, key=scores.get)
+        persona = PERSONA_NAMES.get(dominant_trait, NORMAL_PERSONA)
+
+    return {
+        "persona": persona,
+        "main_languages": list(top_languages.keys()),
+        "total_score": round(total_score, 1),
+        "weighted_scores": scores,
+    }
+
 async def fetch_repo_details(client: httpx.AsyncClient, user: str, repo: str):
     """커밋 로그와 사용 언어를 함께 수집합니다 (유연한 키워드 분석)."""
     commit_url = f"https://api.github.com/repos/{user}/{repo}/commits?per_page=50"
@@ -47,14 +105,7 @@ async def fetch_repo_details(client: httpx.AsyncClient, user: str, repo: str):
         if isinstance(commit_res, httpx.Response) and commit_res.status_code == 200:
             commits = commit_res.json()
             total_commits = len(commits)
-            for commit in commits:
-                msg = commit['commit']['message'].lower()
-                
-                # 카테고리당 최대 1점만 부여 
-                # 예: "feat: 기능 추가 및 성능 개선" -> feat 1점, refactor 1점
-                for category, keywords in KEYWORD_MAP.items():
-                    if any(kw in msg for kw in keywords):
-                        stats[category] += 1
+            stats = classify_commit_messages(commit['commit']['message'] for commit in commits)
         elif isinstance(commit_res, httpx.Response):
             if commit_res.status_code == 409:
                 logger.warning(f"Repo {repo} is empty (409 Conflict)")
@@ -82,73 +133,152 @@ async def fetch_repo_details(client: httpx.AsyncClient, user: str, repo: str):
         return {"repo": repo, "error": str(e), "status": "failed"}
 
 async def get_user_repositories(username: str):
-    if not GITHUB_TOKEN:
+    if not GITHUB_TOKEN and settings.GITHUB_TRANSPORT_MODE != "replay":
         raise HTTPException(status_code=500, detail="GITHUB_TOKEN not configured")
     
-    async with httpx.AsyncClient() as client:
-        try:
-            url = f"https://api.github.com/users/{username}/repos?sort=updated&per_page=100"
-            response = await client.get(url, headers=HEADERS)
-            
-            if response.status_code == 404:
-                raise HTTPException(status_code=404, detail="User not found")
-            if response.status_code != 200:
-                raise HTTPException(status_code=response.status_code, detail="GitHub API Error")
-            
-            repos = [
-                RepoInfo(
-                    name=r['name'],
-                    description=r['description'],
-                    stars=r['stargazers_count'],
-                    language=r['language'],
-                    url=r['html_url'],
-                    updated_at=r['updated_at']
-                ) for r in response.json()
-            ]
-
-            # Giter라 표준 정렬 로직 적용: Star 많은 순 -> 최신 업데이트 순
-            repos.sort(key=lambda x: (x.stars, x.updated_at), reverse=True)
-            
-            return repos
-        except httpx.RequestError as e:
-            logger.error(f"Network error: {e}")
-            raise HTTPException(status_code=503, detail="GitHub API connection failed")
+    client = get_github_client()
+    try:
+        url = f"https://api.github.com/users/{username}/repos?sort=updated&per_page=100"
+        response = await client.get(url, headers=HEADERS)
+        
+        if response.status_code == 404:
+            raise HTTPException(status_code=404, detail="User not found")
+        if response.status_code != 200:
+            raise HTTPException(status_code=response.status_code, detail="GitHub API Error")
+        
+        repos = [
+            RepoInfo(
+                name=r['name'],
+                description=r['description'],
+                stars=r['stargazers_count'],
+                language=r['language'],
+                url=r['html_url'],
+                updated_at=r['updated_at']
+            ) for r in response.json()
+        ]
+
+        # Giter라 표준 정렬 로직 적용: Star 많은 순 -> 최신 업데이트 순
+        repos.sort(key=lambda x: (x.stars, x.updated_at), reverse=True)
+        
+        return repos
+    except httpx.RequestError as e:
+        logger.error(f"Network error: {e}")
+        raise HTTPException(status_code=503, detail="GitHub API connection failed")
 
 from sqlmodel import select
+from app.database import async_session
 from app.models import User, Repository
+from app.services.languages import update_repo_languages, get_user_top_languages
+from app.services.activity import merge_repo_activity, reset_repo_activity
+from sqlalchemy import update, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-async def analyze_repo_details(client: httpx.AsyncClient, user: str, repo: str):
-    """개별 레포지토리의 상세 정보를 수집하고 가공합니다."""
-    commit_url = f"https://api.github.com/repos/{user}/{repo}/commits?per_page=50"
+async def get_top_repo_names(username: str, limit: int = 8) -> list[str]:
+    """Star 많은 순 -> 최신 업데이트 순으로 상위 레포 이름을 반환합니다."""
+    repos = await get_user_repositories(username)
+    return [r.name for r in repos[:limit]]
+
+def commit_scope() -> str:
+    scope = settings.COMMIT_AUTHOR_SCOPE
+    return scope if scope in ("author", "coauthor", "all") else "author"
+
+def commit_filter(author: CommitAuthor) -> Optional[CommitAuthor]:
+    """
+    COMMIT_AUTHOR_SCOPE 에 맞는 커밋 작성자 필터 (분석과 push 웹훅이 같은 기준으로 커밋을 고르도록 공용)
+    author: 본인이 작성한 커밋만 / coauthor: 본인 작성 + Co-authored-by 로 참여한 커밋 / all: 필터 없음 (None)
+    """
+    scope = commit_scope()
+    if scope == "all":
+        return None
+    return author._replace(include_coauthors=scope == "coauthor")
+
+def commit_list_url(owner: str, repo: str, author: CommitAuthor) -> tuple[str, Optional[CommitAuthor]]:
+    """
+    커밋 목록 URL과 응답에 적용할 작성자 필터를 COMMIT_AUTHOR_SCOPE 에 맞게 만듭니다.
+    - author: GitHub author= 필터로 서버에서 먼저 걸러 전송량을 줄이고, 응답에도 같은 필터(계정 ID 기준)를 적용
+      (author= 는 login/이메일만 받으므로 계정에 연결된 모든 이메일을 포함하는 login 사용)
+    - coauthor/all: 같은 요청(같은 응답, 같은 카세트)을 보내고 응답에 적용하는 필터만 다름
+    """
+    url = f"https://api.github.com/repos/{owner}/{repo}/commits?per_page={COMMIT_WINDOW}"
+    author_filter = commit_filter(author)
+    if commit_scope() == "author":
+        return f"{url}&author={quote(author.login)}", author_filter
+    return url, author_filter
+
+async def fetch_commit_summary(client: httpx.AsyncClient, url: str, hedge_delay: float, author: Optional[CommitAuthor] = None):
+    """커밋 응답 전체를 받은 뒤 오프로드 워커에서 파싱/분류합니다. 반환값: (상태 코드, 요약 또는 None)"""
+    with span("github.commits"):
+        res = await hedged_get(client, url, hedge_delay, headers=HEADERS)
+    if res.status_code != 200:
+        return res.status_code, None
+    # JSON 파싱과 분류는 이벤트 루프 밖(스레드/프로세스 풀)에서 수행
+    with span("parse.commits"):
+        return res.status_code, await parse_commit_payload(res.content, author)
+
+async def stream_commit_summary(client: httpx.AsyncClient, url: str, hedge_delay: float, author: Optional[CommitAuthor] = None):
+    """
+    커밋 응답을 도착하는 대로 읽으며 message/date만 추출하여 분류합니다. 반환값: (상태 코드, 요약 또는 None)
+    fetch_commit_summary 와 마찬가지로 느린 요청은 헤징하고, 청크 추출/분류는 이벤트 루프 밖(스레드 풀)에서 수행합니다.
+    """
+    with span("github.commits"):
+        res = await hedged_stream(client, url, hedge_delay, headers=HEADERS)
+        try:
+            if res.status_code != 200:
+                return res.status_code, None
+            extractor = CommitStreamExtractor(author)
+            async for chunk in res.aiter_bytes(STREAM_CHUNK_SIZE):
+                # 수신 대기와 겹치지 않는 파싱/분류 시간
+                with span("parse.commits"):
+                    await feed_commit_stream(extractor, chunk)
+            return res.status_code, extractor.finish()
+        finally:
+            await res.aclose()
+
+async def fetch_languages(client: httpx.AsyncClient, url: str, hedge_delay: float) -> httpx.Response:
+    with span("github.languages"):
+        return await hedged_get(client, url, hedge_delay, headers=HEADERS)
+
+async def analyze_repo_details(client: httpx.AsyncClient, user: str, repo: str, author: Optional[CommitAuthor] = None):
+    """
+    개별 레포지토리의 상세 정보를 수집하고 가공합니다.
+    author: 커밋을 집계할 유저 (기본값은 레포 소유자 user, COMMIT_AUTHOR_SCOPE 참고)
+    """
+    commit_url, commit_filter = commit_list_url(user, repo, author or CommitAuthor(user))
     lang_url = f"https://api.github.com/repos/{user}/{repo}/languages"
+    hedge_delay = settings.GITHUB_HEDGE_DELAY_MS / 1000
+
+    if settings.COMMIT_FETCH_STREAMING:
+        fetch_commits = stream_commit_summary(client, commit_url, hedge_delay, commit_filter)
+    else:
+        fetch_commits = fetch_commit_summary(client, commit_url, hedge_delay, commit_filter)
     
     try:
         commit_res, lang_res = await asyncio.gather(
-            client.get(commit_url, headers=HEADERS),
-            client.get(lang_url, headers=HEADERS),
+            fetch_commits,
+            fetch_languages(client, lang_url, hedge_delay),
             return_exceptions=True
         )
 
+        # 커밋 조회 자체가 실패(타임아웃, 서킷 차단 등)하면 기존 저장값을 덮어쓰지 않도록 실패 처리
+        if isinstance(commit_res, Exception):
+            logger.warning(f"Failed to fetch commits for {repo}: {commit_res!r}")
+            return {"repo": repo, "error": str(commit_res) or type(commit_res).__name__, "status": "failed"}
+
         stats = {key: 0 for key in KEYWORD_MAP.keys()}
         total_commits = 0
         languages = {}
 
         # 커밋 분석
         latest_commit_date = None
-        if isinstance(commit_res, httpx.Response) and commit_res.status_code == 200:
-            commits = commit_res.json()
-            total_commits = len(commits)
-            if total_commits > 0:
-                # 첫 번째 커밋(최신)의 날짜 추출
-                date_str = commits[0]['commit']['committer']['date']
-                latest_commit_date = datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%SZ")
-
-            for commit in commits:
-                msg = commit['commit']['message'].lower()
-                for category, keywords in KEYWORD_MAP.items():
-                    if any(kw in msg for kw in keywords):
-                        stats[category] += 1
+        commit_activity = []
+        commit_shas = []
+        _, parsed = commit_res
+        if parsed:
+            total_commits = parsed["total_commits"]
+            stats = parsed["commit_stats"]
+            latest_commit_date = parsed["latest_commit_date"]
+            commit_activity = parsed["commit_activity"]
+            commit_shas = parsed["commit_shas"]
         
         # 언어 분석
         if isinstance(lang_res, httpx.Response) and lang_res.status_code == 200:
@@ -160,12 +290,167 @@ async def analyze_repo_details(client: httpx.AsyncClient, user: str, repo: str):
             "commit_stats": stats,
             "languages": languages,
             "latest_commit_date": latest_commit_date,
+            "commit_activity": commit_activity, # [(커밋 시각, 카테고리 목록)] - 저장용, 응답에서는 제외
+            "commit_shas": commit_shas, # 저장용, 응답에서는 제외
+            "commit_scope": commit_scope(),
             "status": "success" if total_commits > 0 or languages else "partial_success"
         }
     except Exception as e:
         logger.exception(f"Error analyzing {repo}")
         return {"repo": repo, "error": str(e), "status": "failed"}
 
+async def bump_user_latest_commit(db: AsyncSession, user_id: int, committed_at: datetime):
+    """유저의 최근 커밋 시각(전체 레포 중 최신)을 더 최근 값일 때만 원자적으로 갱신합니다."""
+    await db.execute(
+        update(User)
+        .where(User.id == user_id, or_(User.latest_commit.is_(None), User.latest_commit < committed_at))
+        .values(latest_commit=committed_at)
+    )
+
+async def save_repo_result(db: AsyncSession, user_id: int, r: dict, known_repos: Optional[dict] = None):
+    """
+    개별 레포지토리 분석 결과를 DB에 저장/업데이트합니다. (커밋은 호출한 쪽에서)
+    known_repos: 미리 한 번에 조회해 둔 {레포 이름: Repository} (있으면 레포별 조회 생략)
+    """
+    repo_name = r["repo"]
+    if known_repos is not None:
+        db_repo = known_repos.get(repo_name)
+    else:
+        repo_stmt = select(Repository).where(Repository.user_id == user_id, Repository.name == repo_name)
+        repo_res = await db.execute(repo_stmt)
+        db_repo = repo_res.scalars().first()
+    
+    repo_type = classify_repo_type(r["commit_stats"])
+
+    # 최신 커밋 날짜 추출
+    latest_commit_date = None
+    if "latest_commit_date" in r:
+        latest_commit_date = r["latest_commit_date"]
+
+    scope = r.get("commit_scope")
+    if db_repo:
+        if scope and db_repo.commit_scope != scope:
+            # 다른 범위로 누적된 주간 활동은 섞이지 않도록 비우고 이번 결과로 다시 채움
+            await reset_repo_activity(db, db_repo)
+            db_repo.commit_scope = scope
+        db_repo.analysis_type = repo_type
+        db_repo.analysis_summary = f"Commits: {r['total_commits']}, Langs: {list(r['languages'].keys())}"
+        db_repo.total_commits = r["total_commits"]
+        db_repo.commit_stats = r["commit_stats"]
+        db_repo.last_analyzed = datetime.now()
+        if latest_commit_date:
+            db_repo.latest_commit = latest_commit_date
+    else:
+        db_repo = Repository(
+            user_id=user_id,
+            name=repo_name,
+            analysis_type=repo_type,
+            analysis_summary=f"Commits: {r['total_commits']}, Langs: {list(r['languages'].keys())}",
+            total_commits=r["total_commits"],
+            commit_stats=r["commit_stats"],
+            last_analyzed=datetime.now(),
+            latest_commit=latest_commit_date,
+            commit_scope=scope,
+        )
+        db.add(db_repo)
+        await db.flush() # 언어/활동 집계에 repo id가 필요
+
+    # latest_commit 갱신과 별개로, 주간 활동에 아직 반영되지 않은 커밋만 누적
+    await merge_repo_activity(db, db_repo, r.get("commit_activity", []))
+    # 이번 분석의 최근 커밋 창 (웹훅은 여기에 새 커밋을 더한 뒤 통계를 다시 계산)
+    if r.get("commit_shas"):
+        await replace_commit_window(db, db_repo, r["commit_activity"], r["commit_shas"])
+    if latest_commit_date:
+        await bump_user_latest_commit(db, user_id, latest_commit_date)
+
+    # 언어 조회에 실패한 경우(빈 dict)는 기존 집계를 유지
+    if r["languages"]:
+        await update_repo_languages(db, db_repo, r["languages"])
+
+def apply_summary(db_user: User, scored: dict):
+    """계산된 페르소나/점수/대표 언어를 유저에 반영합니다. (탐색 API의 필터/정렬 컬럼)"""
+    db_user.persona = scored["persona"]
+    db_user.persona_score = scored["total_score"]
+    db_user.top_language = scored["main_languages"][0] if scored["main_languages"] else None
+
+def build_summary(username: str, results: list[dict]) -> dict:
+    """레포별 분석 결과(실패/대기 제외)를 합산하여 유저 요약을 만듭니다."""
+    total_stats = Counter()
+    total_languages = Counter()
+    for r in results:
+        if r.get("status") in ("failed", "pending"):
+            continue
+        total_stats.update(r.get("commit_stats", {}))
+        total_languages.update(r.get("languages", {}))
+
+    scored = score_persona(total_stats, total_languages)
+    return {
+        "username": username,
+        "persona": scored["persona"],
+        "main_languages": scored["main_languages"],
+        "total_score": scored["total_score"],
+        "commit_stats": dict(total_stats),
+        "weighted_scores": scored["weighted_scores"],
+        "pending_repos": [r["repo"] for r in results if r["status"] == "pending"]
+    }
+
+async def build_stored_summary(db: AsyncSession, db_user: User, repos: Optional[list[Repository]] = None) -> Optional[dict]:
+    """
+    저장된 모든 레포의 커밋 통계와 유저 언어 집계로 요약을 다시 계산합니다. (저장된 레포가 없으면 None)
+    레포를 나눠 저장한 경우(마감 후 백그라운드 저장 등)에도 build_summary 와 같은 기준으로 합산됩니다.
+    repos: 이미 조회해 둔 유저의 레포 목록 (없으면 여기서 조회)
+    """
+    if repos is None:
+        result = await db.execute(select(Repository).where(Repository.user_id == db_user.id))
+        repos = result.scalars().all()
+    if not repos:
+        return None
+
+    total_stats = Counter()
+    for db_repo in repos:
+        total_stats.update(db_repo.commit_stats or {})
+    top_languages = await get_user_top_languages(db, db_user.id, 3)
+
+    scored = score_persona(total_stats, Counter({l["language"]: l["bytes"] for l in top_languages}))
+    return {
+        "username": db_user.username,
+        "persona": scored["persona"],
+        "main_languages": scored["main_languages"],
+        "total_score": scored["total_score"],
+        "commit_stats": {key: total_stats[key] for key in KEYWORD_MAP.keys()},
+        "weighted_scores": scored["weighted_scores"],
+    }
+
+# 마감 이후에도 진행 중인 분석 작업 (GC 방지용 참조)
+_background_tasks: set[asyncio.Task] = set()
+
+async def finish_pending_repos(user_id: int, pending: list[asyncio.Task]):
+    """마감 시간 안에 끝나지 않은 레포 분석을 마저 기다려 저장하고, 저장된 전체 레포로 요약을 다시 계산합니다."""
+    # create_task 로 띄운 작업이라 여기서 예외를 잡지 않으면 아무 로그 없이 결과가 사라짐
+    try:
+        results = await asyncio.gather(*pending)
+        completed = [r for r in results if r.get("status") != "failed"]
+        if not completed:
+            return
+
+        async with async_session() as db:
+            for r in completed:
+                await save_repo_result(db, user_id, r)
+            await db.flush()
+            db_user = await db.get(User, user_id)
+            if db_user:
+                # 마감 전에 끝난 레포(요청에서 저장)와 방금 저장한 레포를 합쳐 페르소나 갱신
+                summary = await build_stored_summary(db, db_user)
+                apply_summary(db_user, summary)
+                db_user.last_analyzed = datetime.now()
+                db_user.needs_rescore = False
+            await db.commit()
+    except Exception:
+        logger.exception(f"Background analysis save failed for user {user_id}")
+        return
+    logger.info(f"Background analysis finished for user {user_id}: {[r['repo'] for r in completed]}")
+
+
 async def analyze_selected_repos(request: AnalyzeRequest, db: AsyncSession):
     user_name = request.github_username
     repo_names = request.selected_repos
@@ -181,105 +466,76 @@ async def analyze_selected_repos(request: AnalyzeRequest, db: AsyncSession):
     if not db_user:
         raise HTTPException(status_code=404, detail="User not found in DB. Please login first.")
 
-    async with httpx.AsyncClient() as client:
-        tasks = [analyze_repo_details(client, user_name, repo) for repo in repo_names]
-        results = await asyncio.gather(*tasks)
+    client = get_github_client()
+    author = CommitAuthor(user_name, db_user.github_id)
+    tasks = [asyncio.create_task(analyze_repo_details(client, user_name, repo, author)) for repo in repo_names]
 
-        # 전체 통계 합산 및 개별 저장
-        total_stats = Counter()
-        total_languages = Counter()
-        
-        for r in results:
-            if r.get("status") == "failed":
-                continue
-                
-            if "commit_stats" in r:
-                total_stats.update(r["commit_stats"])
-            if "languages" in r:
-                total_languages.update(r["languages"])
-            
-            # 개별 레포지토리 DB 저장/업데이트
-            repo_name = r["repo"]
-            repo_stmt = select(Repository).where(Repository.user_id == db_user.id, Repository.name == repo_name)
-            repo_res = await db.execute(repo_stmt)
-            db_repo = repo_res.scalars().first()
-            
-            # 레포별 성향 결정 (간단)
-            repo_stats = r["commit_stats"]
-            repo_type = "Normal"
-            if repo_stats["feat"] > repo_stats["fix"]: repo_type = "Builder"
-            elif repo_stats["fix"] > 0: repo_type = "Fixer"
-
-            # 최신 커밋 날짜 추출
-            latest_commit_date = None
-            if "latest_commit_date" in r:
-                latest_commit_date = r["latest_commit_date"]
-
-            if db_repo:
-                db_repo.analysis_type = repo_type
-                db_repo.analysis_summary = f"Commits: {r['total_commits']}, Langs: {list(r['languages'].keys())}"
-                db_repo.last_analyzed = datetime.now()
-                if latest_commit_date:
-                    db_repo.latest_commit = latest_commit_date
-            else:
-                db_repo = Repository(
-                    user_id=db_user.id,
-                    name=repo_name,
-                    analysis_type=repo_type,
-                    analysis_summary=f"Commits: {r['total_commits']}, Langs: {list(r['languages'].keys())}",
-                    last_analyzed=datetime.now(),
-                    latest_commit=latest_commit_date
-                )
-                db.add(db_repo)
-
-        # 가공 로직: 휴리스틱 가중치 적용
-        WEIGHTS = {
-            "feat": 1.0,
-            "refactor": 3.0,
-            "test": 4.0,
-            "fix": 4.0,
-            "docs": 4.0,
-            "chore": 1.0 
-        }
+    # 시간 예산 안에 끝난 레포만으로 점수 계산, 나머지는 백그라운드에서 마저 처리
+    with span("analyze.wait_repos"):
+        await asyncio.wait(tasks, timeout=settings.ANALYZE_DEADLINE_SECONDS)
+    pending = [task for task in tasks if not task.done()]
+    results = [
+        task.result() if task.done() else {"repo": repo, "status": "pending"}
+        for repo, task in zip(repo_names, tasks)
+    ]
+    if pending:
+        background = asyncio.create_task(finish_pending_repos(db_user.id, pending))
+        _background_tasks.add(background)
+        background.add_done_callback(_background_tasks.discard)
 
-        # 페르소나 명칭 매핑
-        PERSONA_NAMES = {
-            "feat": "미래 도시 숲 (Builder)",
-            "refactor": "장인의 정원 (Refactorer)",
-            "test": "심해의 관측 기지 (Tester)",
-            "fix": "연구소 돔 (Fixer)",
-            "docs": "지식의 도서관 (Documenter)"
-        }
+    # 개별 저장
+    for r in results:
+        if r.get("status") in ("failed", "pending"):
+            continue
+        with span("db.save_repo"):
+            await save_repo_result(db, db_user.id, r)
 
-        # 항목별 점수 산출
-        scores = {}
-        for key in KEYWORD_MAP.keys():
-            weight = WEIGHTS.get(key, 1.0)
-            scores[key] = round(total_stats[key] * weight, 1)
+    summary = build_summary(user_name, results)
+    if any(r.get("status") not in ("failed", "pending") for r in results):
+        apply_summary(db_user, summary)
+        db_user.last_analyzed = datetime.now()
+        # 마감 후 도착하는 레포는 finish_pending_repos 에서 저장된 전체 레포로 다시 계산
+        db_user.needs_rescore = False
+    # 마감 전에 끝난 레포가 없으면 기존 페르소나를 빈 요약으로 덮어쓰지 않음 (배치 분석과 동일)
 
-        # 최종 페르소나 결정
-        total_score = sum(scores.values())
-        top_languages = dict(total_languages.most_common(3))
+    with span("db.commit"):
+        await db.commit()
 
-        if total_score < 5:  # 데이터 부족하면 기본
-            persona = "새싹이 돋아나는 땅 (Beginner)"
-        else:
-            # 점수가 가장 높은 카테고리 추출 
-            # 점수가 같을 시 우선순위대로 정렬 (우선순위: Fix > Docs > Test > Refactor > Feat)
-            dominant_trait = max(scores, key=scores.get)
-            persona = PERSONA_NAMES.get(dominant_trait, "평화로운 들판 (Normal)")
+    return {
+        "status": "partial" if pending else "success",
+        "summary": summary,
+        "detailed_results": [{k: v for k, v in r.items() if k not in STORAGE_ONLY_FIELDS} for r in results]
+    }
 
-        await db.commit()
+async def get_stored_analysis(db: AsyncSession, db_user: User):
+    """
+    GitHub 호출 없이 저장된 레포 통계와 언어 집계로 분석 요약을 구성합니다.
+    요약의 모든 항목은 저장된 전체 레포로 다시 계산한 값이며, 마감 후 백그라운드 저장과 같은 기준입니다.
+    (웹훅 등으로 재계산 대상이 된 유저는 스케줄러가 POST /analyze 와 같은 경로로 다시 분석)
+    """
+    result = await db.execute(select(Repository).where(Repository.user_id == db_user.id))
+    repos = result.scalars().all()
+    if not repos:
+        raise HTTPException(status_code=404, detail="분석된 레포지토리가 없습니다.")
 
-        return {
-            "status": "success",
-            "summary": {
-                "username": user_name,
-                "persona": persona,
-                "main_languages": list(top_languages.keys()),
-                "total_score": round(total_score, 1),
-                "commit_stats": dict(total_stats),
-                "weighted_scores": scores
-            },
-            "detailed_results": results
-        }
+    # 페르소나/점수/통계/언어 모두 같은 레포 집합에서 계산 (DB 에는 다시 쓰지 않음)
+    summary = await build_stored_summary(db, db_user, repos)
+    return {
+        "status": "success",
+        "summary": {
+            **summary,
+            "last_analyzed": db_user.last_analyzed,
+            "needs_rescore": db_user.needs_rescore,
+        },
+        "repositories": [
+            {
+                "repo": db_repo.name,
+                "analysis_type": db_repo.analysis_type,
+                "total_commits": db_repo.total_commits,
+                "commit_stats": db_repo.commit_stats,
+                "latest_commit": db_repo.latest_commit,
+                "last_analyzed": db_repo.last_analyzed,
+            }
+            for db_repo in repos
+        ],
+    }
@@ -0,0 +1,112 @@
+import logging
+from typing import Optional
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.models import Repository, RepoLanguage, UserLanguageStat, GlobalLanguageStat
+
+logger = logging.getLogger(__name__)
+
+
+# 집계 행의 유니크 키 (ON CONFLICT 대상)
+_CONFLICT_KEYS = {
+    UserLanguageStat: ["user_id", "language"],
+    GlobalLanguageStat: ["language"],
+}
+
+
+def _dialect_insert(db: AsyncSession):
+    """운영(PostgreSQL)과 로컬/테스트(SQLite) 모두 ON CONFLICT 를 지원하는 insert"""
+    return sqlite_insert if db.get_bind().dialect.name == "sqlite" else pg_insert
+
+
+async def _apply_delta(db: AsyncSession, model, filters: dict, byte_delta: int, repo_delta: int):
+    """
+    집계 행에 증분을 더하고, 행이 없으면 새로 만듭니다.
+    INSERT ... ON CONFLICT DO UPDATE 한 문장으로 처리하므로 같은 새 언어를 동시에 저장해도 충돌하지 않습니다.
+    """
+    statement = _dialect_insert(db)(model).values(**filters, bytes=byte_delta, repo_count=repo_delta)
+    await db.execute(
+        statement.on_conflict_do_update(
+            index_elements=_CONFLICT_KEYS[model],
+            set_={
+                "bytes": model.bytes + statement.excluded.bytes,
+                "repo_count": model.repo_count + statement.excluded.repo_count,
+            },
+        )
+    )
+
+
+async def update_repo_languages(db: AsyncSession, db_repo: Repository, languages: dict):
+    """
+    레포의 언어별 byte 수를 저장하고, 이전 값과의 차이만큼 유저/전체 집계를 갱신합니다.
+    커밋은 호출한 쪽에서 수행합니다.
+    """
+    result = await db.execute(select(RepoLanguage).where(RepoLanguage.repo_id == db_repo.id))
+    existing = {row.language: row for row in result.scalars().all()}
+
+    for language in set(existing) | set(languages):
+        old_row = existing.get(language)
+        old_bytes = old_row.bytes if old_row else 0
+        new_bytes = int(languages.get(language, 0))
+        if old_row and new_bytes == old_bytes:
+            continue
+
+        # 레포 단위 행 갱신
+        if language not in languages:
+            await db.delete(old_row)
+        elif old_row:
+            old_row.bytes = new_bytes
+        else:
+            db.add(RepoLanguage(repo_id=db_repo.id, language=language, bytes=new_bytes))
+
+        # 언어 추가/제거 시에만 repo_count 변화
+        byte_delta = new_bytes - old_bytes
+        repo_delta = (language in languages) - (old_row is not None)
+        await _apply_delta(db, UserLanguageStat, {"user_id": db_repo.user_id, "language": language}, byte_delta, repo_delta)
+        await _apply_delta(db, GlobalLanguageStat, {"language": language}, byte_delta, repo_delta)
+
+
+async def get_user_top_languages(db: AsyncSession, user_id: int, limit: int = 3):
+    statement = (
+        select(UserLanguageStat)
+        .where(UserLanguageStat.user_id == user_id, UserLanguageStat.bytes > 0)
+        .order_by(UserLanguageStat.bytes.desc())
+        .limit(limit)
+    )
+    result = await db.execute(statement)
+    return _with_share(result.scalars().all(), await _user_total_bytes(db, user_id))
+
+
+async def get_global_language_share(db: AsyncSession, limit: Optional[int] = 10):
+    statement = (
+        select(GlobalLanguageStat)
+        .where(GlobalLanguageStat.bytes > 0)
+        .order_by(GlobalLanguageStat.bytes.desc())
+        .limit(limit)
+    )
+    result = await db.execute(statement)
+    total = await db.scalar(select(func.coalesce(func.sum(GlobalLanguageStat.bytes), 0)))
+    return _with_share(result.scalars().all(), total)
+
+
+async def _user_total_bytes(db: AsyncSession, user_id: int) -> int:
+    return await db.scalar(
+        select(func.coalesce(func.sum(UserLanguageStat.bytes), 0)).where(UserLanguageStat.user_id == user_id)
+    )
+
+
+def _with_share(rows, total_bytes: int) -> list[dict]:
+    return [
+        {
+            "language": row.language,
+            "bytes": row.bytes,
+            "repo_count": row.repo_count,
+            "share": round(row.bytes / total_bytes, 4) if total_bytes else 0.0,
+        }
+        for row in rows
+    ]
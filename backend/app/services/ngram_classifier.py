@@ -0,0 +1,273 @@
+import json
+import math
+import random
+import re
+import struct
+import sys
+import zlib
+from array import array
+from typing import Callable, Iterable, Optional
+
+# 이 모듈은 프로세스 풀 워커에서도 import 되므로 표준 라이브러리만으로 동작합니다.
+try:
+    # 선택 의존성: 설치되어 있으면 배치 점수를 희소 행렬 곱으로 계산 (없으면 메시지별로 계산)
+    import numpy as np
+    from scipy import sparse
+except ImportError:
+    np = sparse = None
+
+# 특징 구성이 바뀌면 버전을 올림 (이전 모델 파일은 로드 시 거부되어 키워드 분류기로 대체)
+MAGIC = b"GTRNGM2\n"
+DEFAULT_BITS = 18
+ROW_CACHE_SIZE = 200_000
+# 이 크기 이상의 배치만 scipy 희소 행렬 곱 사용 (작은 배치는 행렬 생성 비용이 더 큼)
+# 메시지별 계산과의 손익분기가 약 30~50개로 측정되어, 레포 한 페이지(COMMIT_WINDOW=50)도 행렬 곱으로 계산되도록 함
+SPARSE_MIN_BATCH = 32
+
+# 영문/숫자 단어, 한글 어절
+_TOKEN = re.compile(r"[a-z0-9]+|[가-힣]+")
+# conventional commit 접두어: "feat:", "fix(api):", "refactor!:"
+_CONVENTIONAL = re.compile(r"^\s*([A-Za-z]+)(?:\([^)]*\))?!?\s*:")
+
+# 접두어 -> 카테고리 (약한 정답 라벨 및 예측 시 규칙으로 사용)
+PREFIX_LABELS = {
+    "feat": "feat", "feature": "feat", "add": "feat",
+    "fix": "fix", "bugfix": "fix", "hotfix": "fix",
+    "docs": "docs", "doc": "docs",
+    "refactor": "refactor", "perf": "refactor", "style": "refactor",
+    "test": "test", "tests": "test",
+    "chore": "chore", "build": "chore", "ci": "chore",
+}
+
+
+def split_prefix(message: str) -> tuple[Optional[str], str]:
+    """커밋 제목(첫 줄)에서 conventional commit 접두어를 분리합니다. 반환값: (카테고리 또는 None, 나머지 제목)"""
+    subject = message.split("\n", 1)[0]
+    match = _CONVENTIONAL.match(subject)
+    if match:
+        return PREFIX_LABELS.get(match.group(1).lower()), subject[match.end():]
+    return None, subject
+
+
+_char_ngram_cache: dict[str, tuple[str, ...]] = {}
+
+
+def char_ngrams(token: str) -> tuple[str, ...]:
+    """단어의 글자 n-gram (영문/숫자는 경계 표시를 붙인 3-gram, 한글 어절은 2-gram). 단어별로 캐시"""
+    grams = _char_ngram_cache.get(token)
+    if grams is None:
+        if len(_char_ngram_cache) >= ROW_CACHE_SIZE:
+            _char_ngram_cache.clear()
+        if token[0] >= "가":
+            # 한글은 어미가 붙으므로("수정했습니다") 글자 bigram으로 어간을 잡음
+            grams = tuple("#" + token[i:i + 2] for i in range(len(token) - 1)) if len(token) > 2 else ()
+        else:
+            # 영문은 활용형/오타("fixes", "refactored", "refactr")를 글자 trigram으로 묶음
+            padded = "<" + token + ">"
+            grams = tuple("#" + padded[i:i + 3] for i in range(len(padded) - 2)) if len(token) > 3 else ()
+        _char_ngram_cache[token] = grams
+    return grams
+
+
+def feature_strings(text: str) -> set[str]:
+    """
+    단어 unigram/bigram과 단어별 글자 n-gram.
+    ("address"와 "add", "prefix"와 "fix"는 단어 특징이 서로 달라 학습된 가중치로 구분됨)
+    """
+    tokens = _TOKEN.findall(text.lower())
+    features = set(tokens)
+    features.update(map(" ".join, zip(["^", *tokens], tokens)))
+    for token in tokens:
+        features.update(char_ngrams(token))
+    return features
+
+
+def hash_feature(feature: str, mask: int) -> int:
+    return zlib.crc32(feature.encode("utf-8")) & mask
+
+
+def extract_features(text: str, mask: int) -> list[int]:
+    """특징 문자열을 crc32로 해싱한 버킷 인덱스 목록 (프로세스/실행과 무관하게 항상 같은 값)"""
+    return [hash_feature(feature, mask) for feature in feature_strings(text)]
+
+
+class _FeatureCache(dict):
+    """특징 문자열 -> 해시 버킷으로 찾은 값 캐시 (없는 키만 해싱하여 채움, 크기 제한 초과 시 비움)"""
+
+    def __init__(self, resolve: Callable[[int], object], mask: int):
+        super().__init__()
+        self.resolve = resolve
+        self.mask = mask
+
+    def __missing__(self, feature: str):
+        if len(self) >= ROW_CACHE_SIZE:
+            self.clear()
+        value = self[feature] = self.resolve(hash_feature(feature, self.mask))
+        return value
+
+
+class HashedNgramClassifier:
+    """
+    해싱된 n-gram 특징에 대한 카테고리별 선형 모델 (one-vs-rest, score > 0 이면 해당).
+    가중치는 학습에서 쓰인 해시 버킷만 {버킷: (카테고리별 가중치)} 로 보관하는 희소 행렬이고,
+    메시지 하나의 점수 계산은 등장한 버킷 행을 열 단위로 합산하는 희소 행렬-벡터 곱,
+    여러 메시지는 (메시지 × 특징) CSR 행렬과 가중치 행렬의 곱입니다. (predict_batch, scipy 설치 시)
+    """
+
+    def __init__(self, categories: list[str], bits: int, weights: dict[int, tuple], bias: list[float]):
+        self.categories = list(categories)
+        self.bits = bits
+        self.mask = (1 << bits) - 1
+        self.weights = weights
+        self.bias = list(bias)
+        # 특징 문자열 -> 가중치 행(없으면 None). 커밋 메시지 어휘는 반복이 많아 해싱을 대부분 건너뜀
+        self._rows = _FeatureCache(weights.get, self.mask)
+        if sparse is not None:
+            # 배치 계산용: 가중치 행렬 W (버킷 수 × 카테고리 수) 와 특징 문자열 -> W 의 행 번호(없으면 -1)
+            buckets = list(weights)
+            positions = {bucket: i for i, bucket in enumerate(buckets)}
+            self._matrix = np.asarray([weights[bucket] for bucket in buckets], dtype=np.float32).reshape(len(buckets), len(self.categories))
+            self._bias = np.asarray(self.bias, dtype=np.float32)
+            self._columns = _FeatureCache(lambda bucket: positions.get(bucket, -1), self.mask)
+
+    def scores(self, text: str) -> list[float]:
+        rows = [row for row in map(self._rows.__getitem__, feature_strings(text)) if row is not None]
+        if not rows:
+            return list(self.bias)
+        return [b + sum(column) for b, column in zip(self.bias, zip(*rows))]
+
+    def predict(self, message: str) -> list[str]:
+        """카테고리 목록 (접두어가 있으면 해당 카테고리는 항상 포함)"""
+        prefix_label, text = split_prefix(message)
+        return [
+            category for category, score in zip(self.categories, self.scores(text))
+            if score > 0 or category == prefix_label
+        ]
+
+    def predict_batch(self, messages: Iterable[str]) -> list[list[str]]:
+        """
+        여러 메시지를 한 번에 분류합니다. 같은 메시지는 한 번만 계산하고,
+        scipy 가 있으면 고유 메시지들을 희소 행렬 곱(X·W + bias)으로 한 번에 계산합니다.
+        """
+        distinct: dict[str, int] = {}
+        order = [distinct.setdefault(message, len(distinct)) for message in messages]
+        unique = list(distinct)
+        if sparse is not None and len(unique) >= SPARSE_MIN_BATCH:
+            labels = self._predict_sparse(unique)
+        else:
+            predict = self.predict
+            labels = [predict(message) for message in unique]
+        return [list(labels[i]) for i in order]
+
+    def _predict_sparse(self, messages: list[str]) -> list[list[str]]:
+        """(메시지 × 특징 버킷) CSR 행렬 X 를 만들어 X·W + bias 로 점수를 계산합니다."""
+        prefixes = []
+        indptr = [0]
+        indices = []
+        column = self._columns.__getitem__
+        for message in messages:
+            prefix_label, text = split_prefix(message)
+            prefixes.append(prefix_label)
+            indices.extend([i for i in map(column, feature_strings(text)) if i >= 0])
+            indptr.append(len(indices))
+
+        x = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.float32), indices, indptr),
+            shape=(len(messages), self._matrix.shape[0]),
+        )
+        scores = (x @ self._matrix + self._bias).tolist()
+        categories = self.categories
+        return [
+            [category for category, score in zip(categories, row) if score > 0 or category == prefix_label]
+            for prefix_label, row in zip(prefixes, scores)
+        ]
+
+    # --- 저장/로드 ---
+    # 형식: MAGIC | 헤더 길이(uint32) | JSON 헤더 | 버킷 인덱스(uint32 x n) | 가중치(int8 x n x 카테고리 수)
+    # 가중치는 최대 절댓값 기준으로 int8 양자화 (버킷당 4 + 카테고리 수 bytes)
+
+    def save(self, path: str):
+        indices = array("I", sorted(self.weights))
+        peak = max((abs(w) for row in self.weights.values() for w in row), default=1.0) or 1.0
+        scale = peak / 127
+        quantized = array("b", (round(w / scale) for index in indices for w in self.weights[index]))
+        if sys.byteorder == "big":
+            indices.byteswap()
+
+        header = json.dumps({
+            "categories": self.categories,
+            "bits": self.bits,
+            "scale": scale,
+            "bias": self.bias,
+            "count": len(indices),
+        }).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(MAGIC)
+            f.write(struct.pack("<I", len(header)))
+            f.write(header)
+            f.write(indices.tobytes())
+            f.write(quantized.tobytes())
+
+    @classmethod
+    def load(cls, path: str) -> "HashedNgramClassifier":
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"Not a commit classifier model: {path}")
+            (header_size,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(header_size))
+            count, width = header["count"], len(header["categories"])
+
+            indices = array("I")
+            indices.frombytes(f.read(count * indices.itemsize))
+            if sys.byteorder == "big":
+                indices.byteswap()
+            quantized = array("b")
+            quantized.frombytes(f.read(count * width))
+
+        scale = header["scale"]
+        weights = {
+            index: tuple(q * scale for q in quantized[i * width:(i + 1) * width])
+            for i, index in enumerate(indices)
+        }
+        return cls(header["categories"], header["bits"], weights, header["bias"])
+
+
+def train(
+    examples: list[tuple[str, set[str]]],
+    categories: list[str],
+    bits: int = DEFAULT_BITS,
+    epochs: int = 5,
+    learning_rate: float = 0.2,
+    l2: float = 1e-6,
+    prune: float = 0.02,
+    seed: int = 0,
+) -> HashedNgramClassifier:
+    """
+    (접두어를 뗀 제목, 정답 카테고리 집합) 목록으로 카테고리별 로지스틱 회귀를 SGD로 학습합니다.
+    학습 후 모든 카테고리 가중치의 절댓값이 prune 미만인 버킷은 버려 모델 크기를 줄입니다.
+    """
+    mask = (1 << bits) - 1
+    width = len(categories)
+    featurized = [(extract_features(text, mask), [1.0 if c in labels else 0.0 for c in categories]) for text, labels in examples]
+    weights: dict[int, list[float]] = {}
+    bias = [0.0] * width
+    rng = random.Random(seed)
+
+    for epoch in range(epochs):
+        rng.shuffle(featurized)
+        rate = learning_rate / (1 + epoch)
+        for features, target in featurized:
+            rows = [weights.setdefault(index, [0.0] * width) for index in features]
+            for k in range(width):
+                score = bias[k] + sum(row[k] for row in rows)
+                score = max(-30.0, min(30.0, score))
+                gradient = 1 / (1 + math.exp(-score)) - target[k]
+                if abs(gradient) < 1e-4:
+                    continue
+                bias[k] -= rate * gradient
+                step = rate * gradient
+                for row in rows:
+                    row[k] -= step + rate * l2 * row[k]
+
+    pruned = {index: tuple(row) for index, row in weights.items() if max(abs(w) for w in row) >= prune}
+    return HashedNgramClassifier(categories, bits, pruned, bias)
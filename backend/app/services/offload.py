@@ -0,0 +1,128 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+from app.core.config import settings
+from app.services.classifier import CommitAuthor, parse_commit_payload as parse_inline, parse_commit_payloads
+from app.services.commit_stream import CommitStreamExtractor
+
+logger = logging.getLogger(__name__)
+
+
+class CommitParseOffloader:
+    """
+    커밋 응답의 JSON 파싱과 키워드 분류를 이벤트 루프 밖에서 수행합니다.
+    - 작은 응답은 스레드 풀, 큰 응답은 프로세스 풀로 보냅니다 (mode=auto).
+    - 프로세스 풀 작업은 짧은 시간 창 동안 모아 한 번에 보내 IPC 비용을 줄입니다.
+    """
+
+    def __init__(
+        self,
+        mode: str = "auto",
+        process_threshold: int = 262144,
+        workers: int = 2,
+        batch_size: int = 8,
+        batch_window: float = 0.005,
+    ):
+        self.mode = mode
+        self.process_threshold = process_threshold
+        self.workers = workers
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+
+        self._thread_pool: Optional[Executor] = None
+        self._process_pool: Optional[Executor] = None
+        self._batch: list[tuple[bytes, Optional[CommitAuthor], asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    def _threads(self) -> Executor:
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="commit-parse")
+        return self._thread_pool
+
+    def _processes(self) -> Executor:
+        if self._process_pool is None:
+            # fork는 실행 중인 이벤트 루프/커넥션 상태를 복제하므로 spawn 사용
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._process_pool
+
+    def _route(self, size: int) -> str:
+        if self.mode != "auto":
+            return self.mode
+        return "process" if size >= self.process_threshold else "thread"
+
+    async def parse(self, raw: bytes, author: Optional[CommitAuthor] = None) -> dict:
+        route = self._route(len(raw))
+        if route == "inline":
+            return parse_inline(raw, author)
+
+        loop = asyncio.get_running_loop()
+        if route == "thread":
+            return await loop.run_in_executor(self._threads(), parse_inline, raw, author)
+
+        future = loop.create_future()
+        self._batch.append((raw, author, future))
+        if len(self._batch) >= self.batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+
+        loop = asyncio.get_running_loop()
+        task = loop.run_in_executor(self._processes(), parse_commit_payloads, [(raw, author) for raw, author, _ in batch])
+        task.add_done_callback(lambda done: self._resolve(batch, done))
+
+    async def feed(self, extractor: CommitStreamExtractor, chunk: bytes):
+        """스트리밍 추출기에 청크를 넣습니다. (추출기 상태는 프로세스로 넘길 수 없으므로 스레드 풀 사용)"""
+        if self.mode == "inline":
+            extractor.feed(chunk)
+            return
+        await asyncio.get_running_loop().run_in_executor(self._threads(), extractor.feed, chunk)
+
+    @staticmethod
+    def _resolve(batch: list[tuple[bytes, Optional[CommitAuthor], asyncio.Future]], done: asyncio.Future):
+        error = done.exception()
+        results = None if error else done.result()
+        for i, (_, _, future) in enumerate(batch):
+            if future.done():
+                continue
+            if error:
+                future.set_exception(error)
+            else:
+                future.set_result(results[i])
+
+    def shutdown(self):
+        for pool in (self._thread_pool, self._process_pool):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        self._thread_pool = None
+        self._process_pool = None
+
+
+commit_parser = CommitParseOffloader(
+    mode=settings.COMMIT_PARSE_EXECUTOR,
+    process_threshold=settings.COMMIT_PARSE_PROCESS_THRESHOLD,
+    workers=settings.COMMIT_PARSE_WORKERS,
+    batch_size=settings.COMMIT_PARSE_BATCH_SIZE,
+    batch_window=settings.COMMIT_PARSE_BATCH_WINDOW_MS / 1000,
+)
+
+
+async def parse_commit_payload(raw: bytes, author: Optional[CommitAuthor] = None) -> dict:
+    return await commit_parser.parse(raw, author)
+
+
+async def feed_commit_stream(extractor: CommitStreamExtractor, chunk: bytes):
+    await commit_parser.feed(extractor, chunk)
@@ -0,0 +1,72 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.models import Repository, RepoCommit
+from app.services.classifier import KEYWORD_MAP
+
+# 분석 시 레포마다 가져오는 최근 커밋 수 = 통계를 계산하는 커밋 창 크기
+COMMIT_WINDOW = 50
+
+
+async def has_commit_window(db: AsyncSession, db_repo: Repository) -> bool:
+    result = await db.execute(select(RepoCommit.id).where(RepoCommit.repo_id == db_repo.id).limit(1))
+    return result.first() is not None
+
+
+async def replace_commit_window(db: AsyncSession, db_repo: Repository, commit_activity: list, commit_shas: list):
+    """분석으로 가져온 최근 커밋으로 커밋 창을 교체합니다. (SHA가 없는 항목은 제외)"""
+    await db.execute(delete(RepoCommit).where(RepoCommit.repo_id == db_repo.id))
+    seen = set()
+    for sha, (committed_at, categories) in zip(commit_shas, commit_activity):
+        if not sha or committed_at is None or sha in seen:
+            continue
+        seen.add(sha)
+        db.add(RepoCommit(repo_id=db_repo.id, sha=sha, committed_at=committed_at, categories=categories))
+
+
+async def add_commits(db: AsyncSession, db_repo: Repository, commits: list[tuple[str, datetime, list[str]]]) -> list[tuple]:
+    """
+    [(SHA, 커밋 시각, 카테고리 목록)] 중 아직 창에 없는 커밋만 추가하고 그 목록을 반환합니다.
+    (웹훅 재전송으로 같은 커밋이 다시 와도 중복 집계하지 않음, 동시 전송은 (repo_id, sha) 유니크 제약이 막음)
+    """
+    result = await db.execute(
+        select(RepoCommit.sha).where(RepoCommit.repo_id == db_repo.id, RepoCommit.sha.in_({sha for sha, _, _ in commits}))
+    )
+    seen = set(result.scalars().all())
+    added = []
+    for sha, committed_at, categories in commits:
+        if sha in seen:
+            continue
+        seen.add(sha)
+        db.add(RepoCommit(repo_id=db_repo.id, sha=sha, committed_at=committed_at, categories=categories))
+        added.append((sha, committed_at, categories))
+    return added
+
+
+async def recount_commit_window(db: AsyncSession, db_repo: Repository, window: Optional[int] = None):
+    """
+    최신 커밋 window 개로 total_commits/commit_stats 를 다시 계산하고, 창 밖으로 밀려난 커밋은 지웁니다.
+    (분석 결과와 같은 기준이므로 웹훅 누적과 재분석 결과가 어긋나지 않음)
+    """
+    await db.flush()
+    result = await db.execute(
+        select(RepoCommit.id, RepoCommit.categories)
+        .where(RepoCommit.repo_id == db_repo.id)
+        .order_by(RepoCommit.committed_at.desc(), RepoCommit.id.desc())
+    )
+    rows = result.all()
+    kept, dropped = rows[:window or COMMIT_WINDOW], rows[window or COMMIT_WINDOW:]
+    if dropped:
+        await db.execute(delete(RepoCommit).where(RepoCommit.id.in_([row_id for row_id, _ in dropped])))
+
+    stats = {key: 0 for key in KEYWORD_MAP.keys()}
+    for _, categories in kept:
+        for category in categories:
+            stats[category] += 1
+    # JSON 컬럼은 새 dict를 할당해야 변경이 감지됨
+    db_repo.commit_stats = stats
+    db_repo.total_commits = len(kept)
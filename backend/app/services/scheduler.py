@@ -0,0 +1,291 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import func, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.core.config import settings
+from app.core.http import rate_limit
+from app.database import async_session
+from app.models import User, Repository
+from app.schemas import AnalyzeRequest
+from app.services.github import analyze_selected_repos, get_top_repo_names
+from app.services.named_users import NAMED_USERS, ensure_named_user, is_named_user
+
+logger = logging.getLogger(__name__)
+
+# 조회 수 × staleness(시간)가 이 값에 도달하면 갱신 (조회 10회면 24시간, 40회 이상이면 min_staleness_hours 마다)
+REFRESH_VIEW_HOURS = 240
+# 네임드 유저는 조회가 없어도 이 값만큼 조회된 것으로 취급
+NAMED_USER_VIEWS = 10
+# 레포 목록 조회 1회 + 레포당 커밋/언어 2회
+REPO_LIST_COST = 1
+PER_REPO_COST = 2
+# 한 주기에 살펴볼 갱신 후보 수 (max_refresh_per_tick 배수, 그 사이 다시 분석된 유저는 건너뛰므로 여유있게)
+CANDIDATE_FACTOR = 4
+
+
+async def record_view(db: AsyncSession, user_id: int):
+    """조회 수를 메모리에 모아두었다가 view_flush_seconds 마다 한 번에 반영합니다. (GET 마다 커밋하지 않음)"""
+    refresh_scheduler.add_view(user_id)
+    if refresh_scheduler.views_due():
+        await refresh_scheduler.flush_views(db)
+
+
+class RefreshScheduler:
+    """
+    조회 빈도 × staleness(마지막 분석 이후 경과 시간)가 REFRESH_VIEW_HOURS 에 도달한 유저 분석을 미리 갱신합니다.
+    갱신 예정 시각은 users.next_refresh_at (인덱스) 에 저장하고 조회 수 반영/갱신 때만 다시 계산하므로
+    주기마다 전체 유저를 훑지 않고 예정 시각이 지난 유저만 오래된 순으로 가져옵니다.
+    GitHub Rate Limit 중 rate_share 비율까지만 사용하여 사용자 요청 몫을 남겨둡니다.
+    """
+
+    def __init__(
+        self,
+        interval: float = 60,
+        rate_share: float = 0.2,
+        min_staleness_hours: float = 6,
+        max_refresh_per_tick: int = 3,
+        view_flush_seconds: float = 30,
+    ):
+        self.interval = interval
+        self.rate_share = rate_share
+        self.min_staleness_hours = min_staleness_hours
+        self.max_refresh_per_tick = max_refresh_per_tick
+        self.view_flush_seconds = view_flush_seconds
+
+        # 이번 주기의 갱신 후보 (예정 시각이 지난 순서) 와 예정 시각이 지난 전체 유저 수
+        self.queue: list[tuple[int, str]] = []
+        self.due_count = 0
+        # 아직 DB에 반영하지 않은 조회 {user_id: (조회 수, 마지막 조회 시각)}
+        self.pending_views: dict[int, tuple[int, datetime]] = {}
+        self._last_view_flush = time.monotonic()
+        self.refreshed = 0
+        self.failed = 0
+        self.skipped_budget = 0
+        self.last_tick: Optional[datetime] = None
+        # 갱신 시점의 staleness (시간) - 갱신 지연 지표
+        self.refresh_lags: deque[float] = deque(maxlen=200)
+        self._task: Optional[asyncio.Task] = None
+        self._seeded = False
+
+    @staticmethod
+    def staleness(db_user: User, now: datetime) -> float:
+        """마지막 분석 이후 경과 시간 (시간 단위)"""
+        if not db_user.last_analyzed:
+            return 0.0
+        return (now - db_user.last_analyzed).total_seconds() / 3600
+
+    def next_refresh_at(self, db_user: User, now: datetime) -> Optional[datetime]:
+        """갱신 예정 시각. 조회된 적 없는 일반 유저는 None (갱신 대상 아님)"""
+        views = db_user.view_count or 0
+        if is_named_user(db_user):
+            views = max(views, NAMED_USER_VIEWS)
+        if views <= 0:
+            return None
+        # 분석된 적 없거나 웹훅으로 통계가 바뀐 유저는 바로 갱신
+        if not db_user.last_analyzed or db_user.needs_rescore:
+            return now
+        hours = max(self.min_staleness_hours, REFRESH_VIEW_HOURS / views)
+        return db_user.last_analyzed + timedelta(hours=hours)
+
+    def add_view(self, user_id: int):
+        count, _ = self.pending_views.get(user_id, (0, None))
+        self.pending_views[user_id] = (count + 1, datetime.now())
+
+    def views_due(self) -> bool:
+        return bool(self.pending_views) and time.monotonic() - self._last_view_flush >= self.view_flush_seconds
+
+    async def flush_views(self, db: AsyncSession):
+        """모아둔 조회 수를 한 트랜잭션으로 반영하고 해당 유저의 갱신 예정 시각을 다시 계산합니다."""
+        self._last_view_flush = time.monotonic()
+        if not self.pending_views:
+            return
+        pending, self.pending_views = self.pending_views, {}
+        try:
+            for user_id, (count, viewed_at) in pending.items():
+                await db.execute(
+                    update(User)
+                    .where(User.id == user_id)
+                    .values(view_count=User.view_count + count, last_viewed=viewed_at)
+                )
+            now = datetime.now()
+            result = await db.execute(
+                select(User).where(User.id.in_(list(pending))).execution_options(populate_existing=True)
+            )
+            for db_user in result.scalars().all():
+                db_user.next_refresh_at = self.next_refresh_at(db_user, now)
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            # 다음 반영 때 다시 시도
+            for user_id, (count, viewed_at) in pending.items():
+                pending_count, _ = self.pending_views.get(user_id, (0, None))
+                self.pending_views[user_id] = (count + pending_count, viewed_at)
+            raise
+
+    async def seed(self, db: AsyncSession):
+        """
+        네임드 유저를 로그인 없이도 갱신 대상이 되도록 등록하고,
+        갱신 예정 시각이 아직 없는 조회된 유저(이 컬럼 추가 전 데이터)의 예정 시각을 채웁니다. (프로세스당 1회)
+        """
+        for username in NAMED_USERS:
+            await ensure_named_user(db, username)
+        now = datetime.now()
+        result = await db.execute(
+            select(User).where(
+                User.next_refresh_at.is_(None),
+                (User.view_count > 0) | User.github_id.startswith("named_") | User.username.in_(NAMED_USERS),
+            )
+        )
+        for db_user in result.scalars().all():
+            db_user.next_refresh_at = self.next_refresh_at(db_user, now)
+        await db.commit()
+
+    async def load_queue(self, db: AsyncSession):
+        """예정 시각이 지난 유저를 오래된 순으로 가져옵니다. (next_refresh_at 인덱스 범위 조회)"""
+        now = datetime.now()
+        due = User.next_refresh_at <= now
+        result = await db.execute(
+            select(User.id, User.username)
+            .where(due)
+            .order_by(User.next_refresh_at, User.id)
+            .limit(self.max_refresh_per_tick * CANDIDATE_FACTOR)
+        )
+        self.queue = [(user_id, username) for user_id, username in result.all()]
+        self.due_count = (await db.execute(select(func.count()).select_from(User).where(due))).scalar_one()
+
+    def has_budget(self, cost: int) -> bool:
+        available = rate_limit.available()
+        if available is None:  # 아직 Rate Limit 정보를 모르면 첫 호출로 확인
+            return True
+        reserve = (rate_limit.limit or 0) * (1 - self.rate_share)
+        return available - cost >= reserve
+
+    async def refresh_user(self, user_id: int, username: str) -> Optional[bool]:
+        """갱신했으면 True, 예산 부족이면 False, 그 사이 다시 분석되어 아직 갱신할 때가 아니면 None"""
+        async with async_session() as db:
+            db_user = await db.get(User, user_id)
+            now = datetime.now()
+            # 예정 시각은 조회 수 반영/갱신 때만 계산하므로, 그 사이 POST /analyze 로 분석된 유저는 여기서 다시 미룸
+            next_refresh_at = self.next_refresh_at(db_user, now) if db_user else None
+            if next_refresh_at is None or next_refresh_at > now:
+                if db_user:
+                    db_user.next_refresh_at = next_refresh_at
+                    await db.commit()
+                return None
+
+            result = await db.execute(select(Repository.name).where(Repository.user_id == user_id))
+            repo_names = list(result.scalars().all())
+
+            cost = PER_REPO_COST * (len(repo_names) or 8) + (0 if repo_names else REPO_LIST_COST)
+            if not self.has_budget(cost):
+                self.skipped_budget += 1
+                return False
+
+            lag = self.staleness(db_user, now)
+            if not repo_names:
+                repo_names = await get_top_repo_names(username)
+            if repo_names:
+                await analyze_selected_repos(AnalyzeRequest(github_username=username, selected_repos=repo_names), db)
+            db_user.next_refresh_at = self.next_refresh_at(db_user, datetime.now())
+            await db.commit()
+            self.refresh_lags.append(lag)
+            return True
+
+    async def postpone(self, user_id: int):
+        """갱신에 실패한 유저는 min_staleness_hours 뒤로 미룸 (매 주기 같은 유저만 재시도하지 않게)"""
+        async with async_session() as db:
+            await db.execute(
+                update(User)
+                .where(User.id == user_id)
+                .values(next_refresh_at=datetime.now() + timedelta(hours=self.min_staleness_hours))
+            )
+            await db.commit()
+
+    async def tick(self):
+        self.last_tick = datetime.now()
+        async with async_session() as db:
+            if not self._seeded:
+                await self.seed(db)
+                self._seeded = True
+            await self.flush_views(db)
+            await self.load_queue(db)
+
+        # GitHub 를 호출한 갱신 시도 수 (실패 포함)
+        attempts = 0
+        while self.queue and attempts < self.max_refresh_per_tick:
+            user_id, username = self.queue.pop(0)
+            try:
+                done = await self.refresh_user(user_id, username)
+            except Exception:
+                attempts += 1
+                self.failed += 1
+                logger.exception(f"Scheduler failed to refresh {username}")
+                await self.postpone(user_id)
+                continue
+            if done is False:
+                break  # 예산 부족 시 다음 주기로
+            if done:
+                attempts += 1
+                self.refreshed += 1
+                logger.info(f"Scheduler refreshed {username}")
+
+    async def _run(self):
+        while True:
+            try:
+                await self.tick()
+            except Exception:
+                logger.exception("Scheduler tick failed")
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        # 아직 반영하지 않은 조회 수 저장
+        try:
+            async with async_session() as db:
+                await self.flush_views(db)
+        except Exception:
+            logger.exception("Failed to flush pending view counts")
+
+    def stats(self) -> dict:
+        lags = sorted(self.refresh_lags)
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "queue_depth": self.due_count,
+            "next_up": [username for _, username in self.queue[:5]],
+            "pending_views": sum(count for count, _ in self.pending_views.values()),
+            "refreshed": self.refreshed,
+            "failed": self.failed,
+            "skipped_budget": self.skipped_budget,
+            "refresh_lag_hours": {
+                "mean": round(sum(lags) / len(lags), 2) if lags else 0.0,
+                "max": round(lags[-1], 2) if lags else 0.0,
+            },
+            "last_tick": self.last_tick,
+            "rate_limit": rate_limit.stats(),
+        }
+
+
+refresh_scheduler = RefreshScheduler(
+    interval=settings.SCHEDULER_INTERVAL_SECONDS,
+    rate_share=settings.SCHEDULER_RATE_SHARE,
+    min_staleness_hours=settings.SCHEDULER_MIN_STALENESS_HOURS,
+    max_refresh_per_tick=settings.SCHEDULER_MAX_REFRESH_PER_TICK,
+    view_flush_seconds=settings.SCHEDULER_VIEW_FLUSH_SECONDS,
+)
@@ -0,0 +1,122 @@
+import hashlib
+import hmac
+import logging
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.models import User, Repository
+from app.services.activity import merge_repo_activity, reset_repo_activity
+from app.services.classifier import CommitAuthor, classify_messages, parse_commit_date
+from app.services.github import classify_repo_type, commit_filter, commit_scope
+from app.services.repo_commits import add_commits, has_commit_window, recount_commit_window, replace_commit_window
+
+logger = logging.getLogger(__name__)
+
+
+def verify_signature(secret: str, body: bytes, signature_header: Optional[str]) -> bool:
+    """X-Hub-Signature-256 헤더(sha256=<hex>)를 웹훅 시크릿으로 검증합니다."""
+    if not secret or not signature_header or not signature_header.startswith("sha256="):
+        return False
+    expected = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature_header.removeprefix("sha256="))
+
+
+async def apply_push_event(payload: dict, db: AsyncSession) -> dict:
+    """
+    push 이벤트의 새 커밋을 분류하여 레포의 최근 커밋 창에 더하고, 창에서 통계를 다시 계산합니다.
+    GitHub API를 호출하지 않으며, 유저의 페르소나는 재계산 대상으로 표시만 합니다.
+    """
+    repository = payload.get("repository") or {}
+    owner = repository.get("owner") or {}
+    owner_login = owner.get("login") or owner.get("name")
+    repo_name = repository.get("name")
+
+    # 분석은 기본 브랜치 기준이므로 다른 브랜치 push는 무시
+    default_branch = repository.get("default_branch")
+    if default_branch and payload.get("ref") != f"refs/heads/{default_branch}":
+        return {"status": "ignored", "reason": "not default branch"}
+
+    statement = (
+        select(Repository, User)
+        .join(User, Repository.user_id == User.id)
+        .where(User.username == owner_login, Repository.name == repo_name)
+    )
+    result = await db.execute(statement)
+    row = result.first()
+    if not row:
+        return {"status": "ignored", "reason": "repository not tracked"}
+    db_repo, db_user = row
+
+    # force push 등으로 이미 다른 브랜치에 있던 커밋(distinct=False)은 중복 집계하지 않음
+    commits = [c for c in payload.get("commits", []) if c.get("distinct", True)]
+    if not commits:
+        return {"status": "ignored", "reason": "no new commits"}
+    # 분석과 같은 작성자 필터로 누적 (author 범위면 공동 작성 커밋 제외, 공유 레포에서 다른 사람의 push는 제외)
+    author_filter = commit_filter(CommitAuthor(db_user.username, db_user.github_id))
+    if author_filter is not None:
+        commits = [
+            c for c in commits
+            if author_filter.matches(
+                (c.get("author") or {}).get("username"), c.get("message", ""), author_email=(c.get("author") or {}).get("email")
+            )
+        ]
+        if not commits:
+            return {"status": "ignored", "reason": "no commits by user"}
+
+    scope = commit_scope()
+    if db_repo.commit_scope != scope:
+        # 다른 범위로 만든 커밋 창/주간 활동에 섞지 않도록 비우고, 통계는 다음 분석(스케줄러)에서 이 범위로 다시 계산
+        await replace_commit_window(db, db_repo, [], [])
+        await reset_repo_activity(db, db_repo)
+        db_repo.commit_scope = scope
+
+    # 커밋 SHA 기준으로 이미 반영된 커밋(웹훅 재전송, 분석으로 이미 가져온 커밋)은 건너뜀
+    commits = [c for c in commits if c.get("id") and c.get("timestamp")]
+    classified = classify_messages([c.get("message", "") for c in commits])
+    entries = [(c["id"], parse_commit_date(c["timestamp"]), categories) for c, categories in zip(commits, classified)]
+    has_window = await has_commit_window(db, db_repo)
+    if has_window:
+        entries = await add_commits(db, db_repo, entries)
+        if not entries:
+            return {"status": "ignored", "reason": "commits already applied"}
+        # 누적하지 않고 분석과 같은 최근 커밋 창에서 다시 계산
+        await recount_commit_window(db, db_repo)
+        db_repo.analysis_type = classify_repo_type({**{"feat": 0, "fix": 0}, **db_repo.commit_stats})
+
+    commit_activity = [(committed_at, categories) for _, committed_at, categories in entries]
+    if commit_activity:
+        latest = max(committed_at for committed_at, _ in commit_activity)
+        if not db_repo.latest_commit or latest > db_repo.latest_commit:
+            db_repo.latest_commit = latest
+        if not db_user.latest_commit or latest > db_user.latest_commit:
+            db_user.latest_commit = latest
+        # 주간 활동은 첫 분석에서 과거 커밋까지 채운 뒤부터 누적 (먼저 채우면 과거 커밋이 누락됨)
+        if db_repo.activity_until is not None:
+            await merge_repo_activity(db, db_repo, commit_activity)
+
+    db_user.needs_rescore = True
+    # 조회된 유저면 다음 스케줄러 주기에 다시 분석
+    if db_user.next_refresh_at is not None:
+        db_user.next_refresh_at = datetime.now()
+    try:
+        await db.commit()
+    except IntegrityError:
+        # 같은 push가 동시에 재전송되어 다른 요청이 먼저 같은 SHA를 저장한 경우
+        await db.rollback()
+        return {"status": "ignored", "reason": "commits already applied"}
+
+    if not has_window:
+        # 커밋 창이 생기기 전(이 기능 이전에 분석된 레포)에는 통계를 건드리지 않고 다음 분석에서 다시 계산
+        logger.info(f"Push webhook for {owner_login}/{repo_name} before commit window exists; stats wait for next analysis")
+    logger.info(f"Push webhook applied: {owner_login}/{repo_name} (+{len(entries)} commits)")
+    return {
+        "status": "success",
+        "repo": repo_name,
+        "applied_commits": len(entries) if has_window else 0,
+        "total_commits": db_repo.total_commits,
+        "commit_stats": db_repo.commit_stats,
+    }
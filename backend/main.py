@@ -1,22 +1,48 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 # from app.services.graph import langgraph_app 제미나이 API 키 있어야함
 from app.routers import repo
 from app.routers import analyze
 from app.routers import auth
+from app.routers import webhook
+from app.routers import languages
+from app.routers import activity
+from app.routers import explore
+from app.routers import admin
 
 from contextlib import asynccontextmanager
 from app.database import init_db
+from app.core.config import settings
+from app.core.http import get_github_client, close_github_client
+from app.core.loop_monitor import loop_monitor
+from app.core.profiling import ProfilingMiddleware
+from app.core.admission import AdmissionMiddleware
+from app.services.offload import commit_parser
+from app.services.scheduler import refresh_scheduler
 import app.models as models # 모델들을 임포트해야 테이블이 생성됩니다.
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 서버 기동 시 DB 테이블 생성
     await init_db()
+    get_github_client()
+    loop_monitor.start()
+    # 인기 유저 분석 미리 갱신
+    if settings.SCHEDULER_ENABLED:
+        refresh_scheduler.start()
     yield
+    await refresh_scheduler.stop()
+    # 커넥션 풀 정리 (record 모드에서는 남은 녹화본 저장)
+    await close_github_client()
+    await loop_monitor.stop()
+    commit_parser.shutdown()
 
 app = FastAPI(title="Giterra Backend", lifespan=lifespan)
 
+# 비싼 엔드포인트 동시 실행 제한/부하 차단 (거절 응답에도 CORS 헤더가 붙도록 CORS 안쪽에 등록)
+app.add_middleware(AdmissionMiddleware)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -26,11 +52,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 응답 압축 (임계값 이상 크기의 응답만 gzip)
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=settings.RESPONSE_COMPRESSION_MIN_SIZE,
+    compresslevel=settings.RESPONSE_COMPRESSION_LEVEL,
+)
+
+# 요청 단위 프로파일링 (관리자 토큰 + X-Profile 헤더 또는 샘플링된 요청만, 그 외에는 통과)
+app.add_middleware(ProfilingMiddleware)
+
 # 분리된 Auth 라우터 등록
 app.include_router(auth.router, prefix="/auth", tags=["Authentication"])
 # app.include_router(langgraph_app, prefix="/langgraph", tags=["Language Graph"])
 app.include_router(repo.router, prefix="/repos", tags=["Repositories"])
 app.include_router(analyze.router, prefix="/analyze", tags=["Analysis"])
+app.include_router(languages.router, prefix="/languages", tags=["Languages"])
+app.include_router(activity.router, prefix="/activity", tags=["Activity"])
+app.include_router(explore.router, prefix="/explore", tags=["Explore"])
+app.include_router(webhook.router, prefix="/webhooks", tags=["Webhooks"])
+app.include_router(admin.router, prefix="/admin", tags=["Admin"])
 
 # API 엔드포인트
 
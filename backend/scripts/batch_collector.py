@@ -10,95 +10,47 @@ if sys.platform == 'win32':
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.database import async_session
-from app.models import User
-from app.services.github import get_user_repositories, analyze_selected_repos
+from app.core.http import github_client_session
+from app.services.batch import analyze_batch
+from app.services.github import get_top_repo_names
+from app.services.named_users import NAMED_USERS, ensure_named_user
 from app.schemas import AnalyzeRequest
-from sqlmodel import select
 
-# 수집 대상 글로벌 & 국내 네임드 개발자 (페르소나별 분류)
-NAMED_USERS = [
-    # 🌲 미래 도시 숲 (Builder): 새로운 기능 창조와 확장에 강점
-    "antfu",          # Vite/Vue Core
-    "sindresorhus",   # Global OSS King
-    "karpathy",       # AI/Deep Learning (LLM implementations)
-    "velopert",       # React Education/Full-stack
-    "jojoldu",        # Java/Backend Tech Blog
-
-    # 🔬 연구소 돔 (Fixer): 시스템 안정성 및 이슈 해결 중심
-    "tiangolo",       # FastAPI (Docker/Environment management focus)
-    "yyx990803",      # Vue.js Creator (Framework maintenance)
-    "godorm",         # Cloud IDE Platform maintenance
-
-    # 📚 지식의 도서관 (Documenter): 기록과 가이드 제작에 특화
-    "jwasham",        # coding-interview-university
-    "donnemartin",    # system-design-primer
-    "kamranahmedse",  # developer-roadmap
-
-    # 🪴 장인의 정원 (Refactorer): 코드 품질 개선 및 설계 최적화
-    "woowacourse",     # 클린 코드 및 리팩토링 미션 중심 (확실한 Refactorer 표본)
-
-    # 🔭 심해의 관측 기지 (Tester): 테스트 코드와 안정성 수호 (신규 후보)
-    "aelassas",       # TDD Guide & Implementation focus
-    "dwyl",           # Learn TDD & Testing methodologies
-    "jeonghwan-kim",  # Frontend Testing (TDD 강의 등 활동)
-    
-    # 🌱 새싹이 돋아나는 땅 (Beginner): 탐험을 시작한 유저 예시
-    "leebyeongmin"    # 데이터 부족 시 Fallback 테스트용
-]
-
-async def collect_user_data(username: str):
+async def select_user_repos(username: str) -> AnalyzeRequest:
+    """DB 유저 등록 후 상위 8개 레포(Stars DESC, UpdatedAt DESC)를 선정합니다."""
     async with async_session() as db:
-        print(f"\n🚀 [{username}] 분석 프로세스 가동 (상위 8개 레포 분석)")
-        
-        try:
-            # 1. DB 유저 등록 체크
-            statement = select(User).where(User.username == username)
-            result = await db.execute(statement)
-            db_user = result.scalars().first()
-            
-            if not db_user:
-                db_user = User(
-                    github_id=f"named_{username}",
-                    username=username,
-                    avatar_url=f"https://github.com/{username}.png",
-                    html_url=f"https://github.com/{username}"
-                )
-                db.add(db_user)
-                await db.commit()
-                await db.refresh(db_user)
-            
-            # 2. 유저 레포지토리 목록 가져오기
-            repos = await get_user_repositories(username)
-            
-            # 정렬 로직: 1순위 Stars DESC, 2순위 UpdatedAt DESC (커밋 수 대용)
-            # GitHub API 목록에서 커밋 수를 바로 주지 않으므로 최신 업데이트를 우선함
-            sorted_repos = sorted(
-                repos, 
-                key=lambda x: (x.stars, x.updated_at), 
-                reverse=True
-            )[:8]  # 상위 8개 선정
-            
-            repo_names = [r.name for r in sorted_repos]
-            print(f"   - 📂 선정된 8개 레포: {repo_names}")
-            
-            # 3. 정교한 분석 실행
-            request = AnalyzeRequest(github_username=username, selected_repos=repo_names)
-            analysis_result = await analyze_selected_repos(request, db)
-            
-            summary = analysis_result["summary"]
-            print(f"   - ✨ 분석 완료! 페르소나: {summary['persona']} (점수: {summary['total_score']})")
-            
-        except Exception as e:
-            print(f"   - ❌ 에러 발생 ({username}): {e}")
+        await ensure_named_user(db, username)
+
+    # GitHub API 목록에서 커밋 수를 바로 주지 않으므로 최신 업데이트를 우선함
+    repo_names = await get_top_repo_names(username, 8)
+    print(f"   - 📂 [{username}] 선정된 레포: {repo_names}")
+    return AnalyzeRequest(github_username=username, selected_repos=repo_names)
 
 async def main():
     print("="*60)
-    print("      Giterra Batch Data Collector v1.1 (Target: 8 Repos)")
+    print("      Giterra Batch Data Collector v1.2 (Target: 8 Repos)")
     print("="*60)
     
-    # 순차적으로 처리 (API Rate Limit 고려)
-    for user in NAMED_USERS:
-        await collect_user_data(user)
+    # GITHUB_TRANSPORT_MODE=record/replay 로 실행하면 GitHub 통신을 녹화/재생
+    async with github_client_session():
+        # 1. 레포 선정 (유저별 목록 조회 1회)
+        entries = []
+        for user in NAMED_USERS:
+            try:
+                entries.append(await select_user_repos(user))
+            except Exception as e:
+                print(f"   - ❌ 에러 발생 ({user}): {e}")
+
+        # 2. 일괄 분석: 레포 조회는 BATCH_ANALYZE_CONCURRENCY 한도로 동시 실행, 분석이 끝난 유저부터 저장
+        print(f"\n🚀 {len(entries)}명 일괄 분석 시작")
+        async for line in analyze_batch(entries):
+            if line["type"] == "done":
+                print(f"\n💾 저장 결과: {line['status']} ({line['saved_users']}명)")
+            elif line["status"] == "failed":
+                print(f"   - ❌ 에러 발생 ({line['username']}): {line['error']}")
+            else:
+                summary = line["summary"]
+                print(f"   - ✨ [{line['username']}] 분석 완료! 페르소나: {summary['persona']} (점수: {summary['total_score']})")
     
     print("\n" + "="*60)
     print("🎉 대량 데이터 수집이 성공적으로 마무리되었습니다.")
@@ -0,0 +1,96 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.classifier import KEYWORD_MAP, keyword_classify, keyword_classify_batch
+from app.services.ngram_classifier import HashedNgramClassifier, sparse, train
+from scripts.train_commit_classifier import read_messages, weak_label
+
+# 키워드 분류기 vs 해싱 n-gram 분류기 처리량(메시지/초) 비교
+# --model 이 없으면 합성 메시지로 즉석 학습한 모델을 사용 (처리량 측정용, 정확도는 train_commit_classifier.py 참고)
+
+SUBJECTS = {
+    "feat": ["add search endpoint", "implement oauth login", "create planet renderer", "여행지 추천 API 추가", "지도 컴포넌트 구현"],
+    "fix": ["resolve pagination bug", "handle null avatar", "patch race in scheduler", "검색 오류 수정", "로그인 버그 해결"],
+    "docs": ["update readme", "document api usage", "add setup guide", "설치 문서 정리", "주석 보강"],
+    "refactor": ["simplify renderer", "clean up services", "extract scoring helper", "구조 개선", "중복 코드 리팩토링"],
+    "test": ["add e2e tests for login", "cover webhook handler", "테스트 추가", "spec for parser"],
+    "chore": ["bump dependencies", "update ci config", "배포 설정 변경", "build script tweak"],
+}
+# 키워드 부분 문자열 매칭이 틀리는 예
+TRICKY = [
+    "address review comments",
+    "prefix routes with /api",
+    "update address book layout",
+    "rename testimonial section",
+    "feat: 접두어 처리 로직 추가",
+]
+
+
+def synthetic_messages(count: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    categories = list(SUBJECTS)
+    messages = []
+    for _ in range(count):
+        category = rng.choice(categories)
+        subject = rng.choice(SUBJECTS[category])
+        # 절반은 conventional commit 접두어 사용
+        messages.append(f"{category}: {subject}" if rng.random() < 0.5 else subject)
+    return messages
+
+
+def throughput(predict, messages: list[str], rounds: int = 3) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for message in messages:
+            predict(message)
+        best = min(best, time.perf_counter() - started)
+    return len(messages) / best
+
+
+def batch_throughput(predict_batch, messages: list[str], batch_size: int, rounds: int = 3) -> float:
+    """레포 커밋 페이지 단위(batch_size개)로 나눠 배치 분류할 때의 처리량"""
+    batches = [messages[i:i + batch_size] for i in range(0, len(messages), batch_size)]
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for batch in batches:
+            predict_batch(batch)
+        best = min(best, time.perf_counter() - started)
+    return len(messages) / best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--input", help="메시지 파일 (없으면 합성 메시지)")
+    parser.add_argument("--model", help="학습된 모델 파일 (없으면 합성 메시지로 즉석 학습)")
+    parser.add_argument("-n", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=50, help="배치 분류 크기 (분석 시 레포당 커밋 수)")
+    args = parser.parse_args()
+
+    messages = read_messages(args.input) if args.input else synthetic_messages(args.n)
+    if args.model:
+        model = HashedNgramClassifier.load(args.model)
+    else:
+        model = train(weak_label(synthetic_messages(5000, seed=1)), list(KEYWORD_MAP.keys()), epochs=3)
+
+    print(f"messages: {len(messages)}, model buckets: {len(model.weights)}, scipy: {sparse is not None}")
+    print("=" * 50)
+    print(f"{'classifier':<14} {'msgs/sec':>14}")
+    print("=" * 50)
+    print(f"{'keyword':<14} {throughput(keyword_classify, messages):>14,.0f}")
+    print(f"{'keyword-batch':<14} {batch_throughput(keyword_classify_batch, messages, args.batch_size):>14,.0f}")
+    print(f"{'ngram':<14} {throughput(model.predict, messages):>14,.0f}")
+    print(f"{'ngram-batch':<14} {batch_throughput(model.predict_batch, messages, args.batch_size):>14,.0f}")
+    print("=" * 50)
+    for message in TRICKY:
+        print(f"{message!r:<36} keyword={keyword_classify(message)} ngram={model.predict(message)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.classifier import classify_commit_messages, classify_message, parse_commit_date, parse_commit_payload
+from app.services.commit_stream import CommitStreamExtractor
+from scripts.bench_loop_lag import build_commit_payload
+
+# 커밋 응답 파싱 방식별 CPU 시간과 최대 메모리 비교
+# - json: 기존 방식 (commit_res.json()으로 전체 객체 생성 후 분류)
+# - orjson: 전체 파싱 (오프로드 워커에서 쓰는 방식)
+# - stream: 바이트 스트림에서 message/date만 추출 (청크 단위로 도착한다고 가정)
+
+CHUNK_SIZE = 8192
+
+
+def parse_json(raw: bytes) -> dict:
+    commits = json.loads(raw)
+    commit_activity = [
+        (parse_commit_date(c['commit']['committer']['date']), classify_message(c['commit']['message']))
+        for c in commits
+    ]
+    return {
+        "total_commits": len(commits),
+        "commit_stats": classify_commit_messages(c['commit']['message'] for c in commits),
+        "latest_commit_date": commit_activity[0][0] if commit_activity else None,
+        "commit_activity": commit_activity,
+        "commit_shas": [c.get('sha') for c in commits],
+    }
+
+
+def parse_stream(chunks: list[bytes]) -> dict:
+    extractor = CommitStreamExtractor()
+    for chunk in chunks:
+        extractor.feed(chunk)
+    return extractor.finish()
+
+
+def measure(fn, arg, rounds: int):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn(arg)
+    elapsed = (time.perf_counter() - start) / rounds * 1000
+
+    tracemalloc.start()
+    fn(arg)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    print("=" * 64)
+    print(f"{'commits':>8} {'method':<8} {'ms/page':>10} {'peak KB':>10} {'payload KB':>12}")
+    print("=" * 64)
+    for count in (30, 50, 100):
+        raw = build_commit_payload(count)
+        chunks = [raw[i:i + CHUNK_SIZE] for i in range(0, len(raw), CHUNK_SIZE)]
+        assert parse_stream(chunks) == parse_commit_payload(raw) == parse_json(raw)
+        for name, fn, arg in (("json", parse_json, raw), ("orjson", parse_commit_payload, raw), ("stream", parse_stream, chunks)):
+            elapsed, peak = measure(fn, arg, rounds=50)
+            print(f"{count:>8} {name:<8} {elapsed:>10.2f} {peak / 1024:>10.1f} {len(raw) / 1024:>12.1f}")
+        print("-" * 64)
+
+
+if __name__ == "__main__":
+    main()
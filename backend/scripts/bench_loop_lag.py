@@ -0,0 +1,84 @@
+import asyncio
+import os
+import sys
+import time
+
+# Windows 호환성 설정
+if sys.platform == 'win32':
+    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import orjson
+
+from app.core.loop_monitor import LoopLagMonitor
+from app.services.offload import CommitParseOffloader
+
+# 커밋 파싱 오프로드 전/후 이벤트 루프 지연 비교
+# 대형 커밋 응답 여러 개를 동시에 파싱하면서 루프 지연(p99/max)을 측정합니다.
+
+MESSAGES = [
+    "feat: 여행지 추천 API 추가",
+    "fix: resolve pagination bug in search",
+    "docs: update README with setup guide",
+    "refactor: simplify planet renderer",
+    "test: add e2e tests for login flow",
+    "chore: bump dependencies",
+]
+
+
+def build_commit_payload(count: int) -> bytes:
+    """GitHub /commits 응답과 같은 구조(작성자, 트리, 검증 정보 포함)의 합성 데이터"""
+    commits = []
+    for i in range(count):
+        person = {"name": f"dev{i % 7}", "email": f"dev{i % 7}@example.com", "date": "2026-01-28T12:00:00Z"}
+        commits.append({
+            "sha": f"{i:040x}",
+            "node_id": f"C_kwDO{i:012d}",
+            "commit": {
+                "author": person,
+                "committer": person,
+                "message": MESSAGES[i % len(MESSAGES)] + "\n\n" + "details " * 40,
+                "tree": {"sha": f"{i:040x}", "url": "https://api.github.com/repos/o/r/git/trees/x"},
+                "url": "https://api.github.com/repos/o/r/git/commits/x",
+                "comment_count": 0,
+                "verification": {"verified": False, "reason": "unsigned", "signature": None, "payload": None},
+            },
+            "url": "https://api.github.com/repos/o/r/commits/x",
+            "html_url": "https://github.com/o/r/commit/x",
+            "author": {"login": f"dev{i % 7}", "id": i, "avatar_url": "https://avatars.githubusercontent.com/u/1"},
+            "committer": {"login": "web-flow", "id": 19864447},
+            "parents": [{"sha": f"{i + 1:040x}", "url": "https://api.github.com/repos/o/r/commits/y"}],
+        })
+    return orjson.dumps(commits)
+
+
+async def run(mode: str, payloads: list[bytes], rounds: int) -> dict:
+    offloader = CommitParseOffloader(mode=mode, process_threshold=0, workers=2)
+    monitor = LoopLagMonitor(interval=0.001, window=100_000)
+    # 프로세스 풀 기동 비용은 측정에서 제외
+    await asyncio.gather(*(offloader.parse(p) for p in payloads[:2]))
+
+    monitor.start()
+    started = time.perf_counter()
+    for _ in range(rounds):
+        await asyncio.gather(*(offloader.parse(p) for p in payloads))
+    elapsed = time.perf_counter() - started
+    await monitor.stop()
+    offloader.shutdown()
+    return {"elapsed_ms": round(elapsed * 1000, 1), **monitor.stats()}
+
+
+async def main():
+    payloads = [build_commit_payload(100) for _ in range(30)]
+    print(f"payload: {len(payloads)} repos x {len(payloads[0]) / 1024:.0f} KB")
+    print("=" * 70)
+    print(f"{'mode':<10} {'elapsed(ms)':>12} {'mean lag':>10} {'p99 lag':>10} {'max lag':>10}")
+    print("=" * 70)
+    for mode in ("inline", "thread", "process"):
+        r = await run(mode, payloads, rounds=5)
+        print(f"{mode:<10} {r['elapsed_ms']:>12} {r['mean_ms']:>10} {r['p99_ms']:>10} {r['max_ms']:>10}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,88 @@
+import gzip
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import orjson
+import ormsgpack
+from fastapi.encoders import jsonable_encoder
+
+from app.core.responses import _default, project_fields
+
+# 분석 응답 직렬화 벤치마크
+# FastAPI 기본 경로(jsonable_encoder + json.dumps) vs orjson vs msgpack 의 인코딩 시간과 payload 크기 비교
+
+CATEGORIES = ["feat", "fix", "docs", "refactor", "test", "chore"]
+LANGUAGES = ["Python", "TypeScript", "JavaScript", "Vue", "Go", "Rust", "Shell", "Dockerfile", "HTML", "CSS"]
+
+
+def build_payload(repo_count: int) -> dict:
+    """analyze_selected_repos 응답과 같은 구조의 합성 데이터"""
+    now = datetime(2026, 1, 28, 12, 0, 0)
+    results = []
+    for i in range(repo_count):
+        results.append({
+            "repo": f"repository-{i}",
+            "total_commits": 50,
+            "commit_stats": {cat: (i * 7 + j) % 20 for j, cat in enumerate(CATEGORIES)},
+            "languages": {lang: (i + 1) * (j + 1) * 1024 for j, lang in enumerate(LANGUAGES[: 3 + i % 7])},
+            "latest_commit_date": now - timedelta(days=i),
+            "status": "success",
+        })
+    return {
+        "status": "success",
+        "summary": {
+            "username": "winter3671",
+            "persona": "연구소 돔 (Fixer)",
+            "main_languages": ["Vue", "Python", "JavaScript"],
+            "total_score": 136.0,
+            "commit_stats": {cat: 10 for cat in CATEGORIES},
+            "weighted_scores": {cat: 40.0 for cat in CATEGORIES},
+        },
+        "detailed_results": results,
+    }
+
+
+def encode_default(payload):
+    return json.dumps(jsonable_encoder(payload), ensure_ascii=False).encode("utf-8")
+
+
+def encode_orjson(payload):
+    return orjson.dumps(payload, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def encode_msgpack(payload):
+    return ormsgpack.packb(payload, default=_default, option=ormsgpack.OPT_NON_STR_KEYS)
+
+
+def measure(fn, payload, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn(payload)
+    return (time.perf_counter() - start) / rounds * 1_000_000  # us/op
+
+
+def main():
+    rounds = 2000
+    encoders = [("fastapi-default", encode_default), ("orjson", encode_orjson), ("msgpack", encode_msgpack)]
+
+    print("=" * 78)
+    print(f"{'repos':>6} {'encoder':<16} {'fields':<10} {'us/op':>10} {'raw(B)':>10} {'gzip(B)':>10}")
+    print("=" * 78)
+    for repo_count in (8, 30, 100):
+        full = build_payload(repo_count)
+        summary_only = project_fields(full, ["status", "summary"])
+        for label, payload in (("all", full), ("summary", summary_only)):
+            for name, fn in encoders:
+                body = fn(payload)
+                elapsed = measure(fn, payload, rounds)
+                print(f"{repo_count:>6} {name:<16} {label:<10} {elapsed:>10.1f} {len(body):>10} {len(gzip.compress(body, 6)):>10}")
+        print("-" * 78)
+
+
+if __name__ == "__main__":
+    main()
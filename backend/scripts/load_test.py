@@ -0,0 +1,78 @@
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+# Windows 호환성 설정
+if sys.platform == 'win32':
+    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+import httpx
+
+# 로컬 서버 부하 테스트
+# 서버를 GITHUB_TRANSPORT_MODE=replay 로 띄우면 녹화된 GitHub 응답으로 오프라인 테스트가 가능합니다.
+# 사용 예: uv run python scripts/load_test.py --username winter3671 --repos TakeMeTrip -c 20 -n 200
+
+
+async def worker(client: httpx.AsyncClient, args, queue: asyncio.Queue, latencies: list, errors: list):
+    while True:
+        try:
+            queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        started = time.perf_counter()
+        try:
+            if args.endpoint == "analyze":
+                res = await client.post(
+                    f"{args.url}/analyze/",
+                    params={"fields": "status,summary"},
+                    json={"github_username": args.username, "selected_repos": args.repos},
+                )
+            else:
+                res = await client.get(f"{args.url}/repos/{args.username}")
+            if res.status_code != 200:
+                errors.append(res.status_code)
+        except httpx.HTTPError as e:
+            errors.append(type(e).__name__)
+        latencies.append(time.perf_counter() - started)
+
+
+def percentile(values: list, p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Giterra backend load test")
+    parser.add_argument("--url", default=os.getenv("GITERRA_URL", "http://localhost:8000"))
+    parser.add_argument("--endpoint", choices=["analyze", "repos"], default="analyze")
+    parser.add_argument("--username", required=True)
+    parser.add_argument("--repos", nargs="*", default=[])
+    parser.add_argument("-c", "--concurrency", type=int, default=10)
+    parser.add_argument("-n", "--requests", type=int, default=100)
+    args = parser.parse_args()
+
+    queue = asyncio.Queue()
+    for i in range(args.requests):
+        queue.put_nowait(i)
+
+    latencies, errors = [], []
+    started = time.perf_counter()
+    async with httpx.AsyncClient(timeout=120) as client:
+        await asyncio.gather(*(worker(client, args, queue, latencies, errors) for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+
+    print("=" * 50)
+    print(f" {args.endpoint} x {args.requests} (concurrency {args.concurrency})")
+    print("=" * 50)
+    print(f" throughput : {len(latencies) / elapsed:.1f} req/s")
+    print(f" mean       : {statistics.mean(latencies) * 1000:.1f} ms")
+    for p in (0.5, 0.95, 0.99):
+        print(f" p{int(p * 100):<10}: {percentile(latencies, p) * 1000:.1f} ms")
+    print(f" errors     : {len(errors)} {sorted(set(map(str, errors)))}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,47 @@
+import argparse
+import hashlib
+import hmac
+import os
+import sys
+import uuid
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from app.core.config import settings
+
+# 녹화된 웹훅 페이로드를 로컬 서버로 서명하여 전송합니다.
+# 사용 예: uv run python scripts/replay_webhook.py data/webhooks/push_sample.json
+
+DEFAULT_URL = "http://localhost:8000/webhooks/github"
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded GitHub webhook payload")
+    parser.add_argument("payload", help="녹화된 페이로드 JSON 파일 경로")
+    parser.add_argument("--url", default=DEFAULT_URL)
+    parser.add_argument("--event", default="push")
+    parser.add_argument("--secret", default=settings.GITHUB_WEBHOOK_SECRET)
+    args = parser.parse_args()
+
+    if not args.secret:
+        print("❌ GITHUB_WEBHOOK_SECRET이 설정되지 않았습니다. (--secret 으로 지정 가능)")
+        sys.exit(1)
+
+    with open(args.payload, "rb") as f:
+        body = f.read()
+
+    signature = hmac.new(args.secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    res = httpx.post(
+        args.url,
+        content=body,
+        headers={
+            "Content-Type": "application/json",
+            "X-GitHub-Event": args.event,
+            "X-GitHub-Delivery": str(uuid.uuid4()),
+            "X-Hub-Signature-256": f"sha256={signature}",
+        },
+    )
+    print(f"[{res.status_code}] {res.text}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+import argparse
+import asyncio
+import os
+import random
+import sys
+from pathlib import Path
+
+# Windows 호환성 설정
+if sys.platform == 'win32':
+    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import orjson
+
+from app.core.config import settings
+from app.services.classifier import KEYWORD_MAP, keyword_classify
+from app.services.ngram_classifier import DEFAULT_BITS, split_prefix, train
+
+# 해싱 n-gram 커밋 분류기 학습
+# - 저장된 레포들의 커밋 메시지를 공유 GitHub 클라이언트로 수집 (GITHUB_TRANSPORT_MODE=replay 로 오프라인 재현 가능)
+#   또는 --input 으로 메시지 파일(JSONL: 문자열 또는 {"message": ...}, 혹은 한 줄에 하나) 사용
+# - conventional commit 접두어(feat:, fix: ...)를 약한 정답 라벨로 쓰고, 접두어를 뗀 제목으로 학습
+#   (접두어가 없는 커밋도 내용만으로 분류할 수 있도록)
+
+
+async def fetch_messages(pages: int, concurrency: int) -> list[str]:
+    # --input 만 쓰는 경우(벤치마크 등)에는 DB 설정 없이도 동작하도록 여기서 import
+    from sqlmodel import select
+    from app.core.http import github_client_session
+    from app.database import async_session
+    from app.models import User, Repository
+
+    async with async_session() as db:
+        result = await db.execute(select(User.username, Repository.name).join(Repository, Repository.user_id == User.id))
+        targets = result.all()
+    print(f"📂 {len(targets)}개 레포에서 커밋 메시지 수집 (레포당 최대 {pages * 100}개)")
+
+    semaphore = asyncio.Semaphore(concurrency)
+    async with github_client_session() as client:
+        async def fetch(username: str, repo: str) -> list[str]:
+            messages = []
+            async with semaphore:
+                for page in range(1, pages + 1):
+                    url = f"https://api.github.com/repos/{username}/{repo}/commits?per_page=100&page={page}"
+                    res = await client.get(url, headers=settings.GITHUB_HEADERS)
+                    if res.status_code != 200:
+                        break
+                    commits = res.json()
+                    messages.extend(c["commit"]["message"] for c in commits)
+                    if len(commits) < 100:
+                        break
+            return messages
+
+        results = await asyncio.gather(*(fetch(username, repo) for username, repo in targets), return_exceptions=True)
+    return [message for r in results if isinstance(r, list) for message in r]
+
+
+def read_messages(path: str) -> list[str]:
+    messages = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                value = orjson.loads(line)
+                messages.append(value["message"] if isinstance(value, dict) else str(value))
+            except orjson.JSONDecodeError:
+                messages.append(line)
+    return messages
+
+
+def weak_label(messages: list[str]) -> list[tuple[str, set[str]]]:
+    examples = []
+    for message in messages:
+        label, text = split_prefix(message)
+        if label and text.strip():
+            examples.append((text, {label}))
+    return examples
+
+
+def evaluate(name: str, predict, holdout: list[tuple[str, set[str]]], categories: list[str]):
+    tp = fp = fn = 0
+    per_category = {c: [0, 0, 0] for c in categories}
+    for text, labels in holdout:
+        predicted = set(predict(text))
+        for c in categories:
+            stat = per_category[c]
+            if c in predicted and c in labels:
+                stat[0] += 1
+            elif c in predicted:
+                stat[1] += 1
+            elif c in labels:
+                stat[2] += 1
+    for c, (c_tp, c_fp, c_fn) in per_category.items():
+        tp, fp, fn = tp + c_tp, fp + c_fp, fn + c_fn
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    print(f"{name:<10} precision {precision:.3f}  recall {recall:.3f}  f1 {f1:.3f}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="해싱 n-gram 커밋 분류기 학습")
+    parser.add_argument("--input", help="메시지 파일 (없으면 DB의 레포에서 GitHub로 수집)")
+    parser.add_argument("--dump", help="수집한 메시지를 JSONL로 저장 (재학습용)")
+    parser.add_argument("--output", default=settings.COMMIT_CLASSIFIER_MODEL)
+    parser.add_argument("--pages", type=int, default=3, help="레포당 커밋 페이지 수 (100개/페이지)")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--bits", type=int, default=DEFAULT_BITS)
+    parser.add_argument("--epochs", type=int, default=5)
+    args = parser.parse_args()
+
+    messages = read_messages(args.input) if args.input else await fetch_messages(args.pages, args.concurrency)
+    if args.dump:
+        with open(args.dump, "wb") as f:
+            f.writelines(orjson.dumps(message) + b"\n" for message in messages)
+
+    examples = weak_label(messages)
+    print(f"📝 메시지 {len(messages)}개 중 접두어 라벨 {len(examples)}개")
+    if len(examples) < 50:
+        print("❌ 학습 데이터가 부족합니다.")
+        return
+
+    random.Random(0).shuffle(examples)
+    split = int(len(examples) * 0.9)
+    categories = list(KEYWORD_MAP.keys())
+    model = train(examples[:split], categories, bits=args.bits, epochs=args.epochs)
+
+    # 접두어를 뗀 내용만으로 비교
+    holdout = examples[split:]
+    print("=" * 60)
+    evaluate("keyword", keyword_classify, holdout, categories)
+    evaluate("ngram", lambda text: [c for c, s in zip(model.categories, model.scores(text)) if s > 0], holdout, categories)
+
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    model.save(args.output)
+    print(f"💾 {args.output} ({len(model.weights)} buckets, {os.path.getsize(args.output) / 1024:.1f} KB)")
+    print("   COMMIT_CLASSIFIER=ngram 으로 서버를 실행하면 적용됩니다.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,7 +1,7 @@
+import argparse
 import asyncio
 import sys
 import os
-from sqlalchemy import text
 
 # Windows 호환성 설정
 if sys.platform == 'win32':
@@ -10,30 +10,38 @@ if sys.platform == 'win32':
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.database import async_session
+from app.models import User
+from app.services.explore import explore_filters, stream_users_with_repos
+from app.services.named_users import NAMED_USERS
+
+async def view_collected_data(args):
+    # 탐색 API와 같은 필터 조건 (--all 이 아니면 네임드 유저만)
+    filters = []
+    if args.persona or args.language or args.active_within_days:
+        filters = explore_filters(args.persona, args.language, args.active_within_days)
+    if not args.all:
+        filters.append(User.github_id.startswith("named_") | User.username.in_(NAMED_USERS))
 
-async def view_collected_data():
     async with async_session() as session:
-        print("\n=== 👥 수집된 네임드 유저 요약 ===")
-        user_query = text("SELECT username, id FROM users WHERE github_id LIKE 'named_%' OR username IN ('tiangolo', 'yyx990803', 'antfu', 'sindresorhus', 'karpathy', 'tj', 'gaearon', 'defunkt', 'mojombo', 'kennethreitz')")
-        users = await session.execute(user_query)
-        
-        for user in users:
-            print(f"\n👤 유저: {user.username} (ID: {user.id})")
-            
-            # 해당 유저의 분석된 레포지토리 가져오기
-            repo_query = text("SELECT name, analysis_type, latest_commit FROM repositories WHERE user_id = :user_id")
-            repos = await session.execute(repo_query, {"user_id": user.id})
+        print("\n=== 👥 수집된 네임드 유저 요약 ===" if not args.all else "\n=== 👥 수집된 유저 요약 ===")
+        # 유저별로 레포를 다시 조회하지 않고 JOIN 한 번을 서버 측 커서로 스트리밍
+        async for user, repos in stream_users_with_repos(session, filters):
+            print(f"\n👤 유저: {user['username']} (ID: {user['id']}) - {user['persona'] or '미분석'} (점수: {user['persona_score']})")
             
-            repo_list = repos.all()
-            if not repo_list:
+            if not repos:
                 print("   - 분석된 레포지토리 없음")
                 continue
                 
-            for repo in repo_list:
-                print(f"   🪐 [{repo.analysis_type:10}] {repo.name} (최신커밋: {repo.latest_commit})")
+            for repo in repos:
+                print(f"   🪐 [{repo['analysis_type'] or '-':10}] {repo['name']} (최신커밋: {repo['latest_commit']})")
 
 async def main():
-    await view_collected_data()
+    parser = argparse.ArgumentParser(description="수집된 유저/레포 데이터 조회")
+    parser.add_argument("--all", action="store_true", help="네임드 유저뿐 아니라 전체 유저 출력")
+    parser.add_argument("--persona", help="페르소나 필터 (예: Fixer)")
+    parser.add_argument("--language", help="대표 언어 필터 (예: Python)")
+    parser.add_argument("--active-within-days", type=int, help="최근 N일 안에 커밋한 유저만")
+    await view_collected_data(parser.parse_args())
     print("\n" + "="*50)
 
 if __name__ == "__main__":
@@ -0,0 +1,34 @@
+import asyncio
+import logging
+import os
+import tempfile
+
+import pytest
+
+# 테스트는 임시 SQLite DB 를 사용 (app 모듈 import 전에 설정)
+_DB_PATH = os.path.join(tempfile.mkdtemp(), "test.db")
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{_DB_PATH}")
+
+
+@pytest.fixture
+def run_db():
+    """빈 DB 를 만든 뒤 코루틴을 실행합니다. (테스트마다 이벤트 루프가 달라 끝나면 커넥션 풀을 비움)"""
+    from sqlmodel import SQLModel
+    from app.database import engine, init_db
+
+    engine.echo = False
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+
+    def run(coro):
+        async def main():
+            async with engine.begin() as conn:
+                await conn.run_sync(SQLModel.metadata.drop_all)
+            await init_db()
+            try:
+                return await coro
+            finally:
+                await engine.dispose()
+
+        return asyncio.run(main())
+
+    return run
@@ -0,0 +1,128 @@
+import asyncio
+
+from app.database import async_session
+from app.models import User
+from app.schemas import AnalyzeRequest
+from app.services import github
+from app.services.classifier import KEYWORD_MAP
+
+
+def _result(repo: str, counts: dict, languages: dict) -> dict:
+    stats = {key: counts.get(key, 0) for key in KEYWORD_MAP.keys()}
+    return {
+        "repo": repo,
+        "status": "success",
+        "type": "Commit Analysis",
+        "total_commits": sum(stats.values()),
+        "commit_stats": stats,
+        "languages": languages,
+        "latest_commit_date": None,
+        "commit_activity": [],
+        "commit_shas": [],
+    }
+
+
+def _fake_details(delays: dict, results: dict):
+    async def analyze_repo_details(client, user, repo, author=None):
+        await asyncio.sleep(delays[repo])
+        return results[repo]
+    return analyze_repo_details
+
+
+async def _seed_user() -> int:
+    async with async_session() as db:
+        db_user = User(github_id="1", username="octocat", persona="Existing", persona_score=42.0)
+        db.add(db_user)
+        await db.commit()
+        return db_user.id
+
+
+async def _load_user(user_id: int) -> User:
+    async with async_session() as db:
+        return await db.get(User, user_id)
+
+
+def test_nothing_completed_keeps_previous_summary_then_background_applies(run_db, monkeypatch):
+    results = {"slow": _result("slow", {"fix": 10}, {"Python": 100})}
+    monkeypatch.setattr(github, "analyze_repo_details", _fake_details({"slow": 0.2}, results))
+    monkeypatch.setattr(github.settings, "ANALYZE_DEADLINE_SECONDS", 0.01)
+
+    async def scenario():
+        user_id = await _seed_user()
+        async with async_session() as db:
+            response = await github.analyze_selected_repos(AnalyzeRequest(github_username="octocat", selected_repos=["slow"]), db)
+        assert response["status"] == "partial"
+
+        db_user = await _load_user(user_id)
+        assert (db_user.persona, db_user.persona_score, db_user.last_analyzed) == ("Existing", 42.0, None)
+
+        await asyncio.gather(*github._background_tasks)
+        return await _load_user(user_id)
+
+    db_user = run_db(scenario())
+    expected = github.score_persona(github.Counter({"fix": 10}), github.Counter({"Python": 100}))
+    assert db_user.persona == expected["persona"]
+    assert db_user.persona_score == expected["total_score"]
+    assert db_user.top_language == "Python"
+    assert db_user.last_analyzed is not None
+    assert db_user.needs_rescore is False
+
+
+def test_background_summary_includes_repos_saved_before_deadline(run_db, monkeypatch):
+    results = {
+        "fast": _result("fast", {"feat": 3}, {"Go": 10}),
+        "slow": _result("slow", {"fix": 10}, {"Python": 100}),
+    }
+    monkeypatch.setattr(github, "analyze_repo_details", _fake_details({"fast": 0, "slow": 0.2}, results))
+    monkeypatch.setattr(github.settings, "ANALYZE_DEADLINE_SECONDS", 0.1)
+
+    async def scenario():
+        user_id = await _seed_user()
+        async with async_session() as db:
+            response = await github.analyze_selected_repos(AnalyzeRequest(github_username="octocat", selected_repos=["fast", "slow"]), db)
+        assert response["summary"]["pending_repos"] == ["slow"]
+        assert (await _load_user(user_id)).top_language == "Go"
+
+        await asyncio.gather(*github._background_tasks)
+        return await _load_user(user_id)
+
+    db_user = run_db(scenario())
+    expected = github.score_persona(github.Counter({"feat": 3, "fix": 10}), github.Counter({"Python": 100, "Go": 10}))
+    assert db_user.persona == expected["persona"]
+    assert db_user.persona_score == expected["total_score"]
+    assert db_user.top_language == "Python"
+
+
+def test_stored_analysis_derives_every_field_from_stored_repos(run_db, monkeypatch):
+    results = {
+        "a": _result("a", {"feat": 3}, {"Go": 10}),
+        "b": _result("b", {"docs": 4}, {"Python": 100}),
+    }
+    monkeypatch.setattr(github, "analyze_repo_details", _fake_details({"a": 0, "b": 0}, results))
+
+    async def scenario():
+        user_id = await _seed_user()
+        async with async_session() as db:
+            await github.analyze_selected_repos(AnalyzeRequest(github_username="octocat", selected_repos=["a", "b"]), db)
+        async with async_session() as db:
+            db_user = await db.get(User, user_id)
+            # 웹훅 등으로 레포 통계만 바뀌고 페르소나는 아직 재계산 전인 상태
+            db_user.needs_rescore = True
+            (await db.execute(github.select(github.Repository).where(github.Repository.name == "a"))).scalars().one().commit_stats = {
+                key: (20 if key == "test" else 0) for key in KEYWORD_MAP.keys()
+            }
+            await db.commit()
+        async with async_session() as db:
+            db_user = await db.get(User, user_id)
+            return await github.get_stored_analysis(db, db_user), db_user.persona
+
+    analysis, stored_persona = run_db(scenario())
+    summary = analysis["summary"]
+    expected = github.score_persona(github.Counter({"test": 20, "docs": 4}), github.Counter({"Python": 100, "Go": 10}))
+    assert stored_persona != expected["persona"]
+    assert summary["persona"] == expected["persona"]
+    assert summary["total_score"] == expected["total_score"]
+    assert summary["weighted_scores"] == expected["weighted_scores"]
+    assert summary["main_languages"] == ["Python", "Go"]
+    assert summary["commit_stats"]["test"] == 20
+    assert summary["needs_rescore"] is True
@@ -0,0 +1,22 @@
+from app.services.classifier import CommitAuthor
+
+
+def test_is_author_matches_id_after_login_change():
+    author = CommitAuthor("new-login", "80721245", include_coauthors=False)
+    assert author.is_author("old-login", 80721245)
+    assert not author.is_author("someone-else", 999)
+
+
+def test_is_author_falls_back_to_login_when_stored_id_is_wrong():
+    # 시드 데이터처럼 저장된 github_id 가 실제 계정 ID와 다른 경우
+    author = CommitAuthor("winter3671", "12345678", include_coauthors=False)
+    assert author.is_author("winter3671", 98765432)
+    assert author.is_author("Winter3671", 98765432)
+    assert author.matches("winter3671", "feat: add planet", 98765432)
+    assert not author.matches("someone-else", "feat: add planet", 98765432)
+
+
+def test_is_author_uses_noreply_email_without_account():
+    author = CommitAuthor("octocat", "583231")
+    assert author.is_author(None, None, "583231+octocat@users.noreply.github.com")
+    assert not author.is_author(None, None, "octocat@example.com")
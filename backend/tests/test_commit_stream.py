@@ -0,0 +1,50 @@
+import orjson
+import pytest
+
+from app.services.classifier import CommitAuthor, parse_commit_payload
+from app.services.commit_stream import CommitStreamExtractor
+
+
+def _commit(sha: str, message: str, date: str, name: str, email: str, login: str = "octocat", user_id: int = 1):
+    """GitHub /commits 응답 항목과 같은 키 순서의 커밋"""
+    person = {"name": name, "email": email, "date": date}
+    return {
+        "sha": sha,
+        "node_id": "C_" + sha,
+        "commit": {
+            "author": person,
+            "committer": person,
+            "message": message,
+            "tree": {"sha": "f" * 40, "url": "https://api.github.com/tree"},
+            "url": "https://api.github.com/commit",
+            "comment_count": 0,
+        },
+        "url": "https://api.github.com/commits/" + sha,
+        "author": {"login": login, "id": user_id, "type": "User"},
+        "committer": {"login": login, "id": user_id, "type": "User"},
+        "parents": [{"sha": "e" * 40, "url": "https://api.github.com/parent"}],
+    }
+
+
+PAYLOAD = orjson.dumps([
+    _commit("a" * 40, "fix: crash on {empty} input", "2024-03-02T10:00:00Z", "Brace {Dev}", "dev}{@example.com"),
+    _commit("b" * 40, "feat: add \"date\": parser", "2024-03-01T09:00:00Z", "}{", "{}@x.io", login="other", user_id=2),
+    _commit("c" * 40, "docs: readme", "2024-02-28T08:00:00Z", "Plain Name", "plain@example.com"),
+])
+
+
+def _stream(author, chunk_size: int) -> dict:
+    extractor = CommitStreamExtractor(author)
+    for start in range(0, len(PAYLOAD), chunk_size):
+        extractor.feed(PAYLOAD[start:start + chunk_size])
+    return extractor.finish()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, len(PAYLOAD)])
+@pytest.mark.parametrize("author", [None, CommitAuthor("octocat", "1", False)])
+def test_stream_matches_full_parse_with_braces_in_committer(chunk_size, author):
+    expected = parse_commit_payload(PAYLOAD, author)
+    result = _stream(author, chunk_size)
+
+    assert result == expected
+    assert result["latest_commit_date"] == expected["commit_activity"][0][0]
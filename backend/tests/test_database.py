@@ -0,0 +1,41 @@
+from sqlalchemy import create_engine, inspect, text
+from sqlmodel import SQLModel
+
+from app.database import upgrade_schema
+
+# 컬럼 추가 전 배포본의 테이블 구조
+_LEGACY_TABLES = [
+    """CREATE TABLE users (
+        id INTEGER PRIMARY KEY, github_id VARCHAR NOT NULL UNIQUE, username VARCHAR NOT NULL,
+        avatar_url VARCHAR, html_url VARCHAR, access_token VARCHAR
+    )""",
+    """CREATE TABLE repositories (
+        id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL REFERENCES users (id), name VARCHAR NOT NULL,
+        analysis_type VARCHAR, analysis_summary VARCHAR, analysis_sub1 VARCHAR, analysis_sub2 VARCHAR,
+        analysis_sub3 VARCHAR, last_analyzed DATETIME, latest_commit DATETIME
+    )""",
+    "INSERT INTO users (github_id, username) VALUES ('1', 'octocat')",
+    "INSERT INTO repositories (user_id, name) VALUES (1, 'hello')",
+]
+
+
+def test_upgrade_schema_adds_missing_columns_and_indexes():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        for statement in _LEGACY_TABLES:
+            conn.execute(text(statement))
+        SQLModel.metadata.create_all(conn)
+        upgrade_schema(conn)
+        upgrade_schema(conn)  # 다시 실행해도 그대로
+
+        inspector = inspect(conn)
+        for table in ("users", "repositories"):
+            columns = {column["name"] for column in inspector.get_columns(table)}
+            assert columns == set(SQLModel.metadata.tables[table].columns.keys())
+        indexes = {index["name"] for index in inspector.get_indexes("users")}
+        assert {"ix_users_next_refresh_at", "ix_users_explore_score", "ix_users_explore_persona", "ix_users_explore_language"} <= indexes
+
+        # NOT NULL 컬럼은 모델 기본값으로 기존 행을 채움
+        row = conn.execute(text("SELECT needs_rescore, persona_score, view_count FROM users")).one()
+        assert tuple(row) == (0, 0.0, 0)
+        assert conn.execute(text("SELECT total_commits FROM repositories")).scalar() == 0
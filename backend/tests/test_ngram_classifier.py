@@ -0,0 +1,25 @@
+import pytest
+
+from app.services import ngram_classifier
+from app.services.classifier import KEYWORD_MAP
+from scripts.bench_classifier import synthetic_messages
+from scripts.train_commit_classifier import weak_label
+
+
+@pytest.fixture(scope="module")
+def model(tmp_path_factory):
+    path = tmp_path_factory.mktemp("model") / "commit_ngram.bin"
+    ngram_classifier.train(weak_label(synthetic_messages(2000, seed=1)), list(KEYWORD_MAP), epochs=2).save(str(path))
+    return ngram_classifier.HashedNgramClassifier.load(str(path))
+
+
+@pytest.mark.parametrize("size", [ngram_classifier.SPARSE_MIN_BATCH - 1, 50, 600])
+def test_predict_batch_matches_predict(model, size):
+    messages = synthetic_messages(size, seed=3) + ["fix: 검색 오류 수정 #12", "refactored the parser"]
+    assert model.predict_batch(messages) == [model.predict(message) for message in messages]
+
+
+def test_sparse_scores_match_predict(model):
+    pytest.importorskip("scipy")
+    messages = list(dict.fromkeys(synthetic_messages(300, seed=5)))
+    assert model._predict_sparse(messages) == [model.predict(message) for message in messages]
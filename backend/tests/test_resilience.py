@@ -0,0 +1,59 @@
+import asyncio
+
+import httpx
+
+from app.core.resilience import hedged_stream
+
+
+class _Stream(httpx.AsyncByteStream):
+    def __init__(self, body: bytes, closed: list):
+        self.body = body
+        self.closed = closed
+
+    async def __aiter__(self):
+        yield self.body
+
+    async def aclose(self):
+        self.closed.append(self.body)
+
+
+class _DelayTransport(httpx.AsyncBaseTransport):
+    """n번째 요청을 delays[n] 초 뒤에 응답"""
+
+    def __init__(self, delays: list[float]):
+        self.delays = delays
+        self.calls = 0
+        self.closed = []
+
+    async def handle_async_request(self, request):
+        index = self.calls
+        self.calls += 1
+        await asyncio.sleep(self.delays[index])
+        return httpx.Response(200, stream=_Stream(f"body{index}".encode(), self.closed))
+
+
+async def _read(delays: list[float], hedge_delay: float):
+    transport = _DelayTransport(delays)
+    async with httpx.AsyncClient(transport=transport) as client:
+        response = await hedged_stream(client, "https://api.github.com/x", hedge_delay)
+        body = await response.aread()
+        await response.aclose()
+    return body, transport
+
+
+def test_hedged_stream_fast_primary_is_readable():
+    body, transport = asyncio.run(_read([0.0], hedge_delay=0.2))
+    assert body == b"body0"
+    assert transport.calls == 1
+
+
+def test_hedged_stream_uses_hedge_and_closes_slow_primary():
+    body, transport = asyncio.run(_read([0.5, 0.0], hedge_delay=0.05))
+    assert body == b"body1"
+    assert transport.calls == 2
+
+
+def test_hedged_stream_without_delay_sends_once():
+    body, transport = asyncio.run(_read([0.0], hedge_delay=0))
+    assert body == b"body0"
+    assert transport.calls == 1